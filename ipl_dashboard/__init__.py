@@ -0,0 +1 @@
+"""Data and analysis helpers for the IPL Streamlit dashboard."""
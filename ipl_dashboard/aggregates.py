@@ -0,0 +1,358 @@
+"""Season level team and player aggregates derived from match and ball data."""
+import numpy as np
+import pandas as pd
+
+from .teams import TEAM_CODES, TEAM_COLORS, BANNED_TEAMS, WINNERS_BY_YEAR
+
+# Dismissals that are not credited to the bowler
+NON_BOWLER_DISMISSALS = ['run out', 'retired hurt', 'retired out', 'obstructing the field']
+# Wicket rows that don't end the batter's innings as a dismissal
+NOT_OUT_DISMISSALS = ['retired hurt']
+# Extras not charged to the bowler
+NON_BOWLER_EXTRAS = ['byes', 'legbyes', 'penalty']
+# Balls in an uninterrupted T20 innings
+FULL_QUOTA_BALLS = 120
+# Per team-match counts summed into season totals
+RESULT_COLUMNS = ['matches_played', 'wins', 'losses', 'no_results', 'points',
+                  'runs_for', 'balls_for', 'runs_against', 'balls_against']
+# Per player-season counts; the rates in players_df are derived from these
+PLAYER_COUNT_COLUMNS = ['matches', 'runs', 'balls_faced', 'fifties', 'hundreds', 'dismissals',
+                        'wickets', 'balls_bowled', 'runs_conceded']
+
+
+def team_labels(teams):
+    """Chart labels (code, colour) for the Series `teams`. A team without a
+    code in TEAM_CODES, or whose code another team also has, is labelled with
+    its full name, so different teams never share a label."""
+    teams = teams.astype(str)
+    unique = teams.unique()
+    codes = pd.Series([TEAM_CODES.get(team, team) for team in unique], index=unique)
+    shared = codes.duplicated(keep=False)
+    codes[shared] = codes.index[shared]
+    colors = teams.map(lambda team: TEAM_COLORS.get(team, '#808080'))
+    return teams.map(codes), colors
+
+
+def league_matches(matches_df):
+    """The league-stage rows of `matches_df`. Matches without a match_type
+    (data from before it was kept) count as league matches."""
+    if 'match_type' not in matches_df.columns:
+        return matches_df
+    match_type = matches_df['match_type'].astype(object)
+    return matches_df[(match_type.isna() | (match_type == 'League')).to_numpy()]
+
+
+def season_champions(matches_df):
+    """Map season -> champion: the winner of the season's final, or None
+    while the final has not been played (e.g. a season ingested as it goes).
+
+    WINNERS_BY_YEAR fills in a final without a result, and seasons whose
+    matches carry no match_type (data from before it was kept).
+    """
+    if 'match_type' in matches_df.columns:
+        match_type = matches_df['match_type'].astype(object)
+    else:
+        match_type = pd.Series(None, index=matches_df.index, dtype=object)
+    typed = match_type.notna().groupby(matches_df['season'].to_numpy()).any()
+    finals = matches_df[(match_type == 'Final').to_numpy()].sort_values(['date', 'id']).groupby('season').tail(1)
+    final_winners = dict(zip(finals['season'], finals['winner'].astype(object)))
+
+    champions = {}
+    for season, has_match_types in typed.items():
+        winner = final_winners.get(season)
+        if pd.isna(winner) and (season in final_winners or not has_match_types):
+            winner = WINNERS_BY_YEAR.get(season)
+        champions[season] = None if pd.isna(winner) else winner
+    return champions
+
+
+def innings_totals(deliveries):
+    """Runs, legal balls and wickets per innings. Super overs are left out."""
+    deliveries = deliveries[deliveries['inning'].to_numpy() <= 2]
+    extras = deliveries['extras_type']
+    is_wicket = deliveries['is_wicket'].to_numpy() == 1
+    balls = pd.DataFrame({
+        'match_id': deliveries['match_id'].to_numpy(),
+        'inning': deliveries['inning'].to_numpy(),
+        'batting_team': deliveries['batting_team'].array,
+        'bowling_team': deliveries['bowling_team'].array,
+        'runs': deliveries['total_runs'].to_numpy(),
+        'balls': ~extras.isin(['wides', 'noballs']).to_numpy(),
+        'wickets': is_wicket & ~deliveries['dismissal_kind'].isin(NOT_OUT_DISMISSALS).to_numpy()
+    })
+    return balls.groupby(['match_id', 'inning'], observed=True).agg(
+        batting_team=('batting_team', 'first'),
+        bowling_team=('bowling_team', 'first'),
+        runs=('runs', 'sum'),
+        balls=('balls', 'sum'),
+        wickets=('wickets', 'sum')
+    ).reset_index()
+
+
+def _innings_credit(innings, matches_df):
+    # Runs and balls each innings counts for in NRR: an all-out side is
+    # charged its full quota of overs, and the side batting first is credited
+    # with one run short of the target over the overs the chase was set
+    # (the D/L convention, and the plain first innings total otherwise)
+    target = matches_df[['id', 'target_runs', 'target_overs']].rename(columns={'id': 'match_id'})
+    innings = innings.merge(target, on='match_id', how='left')
+    has_target = innings['target_runs'].notna().to_numpy()
+    quota = np.where(innings['target_overs'].notna(), (innings['target_overs'] * 6).round(), FULL_QUOTA_BALLS)
+    balls = np.where(innings['wickets'].to_numpy() >= 10, quota, innings['balls'].to_numpy())
+    first = (innings['inning'].to_numpy() == 1) & has_target
+    runs = np.where(first, innings['target_runs'] - 1, innings['runs'])
+    balls = np.where(first, quota, balls)
+    return pd.DataFrame({
+        'match_id': innings['match_id'].to_numpy(),
+        'batting_team': innings['batting_team'].astype(str).to_numpy(),
+        'bowling_team': innings['bowling_team'].astype(str).to_numpy(),
+        'runs': runs.astype('int64'),
+        'balls': balls.astype('int64')
+    })
+
+
+def team_match_rates(matches_df, deliveries=None):
+    """One row per (league match, team): the result and the runs and balls
+    that count for and against the team in NRR.
+
+    Like the IPL points table, only league matches count: playoff results
+    (qualifiers, eliminators, finals) are left out of the matches played,
+    wins, losses, points and NRR. They still count in the match-level
+    charts and head-to-head records.
+
+    Rows are ordered by season, team and date, and numbered per team-season
+    (match_number) and per season (season_match). No-result matches score a
+    point but add nothing to NRR. Without `deliveries` the run and ball
+    columns are zero.
+    """
+    matches_df = league_matches(matches_df)
+    sides = pd.concat([
+        matches_df[['id', 'season', 'date', 'team1', 'winner']].rename(columns={'team1': 'team'}),
+        matches_df[['id', 'season', 'date', 'team2', 'winner']].rename(columns={'team2': 'team'})
+    ], ignore_index=True).rename(columns={'id': 'match_id'})
+    sides['team'] = sides['team'].astype(str)
+
+    won = (sides['winner'].astype(object) == sides['team']).to_numpy()
+    no_result = sides['winner'].isna().to_numpy()
+    sides['matches_played'] = 1
+    sides['wins'] = won.astype('int16')
+    sides['no_results'] = no_result.astype('int16')
+    sides['losses'] = (~won & ~no_result).astype('int16')
+    sides['points'] = sides['wins'] * 2 + sides['no_results']
+
+    rate_columns = ['runs_for', 'balls_for', 'runs_against', 'balls_against']
+    if deliveries is None:
+        for col in rate_columns:
+            sides[col] = 0
+    else:
+        credit = _innings_credit(innings_totals(deliveries), matches_df)
+        batted = credit.groupby(['match_id', 'batting_team'])[['runs', 'balls']].sum().rename_axis(
+            ['match_id', 'team']).rename(columns={'runs': 'runs_for', 'balls': 'balls_for'})
+        bowled = credit.groupby(['match_id', 'bowling_team'])[['runs', 'balls']].sum().rename_axis(
+            ['match_id', 'team']).rename(columns={'runs': 'runs_against', 'balls': 'balls_against'})
+        sides = sides.join(batted, on=['match_id', 'team']).join(bowled, on=['match_id', 'team'])
+        sides[rate_columns] = sides[rate_columns].fillna(0).astype('int64')
+        sides.loc[no_result, rate_columns] = 0
+
+    order = matches_df.sort_values(['season', 'date', 'id'])
+    season_match = pd.Series(order.groupby('season').cumcount().to_numpy() + 1, index=order['id'].to_numpy())
+    sides['season_match'] = season_match.reindex(sides['match_id'].to_numpy()).to_numpy()
+
+    sides = sides.sort_values(['season', 'team', 'date', 'match_id']).reset_index(drop=True)
+    sides['match_number'] = sides.groupby(['season', 'team']).cumcount() + 1
+    return sides.drop(columns=['winner'])
+
+
+def net_run_rate(frame):
+    """NRR from runs_for/balls_for/runs_against/balls_against columns; a side
+    without balls in either column scores 0 for that half."""
+    def per_over(runs, balls):
+        balls = frame[balls].to_numpy()
+        return np.where(balls > 0, frame[runs].to_numpy() * 6 / np.maximum(balls, 1), 0.0)
+    return per_over('runs_for', 'balls_for') - per_over('runs_against', 'balls_against')
+
+
+def nrr_progression(rates):
+    """Running totals and NRR after each of a team's matches in a season.
+
+    Takes team_match_rates() output; the counts become cumulative per
+    team-season, so the table after any match is a lookup rather than a
+    recomputation (see standings_as_of).
+    """
+    progress = rates.copy()
+    progress[RESULT_COLUMNS] = rates.groupby(['season', 'team'])[RESULT_COLUMNS].cumsum()
+    progress['nrr'] = net_run_rate(progress)
+    return progress
+
+
+def standings_as_of(progression, season, match_number):
+    """Points table of `season` after its `match_number`-th match."""
+    played = progression[(progression['season'] == season) & (progression['season_match'] <= match_number)]
+    table = played.groupby('team').tail(1)
+    table = table.sort_values(['points', 'nrr'], ascending=False).reset_index(drop=True)
+    return table[['team', 'matches_played', 'wins', 'losses', 'no_results', 'points', 'nrr']]
+
+
+def team_season_counts(matches_df, deliveries=None):
+    """Additive per team-season counts (RESULT_COLUMNS) from match results;
+    counts for disjoint sets of matches can simply be summed."""
+    rates = team_match_rates(matches_df, deliveries)
+    return rates.groupby(['season', 'team'])[RESULT_COLUMNS].sum().reset_index()
+
+
+def team_results_from_counts(counts, matches_df):
+    """Finish team_season_counts() output into the team_perf_df columns."""
+    perf = counts.copy()
+    perf['nrr'] = net_run_rate(perf)
+    perf['banned'] = False
+
+    # Banned franchises have no matches but still appear in the season's team list
+    banned_rows = [
+        {'season': season, 'team': team, 'matches_played': 0, 'wins': 0, 'losses': 0,
+         'no_results': 0, 'points': 0, 'nrr': 0.0, 'banned': True}
+        for season, teams in BANNED_TEAMS.items() if season in set(perf['season'])
+        for team in teams
+    ]
+    if banned_rows:
+        perf = pd.concat([perf, pd.DataFrame(banned_rows)], ignore_index=True)
+
+    champions = season_champions(matches_df)
+    perf['title_winner'] = [champions.get(season) == team for season, team in zip(perf['season'], perf['team'])]
+    perf['team_code'], perf['team_color'] = team_labels(perf['team'])
+
+    perf = perf.sort_values(['team', 'season']).reset_index(drop=True)
+    return perf[['team', 'team_code', 'team_color', 'season', 'matches_played', 'wins',
+                 'losses', 'points', 'nrr', 'title_winner', 'banned']]
+
+
+def team_season_results(matches_df, deliveries=None):
+    """Per team-season wins, losses, points and NRR from league match
+    results (see team_match_rates).
+
+    NRR needs the ball-by-ball `deliveries` and is 0.0 without them.
+    """
+    return team_results_from_counts(team_season_counts(matches_df, deliveries), matches_df)
+
+
+def player_season_counts(deliveries, matches_df):
+    """Additive per player-season counts (PLAYER_COUNT_COLUMNS) from
+    ball-by-ball data, keyed by season, team and player_name.
+
+    Balls are first summed per innings (match, team, player), which gives the
+    innings scores for 50s/100s, and then rolled up per season. A player's
+    matches are the distinct matches they batted or bowled in, so counts for
+    disjoint sets of matches can simply be summed. Team and player columns
+    stay categorical through the groupbys. Super overs are left out, as in
+    innings_totals.
+    """
+    deliveries = deliveries[deliveries['inning'].to_numpy() <= 2]
+    season_by_match = pd.Series(matches_df['season'].to_numpy(), index=matches_df['id'].to_numpy())
+    season = season_by_match.reindex(deliveries['match_id'].to_numpy()).to_numpy()
+
+    extras = deliveries['extras_type']
+    is_wicket = deliveries['is_wicket'].to_numpy() == 1
+    balls = pd.DataFrame({
+        'season': season,
+        'match_id': deliveries['match_id'].to_numpy(),
+        'batting_team': deliveries['batting_team'].array,
+        'bowling_team': deliveries['bowling_team'].array,
+        'batter': deliveries['batter'].array,
+        'bowler': deliveries['bowler'].array,
+        'player_dismissed': deliveries['player_dismissed'].array,
+        'batsman_runs': deliveries['batsman_runs'].to_numpy(),
+        'faced': (extras != 'wides').to_numpy(),
+        'legal': ~extras.isin(['wides', 'noballs']).to_numpy(),
+        # Byes, leg byes and penalty runs are not charged to the bowler
+        'conceded': np.where(extras.isin(NON_BOWLER_EXTRAS).to_numpy(), 0, deliveries['total_runs'].to_numpy()),
+        'bowler_wicket': is_wicket & ~deliveries['dismissal_kind'].isin(NON_BOWLER_DISMISSALS).to_numpy(),
+        'out': is_wicket & ~deliveries['dismissal_kind'].isin(NOT_OUT_DISMISSALS).to_numpy()
+    })
+    keys = ['season', 'team', 'player_name']
+
+    innings = balls.groupby(['season', 'batting_team', 'batter', 'match_id'], observed=True).agg(
+        runs=('batsman_runs', 'sum'),
+        balls_faced=('faced', 'sum')
+    ).rename_axis(keys + ['match_id'])
+    innings['fifties'] = (innings['runs'] >= 50) & (innings['runs'] < 100)
+    innings['hundreds'] = innings['runs'] >= 100
+    batting = innings.groupby(level=keys, observed=True)[['runs', 'balls_faced', 'fifties', 'hundreds']].sum()
+
+    # The dismissed player is not always the striker (run outs at the other end)
+    dismissals = balls[balls['out']].groupby(['season', 'batting_team', 'player_dismissed'], observed=True).size()
+    dismissals = dismissals.rename_axis(keys).rename('dismissals')
+
+    spells = balls.groupby(['season', 'bowling_team', 'bowler', 'match_id'], observed=True).agg(
+        wickets=('bowler_wicket', 'sum'),
+        balls_bowled=('legal', 'sum'),
+        runs_conceded=('conceded', 'sum')
+    ).rename_axis(keys + ['match_id'])
+    bowling = spells.groupby(level=keys, observed=True).sum()
+
+    appearances = pd.concat([innings.index.to_frame(index=False), spells.index.to_frame(index=False)])
+    matches = appearances.drop_duplicates().groupby(keys, observed=True).size().rename('matches')
+
+    counts = pd.concat([matches, batting, dismissals, bowling], axis=1)
+    counts = counts.fillna(0).astype('int32').reset_index()
+    counts['team'] = counts['team'].astype(str)
+    counts['player_name'] = counts['player_name'].astype(str)
+    return counts[keys + PLAYER_COUNT_COLUMNS]
+
+
+def _add_player_rates(players):
+    # Rates and role from summed counts, for one season or a whole career
+    players['strike_rate'] = (players['runs'] / players['balls_faced'].replace(0, np.nan) * 100).fillna(0)
+    # Players never dismissed average their runs (one notional dismissal)
+    players['avg'] = players['runs'] / players['dismissals'].clip(lower=1)
+    players['economy'] = (players['runs_conceded'] / (players['balls_bowled'] / 6).replace(0, np.nan)).fillna(0)
+    players['player_type'] = np.where(players['balls_bowled'] > players['balls_faced'], 'Bowler', 'Batsman')
+
+
+def player_stats_from_counts(counts):
+    """Finish player_season_counts() output into the players_df columns."""
+    players = counts.sort_values(['season', 'team', 'player_name']).reset_index(drop=True)
+    _add_player_rates(players)
+    players['team_code'], _ = team_labels(players['team'])
+    players['player_id'] = pd.factorize(players['player_name'])[0] + 1
+
+    return players[['player_id', 'player_name', 'team', 'team_code', 'season', 'matches', 'runs',
+                    'avg', 'strike_rate', 'fifties', 'hundreds', 'wickets', 'economy', 'player_type',
+                    'balls_faced', 'dismissals', 'balls_bowled', 'runs_conceded']]
+
+
+def player_season_stats(deliveries, matches_df):
+    """Per player-season batting and bowling figures from ball-by-ball data.
+
+    Besides the dashboard columns the result keeps the raw counts
+    (balls_faced, dismissals, balls_bowled, runs_conceded) so the rates can be
+    recomputed over any set of seasons.
+    """
+    return player_stats_from_counts(player_season_counts(deliveries, matches_df))
+
+
+def player_career_stats(players_df):
+    """Career totals per player from the season rows of players_df.
+
+    The counts are summed over every season and team and the rates derived
+    from the totals, as for a single season. seasons, first_season and
+    last_season give the span and teams the team codes played for, in order
+    of first appearance. One row per player, sorted by name.
+    """
+    players = players_df.sort_values('season', kind='stable')
+    names = players['player_name'].astype(object)
+    counts = players[PLAYER_COUNT_COLUMNS].astype('int64')
+    careers = counts.groupby(names).sum()
+
+    by_player = players.groupby(names)
+    careers['player_id'] = by_player['player_id'].first()
+    careers['seasons'] = by_player['season'].nunique()
+    careers['first_season'] = by_player['season'].min()
+    careers['last_season'] = by_player['season'].max()
+    stints = players.assign(player_name=names, team_code=players['team_code'].astype(str))
+    stints = stints.drop_duplicates(['player_name', 'team_code'])
+    careers['teams'] = stints.groupby('player_name')['team_code'].agg(', '.join)
+    _add_player_rates(careers)
+
+    careers = careers.rename_axis('player_name').reset_index()
+    return careers[['player_id', 'player_name', 'seasons', 'first_season', 'last_season', 'teams', 'matches',
+                    'runs', 'avg', 'strike_rate', 'fifties', 'hundreds', 'wickets', 'economy', 'player_type',
+                    'balls_faced', 'dismissals', 'balls_bowled', 'runs_conceded']]
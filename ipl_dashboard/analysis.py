@@ -0,0 +1,139 @@
+"""Vectorized match-level analysis used by the dashboard pages."""
+import numpy as np
+import pandas as pd
+
+
+def match_results(matches, team):
+    """Results of `team`'s matches in `matches` as a display table.
+
+    Works on any set of matches (one season, a full history, ...): the
+    opponent, result and "Won by N runs/wickets" text are built with column
+    expressions over the whole set at once.
+    """
+    matches = matches[(matches['team1'] == team) | (matches['team2'] == team)]
+
+    team1 = matches['team1'].astype(object).to_numpy()
+    team2 = matches['team2'].astype(object).to_numpy()
+    winner = matches['winner'].astype(object).to_numpy()
+    win_by_runs = matches['win_by_runs'].to_numpy()
+    win_by_wickets = matches['win_by_wickets'].to_numpy()
+
+    won = winner == team
+    no_result = pd.isna(winner)
+    result = np.select([no_result, won], ['No Result', 'Won'], default='Lost')
+    by_runs = np.char.add(np.char.add(result, ' by '), np.char.add(win_by_runs.astype(str), ' runs'))
+    by_wickets = np.char.add(np.char.add(result, ' by '), np.char.add(win_by_wickets.astype(str), ' wickets'))
+    details = np.select(
+        [no_result, win_by_runs > 0, win_by_wickets > 0],
+        ['No Result', by_runs, by_wickets],
+        default=result
+    )
+
+    return pd.DataFrame({
+        'Date': matches['date'].to_numpy(),
+        'Opponent': np.where(team1 == team, team2, team1),
+        'Result': result,
+        'Details': details,
+        'Venue': matches['venue'].astype(object).to_numpy()
+    })
+
+
+def _pct(part, total):
+    return np.where(total > 0, (part / total.where(total > 0, 1) * 100).round(2), 0.0)
+
+
+def _toss_winner_won(outcomes):
+    # Seen from either side: the toss winner won iff the side won both or
+    # neither, unless there was no result
+    return ((outcomes['toss_won'].to_numpy() == outcomes['match_won'].to_numpy())
+            & (outcomes['win_type'].to_numpy() != 'no result'))
+
+
+def match_outcomes(cube, **filters):
+    """Toss impact and win-type counts of the matches matching `filters`
+    (see match_cube.MatchCube.rollup), from one rollup of the cube.
+
+    Keys: matches, toss_win_match_win, toss_win_match_lose, win_by_runs,
+    win_by_wickets.
+    """
+    outcomes = cube.rollup(['toss_won', 'match_won', 'win_type'], **filters)
+    counts = outcomes['matches'].to_numpy()
+    win_type = outcomes['win_type'].to_numpy()
+    matches = int(counts.sum())
+    toss_win_match_win = int(counts[_toss_winner_won(outcomes)].sum())
+    return {
+        'matches': matches,
+        'toss_win_match_win': toss_win_match_win,
+        'toss_win_match_lose': matches - toss_win_match_win,
+        'win_by_runs': int(counts[win_type == 'runs'].sum()),
+        'win_by_wickets': int(counts[win_type == 'wickets'].sum())
+    }
+
+
+def season_trends(cube):
+    """Per-season win-type, toss impact and toss decision aggregates, rolled
+    up from the match cube (see match_cube).
+
+    Counts: total_matches, win_by_runs, win_by_wickets, toss_win_match_win,
+    toss_win_match_lose, bat, field, bat_win, field_win; plus the matching
+    percentages (pct_win_by_runs, pct_win_by_wickets, toss_win_match_win_pct,
+    bat_pct, field_pct, bat_win_pct, field_win_pct).
+    """
+    outcomes = cube.rollup(['season', 'toss_decision', 'toss_won', 'match_won', 'win_type'])
+    matches = outcomes['matches'].to_numpy()
+    win_type = outcomes['win_type'].to_numpy()
+    toss_won_match = _toss_winner_won(outcomes)
+    bat = outcomes['toss_decision'].to_numpy() == 'bat'
+    field = outcomes['toss_decision'].to_numpy() == 'field'
+
+    counts = pd.DataFrame({
+        'season': outcomes['season'].to_numpy(),
+        'total_matches': matches,
+        'win_by_runs': matches * (win_type == 'runs'),
+        'win_by_wickets': matches * (win_type == 'wickets'),
+        'toss_win_match_win': matches * toss_won_match,
+        'bat': matches * bat,
+        'field': matches * field,
+        'bat_win': matches * (bat & toss_won_match),
+        'field_win': matches * (field & toss_won_match)
+    })
+    trends = counts.groupby('season').sum().astype('int64').reset_index()
+
+    total = trends['total_matches']
+    trends['toss_win_match_lose'] = total - trends['toss_win_match_win']
+    trends['pct_win_by_runs'] = _pct(trends['win_by_runs'], total)
+    trends['pct_win_by_wickets'] = _pct(trends['win_by_wickets'], total)
+    trends['toss_win_match_win_pct'] = _pct(trends['toss_win_match_win'], total)
+    decisions = trends['bat'] + trends['field']
+    trends['bat_pct'] = _pct(trends['bat'], decisions)
+    trends['field_pct'] = _pct(trends['field'], decisions)
+    trends['bat_win_pct'] = _pct(trends['bat_win'], trends['bat'])
+    trends['field_win_pct'] = _pct(trends['field_win'], trends['field'])
+    return trends
+
+
+def sort_key(values, ascending=True):
+    """Float keys that order `values` ascending or descending with NaN last
+    when sorted ascending."""
+    key = np.asarray(values, dtype='float64')
+    key = key if ascending else -key
+    return np.where(np.isnan(key), np.inf, key)
+
+
+def top_k(df, column, k, ascending=False):
+    """The first `k` rows of `df` sorted by `column`, without sorting the
+    rest. Ties keep row order, as a stable sort would, so the result equals
+    the head of a full stable sort."""
+    key = sort_key(df[column].to_numpy(), ascending)
+    if k >= len(key):
+        return df.iloc[np.argsort(key, kind='stable')]
+    if k <= 0:
+        return df.iloc[:0]
+
+    # argpartition-style selection: O(n) to find the k-th key, then only the
+    # k selected rows are sorted
+    threshold = np.partition(key, k - 1)[k - 1]
+    better = np.flatnonzero(key < threshold)
+    ties = np.flatnonzero(key == threshold)[:k - len(better)]
+    selected = np.concatenate([better, ties])
+    return df.iloc[selected[np.argsort(key[selected], kind='stable')]]
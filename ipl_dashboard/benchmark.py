@@ -0,0 +1,253 @@
+"""Headless benchmark of data loading, sidebar filtering and page renders.
+
+For each data scale the synthetic generator writes matches.csv /
+deliveries.csv, and a fresh interpreter then measures:
+
+- a cold load (CSV parse, aggregation and compaction, no Parquet cache)
+- the sidebar filter stage: every (season, team) selection on the index
+- the dashboard under Streamlit's AppTest: the first run, then every
+  analysis type and each Historical Trends / Player Stats option, once
+  cold and then warm (figure cache hit, median of --repeats reruns)
+- peak resident memory of that interpreter
+
+Results are written as JSON so runs can be compared over time:
+
+    python -m ipl_dashboard.benchmark --output bench.json
+    python -m ipl_dashboard.benchmark --scales 1x 10x --output new.json --compare bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, 'ipl-dashboard-streamlit.py')
+
+# Scale name -> generate_mock_data() arguments; None runs the built-in mock
+# fallback without CSVs
+SCALES = {
+    'mock': None,
+    '1x': {},
+    '4x': {'num_seasons': 34, 'matches_per_season': 120},
+    '10x': {'num_seasons': 34, 'matches_per_season': 300}
+}
+DEFAULT_SCALES = ['mock', '1x', '4x']
+
+ANALYSIS_TYPES = ["Season Overview", "Team Analysis", "Player Stats", "Historical Trends"]
+# Page -> label of the in-page radio whose options are benchmarked separately
+PAGE_OPTIONS = {
+    "Player Stats": "Player Type",
+    "Historical Trends": "Select Trend Analysis"
+}
+
+# Timings that grow by less than this are treated as noise by --compare
+MIN_REGRESSION_S = 0.02
+WARM_REPEATS = 3
+
+
+def _timed(action):
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def _radio(at, label):
+    return next(radio for radio in at.radio if radio.label == label)
+
+
+def _bench_pages(at, repeats):
+    # Cold and warm rerun latency of every page and in-page option
+    renders = {}
+
+    def measure(name, select):
+        cold = _timed(lambda: select().run())
+        warm = statistics.median(_timed(at.run) for _ in range(repeats))
+        if at.exception:
+            raise RuntimeError(f"{name}: {at.exception}")
+        renders[name] = {'cold_s': cold, 'warm_s': warm}
+
+    for page in ANALYSIS_TYPES:
+        measure(page, lambda: at.sidebar.radio[0].set_value(page))
+        label = PAGE_OPTIONS.get(page)
+        if label:
+            for option in _radio(at, label).options:
+                measure(f"{page} / {option}", lambda: _radio(at, label).set_value(option))
+    return renders
+
+
+def run_scale(data_dir, repeats=WARM_REPEATS):
+    """Measure one scale in this process; `data_dir` must already be in
+    IPL_DATA_DIR so the dashboard script reads the same data."""
+    from streamlit.testing.v1 import AppTest
+
+    from .data_loader import LAST_LOAD_STATS, load_frames
+    from .figure_cache import figure_store_root
+    from .partition_index import DashboardIndex
+
+    # Figures stored by an earlier run (or a warm-up) would make cold renders warm
+    shutil.rmtree(figure_store_root(data_dir), ignore_errors=True)
+    result = {}
+    start = time.perf_counter()
+    matches_df, players_df, team_perf_df, *_ = load_frames(data_dir, use_cache=False)
+    result['load_s'] = time.perf_counter() - start
+    result['load_stats'] = {key: value for key, value in LAST_LOAD_STATS.items()
+                            if isinstance(value, (int, float, str))}
+
+    start = time.perf_counter()
+    index = DashboardIndex(matches_df, players_df, team_perf_df)
+    result['index_build_s'] = time.perf_counter() - start
+
+    selections = [(season, team) for season in index.seasons
+                  for team in [None] + list(index.teams_in_season(season))]
+    start = time.perf_counter()
+    for season, team in selections:
+        index.matches.select(season, team)
+        index.players.select(season, team)
+        index.team_perf.select(season, team)
+    result['filter_selections'] = len(selections)
+    result['filter_us_per_selection'] = (time.perf_counter() - start) / len(selections) * 1e6
+
+    at = AppTest.from_file(SCRIPT, default_timeout=600)
+    result['first_run_s'] = _timed(at.run)
+    if at.exception:
+        raise RuntimeError(f"first run: {at.exception}")
+    result['renders'] = _bench_pages(at, repeats)
+
+    warm = [render['warm_s'] for render in result['renders'].values()]
+    cold = [render['cold_s'] for render in result['renders'].values()]
+    result['rerun_cold_median_s'] = statistics.median(cold)
+    result['rerun_warm_median_s'] = statistics.median(warm)
+    result['rerun_max_s'] = max(cold + warm)
+    if resource is not None:
+        # ru_maxrss is in KiB on Linux
+        result['peak_rss_mb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return result
+
+
+def _prepare(scale, work_dir):
+    # Write the scale's CSVs once; None means "no CSVs" (mock fallback)
+    from .mock_data import generate_mock_data, write_mock_csvs
+
+    params = SCALES[scale]
+    data_dir = os.path.join(work_dir, scale)
+    if params is not None and not os.path.exists(os.path.join(data_dir, 'deliveries.csv')):
+        write_mock_csvs(generate_mock_data(with_deliveries=True, **params), data_dir)
+    os.makedirs(data_dir, exist_ok=True)
+    return data_dir
+
+
+def _run_child(scale, data_dir, repeats):
+    env = dict(os.environ, IPL_DATA_DIR=data_dir)
+    env.pop('IPL_BACKEND', None)
+    proc = subprocess.run(
+        [sys.executable, '-m', 'ipl_dashboard.benchmark', '--child', data_dir, '--repeats', str(repeats)],
+        cwd=ROOT, env=env, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"scale {scale} failed:\n{proc.stderr[-2000:]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _metadata():
+    import pandas as pd
+    import streamlit
+
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=ROOT, capture_output=True,
+                                text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'streamlit': streamlit.__version__,
+        'platform': platform.platform()
+    }
+
+
+def _leaf_metrics(results, prefix=''):
+    # Flatten nested results into {'1x.renders.Season Overview.cold_s': value}
+    for key, value in results.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from _leaf_metrics(value, path + '.')
+        elif isinstance(value, float) and (key.endswith('_s') or key.endswith('_mb') or key.endswith('_us_per_selection')):
+            yield path, value
+
+
+def compare(baseline, current, threshold):
+    """Metrics in `current` more than `threshold` (a fraction) worse than in
+    `baseline`, as (metric, old, new) tuples."""
+    old = dict(_leaf_metrics(baseline['scales']))
+    regressions = []
+    for metric, new in _leaf_metrics(current['scales']):
+        if metric not in old or old[metric] <= 0:
+            continue
+        if metric.endswith('_s') and new - old[metric] < MIN_REGRESSION_S:
+            continue
+        if new > old[metric] * (1 + threshold):
+            regressions.append((metric, old[metric], new))
+    return regressions
+
+
+def print_summary(results):
+    print(f"{'scale':<6}{'balls':>10}{'load s':>9}{'filter us':>11}{'first run s':>13}"
+          f"{'cold med s':>12}{'warm med s':>12}{'max s':>8}{'rss MB':>9}")
+    for scale, r in results['scales'].items():
+        print(f"{scale:<6}{r['load_stats'].get('deliveries_rows', 0):>10}{r['load_s']:>9.2f}"
+              f"{r['filter_us_per_selection']:>11.1f}{r['first_run_s']:>13.2f}{r['rerun_cold_median_s']:>12.3f}"
+              f"{r['rerun_warm_median_s']:>12.3f}{r['rerun_max_s']:>8.2f}{r.get('peak_rss_mb', 0):>9.0f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark dashboard load, filtering and page renders")
+    parser.add_argument('--scales', nargs='+', default=DEFAULT_SCALES, choices=list(SCALES))
+    parser.add_argument('--repeats', type=int, default=WARM_REPEATS, help="warm reruns per page (median)")
+    parser.add_argument('--work-dir', help="where generated CSVs are kept (reused between runs)")
+    parser.add_argument('--output', help="write the JSON results to this file")
+    parser.add_argument('--compare', help="baseline JSON to check for regressions")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="relative slowdown that counts as a regression (default 0.2)")
+    parser.add_argument('--child', metavar='DATA_DIR', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_scale(args.child, args.repeats)))
+        return 0
+
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix='ipl-bench-')
+    results = {'meta': dict(_metadata(), repeats=args.repeats), 'scales': {}}
+    for scale in args.scales:
+        data_dir = _prepare(scale, work_dir)
+        print(f"running {scale} ...", file=sys.stderr)
+        results['scales'][scale] = _run_child(scale, data_dir, args.repeats)
+
+    print_summary(results)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), results, args.threshold)
+        for metric, old, new in regressions:
+            print(f"regression: {metric} {old:.4f} -> {new:.4f}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
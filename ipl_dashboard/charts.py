@@ -0,0 +1,95 @@
+"""Chart builders that keep large charts cheap to send and draw.
+
+SVG traces slow the browser down beyond a few thousand points, so the
+builders switch to WebGL traces above WEBGL_THRESHOLD points. Long line
+series are also thinned to at most `max_points` per series with
+Largest-Triangle-Three-Buckets (LTTB), which keeps each series' visible
+shape (peaks, troughs, trend) while bounding the figure's payload. Small
+charts come out exactly as plotly.express would draw them.
+"""
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+# Points in a figure above which traces are drawn with WebGL
+WEBGL_THRESHOLD = 1000
+# Points kept per line series
+MAX_LINE_POINTS = 1000
+
+
+def render_mode(points):
+    return 'webgl' if points > WEBGL_THRESHOLD else 'svg'
+
+
+def _as_float(values):
+    values = np.asarray(values)
+    if values.dtype.kind == 'M':
+        values = values.view('int64')
+    return values.astype(float)
+
+
+def lttb(x, y, max_points):
+    """Positions of the points of the series (x, y), sorted by x, that LTTB
+    keeps to draw it with at most `max_points` points."""
+    n = len(x)
+    if n <= max_points or max_points < 3:
+        return np.arange(n)
+    x, y = _as_float(x), _as_float(y)
+
+    # The first and last points are kept; the rest fall into max_points - 2
+    # buckets, each contributing the point that makes the largest triangle
+    # with the previous kept point and the next bucket's average
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.intp)
+    # Each bucket's average point, then the last point as the final "bucket"
+    sizes = np.diff(edges)
+    next_x = np.append(np.add.reduceat(x[:n - 1], edges[:-1]) / sizes, x[-1])[1:]
+    next_y = np.append(np.add.reduceat(y[:n - 1], edges[:-1]) / sizes, y[-1])[1:]
+
+    kept = np.empty(max_points, dtype=np.intp)
+    kept[0], kept[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(max_points - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        areas = np.abs((x[previous] - next_x[bucket]) * (y[start:stop] - y[previous])
+                       - (x[previous] - x[start:stop]) * (next_y[bucket] - y[previous]))
+        previous = start + int(np.argmax(np.nan_to_num(areas, nan=-1.0)))
+        kept[bucket + 1] = previous
+    return kept
+
+
+def scatter(data, x, y, **kwargs):
+    """px.scatter, drawn with WebGL when `data` has many points."""
+    return px.scatter(data, x=x, y=y, render_mode=render_mode(len(data)), **kwargs)
+
+
+def line(data, x, y, color=None, max_points=MAX_LINE_POINTS, **kwargs):
+    """px.line with every series thinned to `max_points` points by LTTB,
+    drawn with WebGL when the result still has many points. `y` may be a
+    column or a list of columns, as for px.line; with `color` as well, the
+    columns are told apart by line dash."""
+    columns = list(y) if isinstance(y, (list, tuple)) else [y]
+    keys = [color] if color else []
+    if color and len(columns) > 1:
+        # Wide data with a colour would draw each colour's columns alike; in
+        # long form the colour stays the caller's grouping and each column
+        # gets its own dash
+        data = data.melt(id_vars=[x, color], value_vars=columns)
+        y, columns = 'value', ['value']
+        keys.append('variable')
+        kwargs.setdefault('line_dash', 'variable')
+    longest = data.groupby(keys, observed=True).size().max() if keys and len(data) else len(data)
+    if longest <= max_points:
+        return px.line(data, x=x, y=y, color=color, render_mode=render_mode(len(data) * len(columns)), **kwargs)
+
+    # Long form, one series per column, as px.line draws wide data
+    if len(columns) > 1:
+        data = data.melt(id_vars=[x], value_vars=columns)
+        y, color = 'value', 'variable'
+        keys = [color]
+    series = data.groupby(keys, sort=False, observed=True) if keys else [(None, data)]
+    thinned = []
+    for _, frame in series:
+        frame = frame.sort_values(x, kind='stable')
+        thinned.append(frame.iloc[lttb(frame[x].to_numpy(), frame[y].to_numpy(), max_points)])
+    data = pd.concat(thinned)
+    return px.line(data, x=x, y=y, color=color, render_mode=render_mode(len(data)), **kwargs)
@@ -0,0 +1,46 @@
+"""Compact dtypes for the frames each Streamlit worker holds in memory.
+
+Every worker process keeps its own copy of the dashboard frames, so repeated
+strings become categoricals, integer counters are stored in the narrowest
+width that holds their values, and rates become float32.
+"""
+import pandas as pd
+
+# String columns with at most this share of distinct values become categoricals
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+
+def compact_frame(df):
+    """Return a copy of `df` with compact column dtypes. Values are unchanged
+    apart from float64 -> float32 rounding."""
+    columns = {}
+    for col in df.columns:
+        values = df[col]
+        dtype = values.dtype
+        if isinstance(dtype, pd.CategoricalDtype) or pd.api.types.is_bool_dtype(dtype):
+            columns[col] = values
+        elif pd.api.types.is_integer_dtype(dtype):
+            columns[col] = pd.to_numeric(values, downcast='integer')
+        elif pd.api.types.is_float_dtype(dtype):
+            columns[col] = values.astype('float32')
+        elif values.nunique() <= CATEGORY_MAX_UNIQUE_RATIO * len(values):
+            columns[col] = values.astype('category')
+        else:
+            columns[col] = values
+    return pd.DataFrame(columns, index=df.index)
+
+
+def frame_bytes(df):
+    return int(df.memory_usage(deep=True).sum())
+
+
+def memory_report(before, after):
+    """Lines comparing the bytes per frame in `before` and `after` (name -> bytes)."""
+    lines = [f"{'frame':>20}  {'before MB':>10}  {'after MB':>10}  {'saved':>6}"]
+    for name in before:
+        saved = 1 - after[name] / before[name] if before[name] else 0.0
+        lines.append(f"{name:>20}  {before[name] / 2**20:>10.2f}  {after[name] / 2**20:>10.2f}  {saved:>6.0%}")
+    total_before, total_after = sum(before.values()), sum(after.values())
+    saved = 1 - total_after / total_before if total_before else 0.0
+    lines.append(f"{'total':>20}  {total_before / 2**20:>10.2f}  {total_after / 2**20:>10.2f}  {saved:>6.0%}")
+    return lines
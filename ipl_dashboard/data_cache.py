@@ -0,0 +1,109 @@
+"""Columnar on-disk cache of the parsed dashboard frames.
+
+Frames are stored as Parquet next to the CSVs, in a directory named after a
+hash of the source files and of this package's code. Any change to the data
+or to the code that derives the frames produces a new key and a rebuild;
+otherwise a cold start only has to read the Parquet files back.
+"""
+import glob
+import hashlib
+import os
+import shutil
+import tempfile
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (needed by pandas for Parquet)
+    HAS_PARQUET = True
+except ImportError:
+    HAS_PARQUET = False
+
+CACHE_DIRNAME = '.ipl_cache'
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Bytes read per hash update while fingerprinting the CSVs
+_HASH_BLOCK = 1 << 20
+
+
+def code_version():
+    """Hash of the package sources, so derived frames rebuild when code changes."""
+    digest = hashlib.blake2b(digest_size=8)
+    for path in sorted(glob.glob(os.path.join(PACKAGE_DIR, '*.py'))):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def cache_key(paths, extra=''):
+    """Content hash of `paths`, the code version and any `extra` parameters."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(code_version().encode())
+    digest.update(extra.encode())
+    for path in paths:
+        digest.update(os.path.basename(path).encode())
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(_HASH_BLOCK), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def cache_root(data_dir):
+    return os.path.join(data_dir, CACHE_DIRNAME)
+
+
+def read_cached_frames(data_dir, key, names):
+    """Return the frames stored under `key` as a dict, or None on a miss."""
+    if not HAS_PARQUET:
+        return None
+
+    entry = os.path.join(cache_root(data_dir), key)
+    paths = {name: os.path.join(entry, f"{name}.parquet") for name in names}
+    if not all(os.path.exists(path) for path in paths.values()):
+        return None
+    return {name: pd.read_parquet(path) for name, path in paths.items()}
+
+
+def write_frames(entry, frames):
+    """Write `frames` (name -> DataFrame) as Parquet files in the new
+    directory `entry`. Returns False if `entry` already exists.
+
+    The files go into a temporary directory that is renamed into place, so
+    readers in other processes never see a half-written entry. When another
+    process puts `entry` in place first, its copy is kept.
+    """
+    root = os.path.dirname(entry)
+    os.makedirs(root, exist_ok=True)
+    staging = tempfile.mkdtemp(dir=root, prefix='.tmp-')
+    os.chmod(staging, 0o755)
+    try:
+        for name, df in frames.items():
+            df.to_parquet(os.path.join(staging, f"{name}.parquet"), index=False)
+        if not os.path.exists(entry):
+            os.replace(staging, entry)
+            return True
+    except OSError:
+        # Lost the race between the check and the rename
+        if not os.path.isdir(entry):
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+    except Exception:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    shutil.rmtree(staging, ignore_errors=True)
+    return False
+
+
+def write_cached_frames(data_dir, key, frames):
+    """Store `frames` (name -> DataFrame) under `key`, replacing older entries."""
+    if not HAS_PARQUET:
+        return False
+
+    root = cache_root(data_dir)
+    write_frames(os.path.join(root, key), frames)
+
+    # Only the current key is ever read again
+    for name in os.listdir(root):
+        if name != key and not name.startswith('.tmp-'):
+            shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+    return True
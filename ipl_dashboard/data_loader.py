@@ -0,0 +1,335 @@
+"""Typed, chunked ingestion of the Kaggle style matches.csv / deliveries.csv.
+
+Only the columns the dashboard uses are parsed, each with an explicit dtype.
+Team, venue and player columns are read straight into categoricals and
+deliveries.csv is streamed in chunks, so the parser never holds more than one
+chunk of Python strings at a time.
+"""
+import argparse
+import os
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from .aggregates import player_season_stats, team_season_results
+from .compaction import compact_frame, frame_bytes, memory_report
+from .data_cache import cache_key, read_cached_frames, write_cached_frames
+from .mock_data import generate_mock_frames
+from .teams import TEAM_ALIASES, TEAM_CODES, TEAM_COLORS, BANNED_TEAMS
+
+# The CSVs live next to the dashboard script unless IPL_DATA_DIR points elsewhere
+DATA_DIR = os.environ.get('IPL_DATA_DIR', os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+MATCHES_FILE = 'matches.csv'
+DELIVERIES_FILE = 'deliveries.csv'
+
+# Rows parsed per chunk when streaming deliveries.csv
+CHUNK_SIZE = 100_000
+
+MATCH_DTYPES = {
+    'id': 'int32',
+    'city': 'category',
+    'date': 'str',
+    'match_type': 'category',
+    'venue': 'category',
+    'team1': 'category',
+    'team2': 'category',
+    'toss_winner': 'category',
+    'toss_decision': 'category',
+    'winner': 'category',
+    'result': 'category',
+    'result_margin': 'float32',  # NaN for ties and no results
+    'target_runs': 'float32',
+    'target_overs': 'float32',
+    'method': 'category'
+}
+
+DELIVERY_DTYPES = {
+    'match_id': 'int32',
+    'inning': 'int8',
+    'batting_team': 'category',
+    'bowling_team': 'category',
+    'over': 'int8',
+    'ball': 'int8',
+    'batter': 'category',
+    'bowler': 'category',
+    'batsman_runs': 'int8',
+    'extra_runs': 'int8',
+    'total_runs': 'int8',
+    'extras_type': 'category',
+    'is_wicket': 'int8',
+    'player_dismissed': 'category',
+    'dismissal_kind': 'category'
+}
+
+MATCH_TEAM_COLUMNS = ['team1', 'team2', 'toss_winner', 'winner']
+DELIVERY_TEAM_COLUMNS = ['batting_team', 'bowling_team']
+DELIVERY_PLAYER_COLUMNS = ['batter', 'bowler', 'player_dismissed']
+
+# Frames stored in the on-disk Parquet cache
+CACHED_FRAMES = ('matches', 'players', 'team_perf')
+
+# Timings (seconds) and sizes recorded by the most recent load_frames() call
+LAST_LOAD_STATS = {}
+
+
+def is_lfs_pointer(path):
+    """True when `path` is a Git LFS pointer rather than the real file."""
+    with open(path, 'rb') as f:
+        return f.read(40).startswith(b'version https://git-lfs')
+
+
+def has_real_data(data_dir=DATA_DIR):
+    """True when both CSVs are present and checked out (not LFS pointers)."""
+    for name in (MATCHES_FILE, DELIVERIES_FILE):
+        path = os.path.join(data_dir, name)
+        if not os.path.exists(path) or is_lfs_pointer(path):
+            return False
+    return True
+
+
+def _concat_chunks(chunks):
+    # Categorical chunks carry their own categories, so they are merged with
+    # union_categoricals instead of pd.concat (which would fall back to object)
+    if len(chunks) == 1:
+        return chunks[0].reset_index(drop=True)
+
+    columns = {}
+    for col in chunks[0].columns:
+        parts = [chunk[col] for chunk in chunks]
+        if isinstance(parts[0].dtype, pd.CategoricalDtype):
+            # A chunk where the column is all NaN has no categories, typed
+            # differently from the others; give it their (empty) type
+            typed = [part.cat.categories for part in parts if len(part.cat.categories)]
+            if typed:
+                empty = pd.CategoricalDtype(typed[0][:0])
+                parts = [part if len(part.cat.categories) else part.astype(empty) for part in parts]
+            columns[col] = pd.Series(union_categoricals(parts), name=col)
+        else:
+            columns[col] = pd.concat(parts, ignore_index=True)
+    return pd.DataFrame(columns)
+
+
+def _share_categories(df, columns):
+    # Columns compared against each other (e.g. winner == toss_winner) must
+    # share one categorical dtype
+    categories = df[columns[0]].cat.categories
+    for col in columns[1:]:
+        categories = categories.union(df[col].cat.categories)
+    dtype = pd.CategoricalDtype(categories)
+    for col in columns:
+        df[col] = df[col].astype(dtype)
+
+
+def _canonical_teams(values):
+    # Fold renamed franchises onto one name by remapping category codes
+    categories = values.cat.categories
+    canonical = pd.Index([TEAM_ALIASES.get(team, team) for team in categories])
+    if canonical.equals(categories):
+        return values
+
+    unique = canonical.unique()
+    remap = unique.get_indexer(canonical)
+    codes = values.cat.codes.to_numpy()
+    new_codes = np.where(codes >= 0, remap[codes], -1)
+    return pd.Series(pd.Categorical.from_codes(new_codes, unique), index=values.index, name=values.name)
+
+
+def read_typed_csv(path, dtypes, chunksize=None):
+    """Read only the columns in `dtypes`, optionally streaming in chunks."""
+    reader = pd.read_csv(
+        path,
+        usecols=list(dtypes),
+        dtype=dtypes,
+        chunksize=chunksize
+    )
+    if chunksize is None:
+        return reader
+    return _concat_chunks(list(reader))
+
+
+def read_matches(path):
+    matches = read_typed_csv(path, MATCH_DTYPES)
+    for col in MATCH_TEAM_COLUMNS:
+        matches[col] = _canonical_teams(matches[col])
+    _share_categories(matches, MATCH_TEAM_COLUMNS)
+    return matches
+
+
+def read_deliveries(path, chunksize=CHUNK_SIZE):
+    deliveries = read_typed_csv(path, DELIVERY_DTYPES, chunksize=chunksize)
+    for col in DELIVERY_TEAM_COLUMNS:
+        deliveries[col] = _canonical_teams(deliveries[col])
+    _share_categories(deliveries, DELIVERY_TEAM_COLUMNS)
+    _share_categories(deliveries, DELIVERY_PLAYER_COLUMNS)
+    return deliveries
+
+
+def build_matches_frame(raw):
+    """Shape the raw matches into the columns the dashboard pages expect."""
+    dates = pd.to_datetime(raw['date'])
+    result = raw['result'].astype(str)
+    margin = raw['result_margin'].fillna(0).astype('int16')
+
+    matches_df = pd.DataFrame({
+        'id': raw['id'],
+        # Seasons in the raw file are labelled like "2007/08", so the
+        # calendar year of the match is used instead
+        'season': dates.dt.year.astype('int16'),
+        'date': dates.dt.strftime('%Y-%m-%d'),
+        'team1': raw['team1'],
+        'team2': raw['team2'],
+        'team1_code': raw['team1'].map(TEAM_CODES),
+        'team2_code': raw['team2'].map(TEAM_CODES),
+        'winner': raw['winner'],
+        'winner_code': raw['winner'].map(TEAM_CODES),
+        'win_by_runs': margin.where(result == 'runs', 0),
+        'win_by_wickets': margin.where(result == 'wickets', 0),
+        'city': raw['city'],
+        'venue': raw['venue'],
+        'toss_winner': raw['toss_winner'],
+        'toss_decision': raw['toss_decision'],
+        'target_runs': raw['target_runs'],
+        'target_overs': raw['target_overs'],
+        'method': raw['method'],
+        'result': raw['result'],
+        # 'League', or the playoff stage ('Qualifier 1', 'Eliminator', 'Final', ...)
+        'match_type': raw['match_type']
+    })
+    return matches_df.sort_values(['date', 'id']).reset_index(drop=True)
+
+
+def load_real_frames(data_dir=DATA_DIR, chunksize=CHUNK_SIZE):
+    """Parse the CSVs in `data_dir` and derive the dashboard frames."""
+    stats = {}
+
+    start = time.perf_counter()
+    raw_matches = read_matches(os.path.join(data_dir, MATCHES_FILE))
+    stats['parse_matches_s'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    deliveries = read_deliveries(os.path.join(data_dir, DELIVERIES_FILE), chunksize=chunksize)
+    stats['parse_deliveries_s'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matches_df = build_matches_frame(raw_matches)
+    team_perf_df = team_season_results(matches_df, deliveries)
+    players_df = player_season_stats(deliveries, matches_df)
+    stats['aggregate_s'] = time.perf_counter() - start
+
+    stats['deliveries_rows'] = len(deliveries)
+    stats['deliveries_bytes'] = int(deliveries.memory_usage(deep=True).sum())
+    return matches_df, players_df, team_perf_df, stats
+
+
+def load_cached_real_frames(data_dir=DATA_DIR, use_cache=True):
+    """load_real_frames() behind the Parquet cache in data_cache."""
+    if not use_cache:
+        return load_real_frames(data_dir)
+
+    start = time.perf_counter()
+    key = cache_key([os.path.join(data_dir, MATCHES_FILE), os.path.join(data_dir, DELIVERIES_FILE)])
+    hash_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cached = read_cached_frames(data_dir, key, CACHED_FRAMES)
+    if cached is not None:
+        stats = {'hash_s': hash_s, 'cache': 'hit', 'cache_read_s': time.perf_counter() - start}
+        return cached['matches'], cached['players'], cached['team_perf'], stats
+
+    matches_df, players_df, team_perf_df, stats = load_real_frames(data_dir)
+    start = time.perf_counter()
+    frames = {'matches': matches_df, 'players': players_df, 'team_perf': team_perf_df}
+    stats['cache'] = 'miss' if write_cached_frames(data_dir, key, frames) else 'unavailable'
+    stats['hash_s'] = hash_s
+    stats['cache_write_s'] = time.perf_counter() - start
+    return matches_df, players_df, team_perf_df, stats
+
+
+def _season_store(data_dir):
+    # Imported here: season_store builds on this module
+    from .season_store import SeasonStore
+    return SeasonStore(data_dir)
+
+
+def uses_mock_data(data_dir=DATA_DIR):
+    """True when load_frames() falls back to mock data for `data_dir`."""
+    return not _season_store(data_dir).exists() and not has_real_data(data_dir)
+
+
+def data_version(data_dir=DATA_DIR):
+    """Changes whenever matches are ingested into the season store, so
+    callers can key their caches on it; None without a store."""
+    return _season_store(data_dir).version()
+
+
+def load_frames(data_dir=DATA_DIR, use_cache=True, mock_data=None):
+    """Return (matches_df, players_df, team_perf_df, team_codes, team_colors, banned_teams).
+
+    Reads the season store when one has been set up (see season_store), then
+    the real CSVs when they are checked out, and falls back to mock data
+    otherwise (e.g. a clone without Git LFS). Parsed CSV frames are cached as
+    Parquet so restarts and new replicas skip the parse. Mock seasons are
+    played out ball by ball so their player and team tables go through the
+    same aggregation as the real data. `mock_data` (generate_mock_data()
+    output) is used for that fallback instead of generating it again.
+    """
+    start = time.perf_counter()
+    store = _season_store(data_dir)
+    if store.exists():
+        matches_df, players_df, team_perf_df = store.frames()
+        stats = {'source': 'store', 'store_parts': len(store.parts())}
+    elif has_real_data(data_dir):
+        matches_df, players_df, team_perf_df, stats = load_cached_real_frames(data_dir, use_cache)
+        stats['source'] = 'csv'
+    elif mock_data is not None:
+        matches_df, players_df, team_perf_df = mock_data['matches'], mock_data['players'], mock_data['team_perf']
+        stats = {'source': 'mock'}
+    else:
+        matches_df, players_df, team_perf_df = generate_mock_frames(with_deliveries=True)
+        stats = {'source': 'mock'}
+
+    # Each worker holds its own copy of the frames, so shrink them first
+    frames = {'matches_df': matches_df, 'players_df': players_df, 'team_perf_df': team_perf_df}
+    compacted = {name: compact_frame(df) for name, df in frames.items()}
+    stats['bytes_before'] = {name: frame_bytes(df) for name, df in frames.items()}
+    stats['bytes_after'] = {name: frame_bytes(df) for name, df in compacted.items()}
+    matches_df, players_df, team_perf_df = compacted.values()
+    stats['total_s'] = time.perf_counter() - start
+
+    LAST_LOAD_STATS.clear()
+    LAST_LOAD_STATS.update(stats)
+    return matches_df, players_df, team_perf_df, TEAM_CODES, TEAM_COLORS, BANNED_TEAMS
+
+
+def main(argv=None):
+    # Report cold load time and peak memory of the ingestion path
+    parser = argparse.ArgumentParser(description="Measure a cold load of the dashboard data")
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    parser.add_argument('--no-cache', action='store_true', help="always parse the CSVs")
+    args = parser.parse_args(argv)
+
+    matches_df, players_df, team_perf_df, *_ = load_frames(args.data_dir, use_cache=not args.no_cache)
+
+    for key, value in LAST_LOAD_STATS.items():
+        if isinstance(value, dict):
+            continue
+        print(f"{key:>20}: {value:.3f}" if isinstance(value, float) else f"{key:>20}: {value}")
+    if resource is not None:
+        # ru_maxrss is in KiB on Linux
+        print(f"{'peak_rss_mb':>20}: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f}")
+    for name, df in [('matches_df', matches_df), ('players_df', players_df), ('team_perf_df', team_perf_df)]:
+        print(f"{name:>20}: {len(df)} rows")
+    print()
+    for line in memory_report(LAST_LOAD_STATS['bytes_before'], LAST_LOAD_STATS['bytes_after']):
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+"""Size-bounded LRU cache for built Plotly figures, keyed by view state.
+
+Behind the in-memory cache an optional FigureStore keeps every built figure
+as Plotly JSON on disk, shared by all server processes and filled ahead of
+time by the warm-up command (see warmup). Reading a stored figure back is
+several times cheaper than building it from the frames.
+
+The cache also remembers each figure's serialized size for the payload
+profile, taken from its stored file when it has one, so a figure is
+serialized for measuring at most once.
+"""
+import glob
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+
+from .data_cache import code_version
+from .payload import PAYLOAD_MODE, figure_bytes
+
+DEFAULT_MAXSIZE = 256
+STORE_DIRNAME = '.ipl_figures'
+VIEWS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'views')
+
+
+def _plain(value):
+    # numpy scalars -> Python values, so keys hash the same in every process
+    return value.item() if hasattr(value, 'item') else value
+
+
+def store_key(data_fingerprint):
+    """Directory name for figures built from data with `data_fingerprint`
+    by the current package, page and Plotly code, in the current payload
+    mode."""
+    # Plotly is imported on first use, like the pages that need it
+    import plotly
+
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(data_fingerprint.encode())
+    digest.update(code_version().encode())
+    digest.update(plotly.__version__.encode())
+    digest.update(PAYLOAD_MODE.encode())
+    for path in sorted(glob.glob(os.path.join(VIEWS_DIR, '*.py'))):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def figure_store_root(data_dir):
+    return os.path.join(data_dir, STORE_DIRNAME)
+
+
+class FigureStore:
+    """Built figures as JSON files under `root`, one per view-state key.
+
+    Writes go through a temporary file and a rename, so any number of
+    processes can fill and read the store at once. A store that cannot be
+    written (e.g. a read-only data directory) only loses its sharing.
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    @classmethod
+    def for_index(cls, data_dir, data_index):
+        return cls(os.path.join(figure_store_root(data_dir), store_key(data_index.fingerprint())))
+
+    def _path(self, key):
+        name = hashlib.blake2b(repr(tuple(_plain(part) for part in key)).encode(), digest_size=16).hexdigest()
+        return os.path.join(self.root, f"{name}.json")
+
+    def get(self, key):
+        import plotly.io as pio
+
+        try:
+            with open(self._path(key), encoding='utf-8') as f:
+                return pio.from_json(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key, figure):
+        path = self._path(key)
+        if os.path.exists(path):
+            return
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            fd, staging = tempfile.mkstemp(dir=self.root, prefix='.tmp-')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(figure.to_json())
+            os.chmod(staging, 0o644)
+            os.replace(staging, path)
+        except OSError:
+            pass
+
+    def size(self, key):
+        """Bytes of the stored JSON for `key`, or None when not stored."""
+        try:
+            return os.path.getsize(self._path(key))
+        except OSError:
+            return None
+
+    def __len__(self):
+        return len(glob.glob(os.path.join(self.root, '*.json')))
+
+    def prune(self):
+        """Delete the stores of other data or code versions next to this one."""
+        parent = os.path.dirname(self.root)
+        for name in os.listdir(parent) if os.path.isdir(parent) else []:
+            if os.path.join(parent, name) != self.root:
+                shutil.rmtree(os.path.join(parent, name), ignore_errors=True)
+
+
+class FigureCache:
+    """LRU mapping of view-state keys to built figures.
+
+    Keys are tuples such as (analysis_type, season, team, chart name, ...).
+    Figures are shared between sessions, so callers must not mutate a figure
+    after it has been returned from the cache. With a `store`, misses are
+    looked up there before building, and built figures are added to it.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, store=None):
+        self.maxsize = maxsize
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self.store_hits = 0
+        self.evictions = 0
+        self._items = OrderedDict()
+        # Serialized bytes of cached figures, filled by payload_bytes()
+        self._sizes = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get_or_build(self, key, build):
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key]
+            self.misses += 1
+
+        # Built outside the lock so sessions don't serialize on each other;
+        # two sessions racing on the same key just build it twice
+        figure = self.store.get(key) if self.store is not None else None
+        if figure is not None:
+            with self._lock:
+                self.store_hits += 1
+        else:
+            figure = build()
+            if self.store is not None:
+                self.store.put(key, figure)
+
+        with self._lock:
+            self._items[key] = figure
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                evicted, _ = self._items.popitem(last=False)
+                self._sizes.pop(evicted, None)
+                self.evictions += 1
+        return figure
+
+    def payload_bytes(self, key, figure):
+        """Serialized bytes of `figure`, cached under `key`. Measured once
+        per cached figure: read from the store's file, else serialized."""
+        with self._lock:
+            size = self._sizes.get(key)
+        if size is None:
+            size = self.store.size(key) if self.store is not None else None
+            if size is None:
+                size = figure_bytes(figure)
+            with self._lock:
+                if key in self._items:
+                    self._sizes[key] = size
+        return size
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._sizes.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._items),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'store_hits': self.store_hits,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
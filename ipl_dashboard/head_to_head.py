@@ -0,0 +1,133 @@
+"""Head-to-head records between every pair of franchises.
+
+Every match is counted once from each side, per season, into dense
+(season, team, opponent) arrays that are stored as running totals over the
+seasons. The record over any season range is then the difference of two
+slices of those totals, whatever the range, instead of a scan of the
+matches for each pair.
+"""
+import numpy as np
+import pandas as pd
+
+from .aggregates import team_labels
+
+# Per (team, opponent) counts, from the team's side. Wins batting first are
+# wins by runs, wins chasing are wins by wickets
+METRICS = ['matches', 'wins', 'losses', 'no_results', 'wins_batting_first', 'wins_chasing']
+VENUE_METRICS = ['matches', 'wins']
+
+
+class HeadToHead:
+    """Pairwise records over `matches_df`, sliceable by season range.
+
+    `_totals[s, i, j, m]` holds metric m of teams[i] against teams[j] over
+    the first s seasons (row 0 is all zeros), and `_venue_totals[s, i, j, v,
+    m]` the same per venue for VENUE_METRICS.
+    """
+
+    def __init__(self, matches_df):
+        # A match recorded with the same franchise on both sides is no pairing
+        matches_df = matches_df[matches_df['team1'].astype(object) != matches_df['team2'].astype(object)]
+        self.seasons = sorted(int(season) for season in matches_df['season'].unique())
+        team1 = matches_df['team1'].astype(object).to_numpy()
+        team2 = matches_df['team2'].astype(object).to_numpy()
+        winner = matches_df['winner'].astype(object).to_numpy()
+        venue = matches_df['venue'].astype(object).fillna('Unknown').to_numpy()
+        self.teams = sorted(set(team1) | set(team2))
+        self.venues = sorted(set(venue))
+        self._team_pos = {team: i for i, team in enumerate(self.teams)}
+        codes, colors = team_labels(pd.Series(self.teams, dtype=object))
+        self.codes = dict(zip(self.teams, codes))
+        self.colors = dict(zip(self.teams, colors))
+
+        # Both sides of every match: (season, team, opponent)
+        season = np.tile(np.searchsorted(self.seasons, matches_df['season'].to_numpy()), 2)
+        team_index = pd.Index(self.teams)
+        first_side, second_side = team_index.get_indexer(team1), team_index.get_indexer(team2)
+        team = np.concatenate([first_side, second_side])
+        opponent = np.concatenate([second_side, first_side])
+        venue = np.tile(pd.Index(self.venues).get_indexer(venue), 2)
+
+        won = np.concatenate([winner == team1, winner == team2])
+        no_result = np.tile(pd.isna(winner), 2)
+        by_runs = np.tile(matches_df['win_by_runs'].to_numpy() > 0, 2)
+        by_wickets = np.tile(matches_df['win_by_wickets'].to_numpy() > 0, 2)
+        values = np.stack([np.ones_like(won), won, ~won & ~no_result, no_result,
+                           won & by_runs, won & by_wickets], axis=1).astype(np.int32)
+
+        counts = np.zeros((len(self.seasons), len(self.teams), len(self.teams), len(METRICS)), dtype=np.int32)
+        np.add.at(counts, (season, team, opponent), values)
+        self._totals = _running_totals(counts)
+
+        venue_counts = np.zeros((len(self.seasons), len(self.teams), len(self.teams), len(self.venues),
+                                 len(VENUE_METRICS)), dtype=np.int32)
+        np.add.at(venue_counts, (season, team, opponent, venue), values[:, :2])
+        self._venue_totals = _running_totals(venue_counts)
+
+    def _span(self, first, last):
+        # Rows of the running totals bounding seasons first..last (inclusive)
+        start = 0 if first is None else int(np.searchsorted(self.seasons, first, side='left'))
+        stop = len(self.seasons) if last is None else int(np.searchsorted(self.seasons, last, side='right'))
+        return start, max(start, stop)
+
+    def _range(self, totals, first, last):
+        start, stop = self._span(first, last)
+        return totals[stop] - totals[start]
+
+    def matrix(self, metric='wins', first=None, last=None):
+        """Team x opponent table of `metric` over seasons first..last, limited
+        to teams that played in that range."""
+        counts = self._range(self._totals, first, last)
+        played = counts[:, :, 0].sum(axis=1) > 0
+        teams = [team for team, keep in zip(self.teams, played) if keep]
+        values = counts[np.ix_(played, played)][:, :, METRICS.index(metric)]
+        return pd.DataFrame(values, index=pd.Index(teams, name='team'), columns=pd.Index(teams, name='opponent'))
+
+    def record(self, team, opponent, first=None, last=None):
+        """`team`'s record against `opponent` as {metric: count}."""
+        i, j = self._team_pos.get(team), self._team_pos.get(opponent)
+        if i is None or j is None:
+            return dict.fromkeys(METRICS, 0)
+        start, stop = self._span(first, last)
+        return dict(zip(METRICS, (self._totals[stop, i, j] - self._totals[start, i, j]).tolist()))
+
+    def opponents(self, team, first=None, last=None):
+        """Teams `team` played in seasons first..last."""
+        i = self._team_pos.get(team)
+        if i is None:
+            return []
+        played = self._range(self._totals, first, last)[i, :, 0]
+        return [opponent for opponent, matches in zip(self.teams, played) if matches > 0]
+
+    def by_season(self, team, opponent, first=None, last=None):
+        """One row per season of first..last with `team`'s record against
+        `opponent`."""
+        i, j = self._team_pos.get(team), self._team_pos.get(opponent)
+        start, stop = self._span(first, last)
+        if i is None or j is None:
+            return pd.DataFrame(columns=['season'] + METRICS)
+        counts = np.diff(self._totals[start:stop + 1, i, j], axis=0)
+        seasons = pd.DataFrame(counts, columns=METRICS)
+        seasons.insert(0, 'season', self.seasons[start:stop])
+        return seasons[seasons['matches'] > 0].reset_index(drop=True)
+
+    def by_venue(self, team, opponent, first=None, last=None):
+        """Matches between the pair per venue, with each side's wins."""
+        i, j = self._team_pos.get(team), self._team_pos.get(opponent)
+        if i is None or j is None:
+            return pd.DataFrame(columns=['venue', 'matches', 'wins', 'opponent_wins'])
+        counts = self._range(self._venue_totals, first, last)
+        venues = pd.DataFrame({
+            'venue': self.venues,
+            'matches': counts[i, j, :, 0],
+            'wins': counts[i, j, :, 1],
+            'opponent_wins': counts[j, i, :, 1]
+        })
+        return venues[venues['matches'] > 0].sort_values('matches', ascending=False, kind='stable').reset_index(drop=True)
+
+
+def _running_totals(counts):
+    # Prefix sums over the season axis, with a leading row of zeros
+    totals = np.zeros((counts.shape[0] + 1,) + counts.shape[1:], dtype=np.int32)
+    np.cumsum(counts, axis=0, out=totals[1:])
+    return totals
@@ -0,0 +1,123 @@
+"""Match counts aggregated over every match-level dimension the pages chart.
+
+The cube holds one cell per distinct (season, team, venue, city,
+toss_decision, toss_won, match_won, win_type) combination, seen from each
+side of a match, with the number of matches in it. Match-level charts (toss
+impact, win types, season trends, venue breakdowns) are rollups of those
+cells instead of separate mask-and-count passes over the matches.
+"""
+import numpy as np
+import pandas as pd
+
+DIMENSIONS = ['season', 'team', 'venue', 'city', 'toss_decision', 'toss_won', 'match_won', 'win_type']
+
+
+def _win_types(matches_df):
+    # 'runs' (won batting first), 'wickets' (won chasing), 'no result', or
+    # 'other' for a result with neither margin (e.g. a super over)
+    return np.select(
+        [matches_df['winner'].isna().to_numpy(), matches_df['win_by_runs'].to_numpy() > 0,
+         matches_df['win_by_wickets'].to_numpy() > 0],
+        ['no result', 'runs', 'wickets'],
+        default='other'
+    )
+
+
+class MatchCube:
+    """Match counts by DIMENSIONS over `matches_df`.
+
+    `team`, `toss_won` and `match_won` are from one side of the match, so
+    each match has a cell per team. Two measures keep the counts right:
+    `matches` counts a match once (on its team1 side) and `team_matches`
+    once per team playing it. A rollup that filters or groups by team reads
+    `team_matches` (one row per match of the team), any other reads `matches`.
+
+    Cells are stored as integer codes into each dimension's sorted `levels`,
+    ordered by season, so a season filter is a slice and a rollup is one
+    bincount over the selected cells.
+    """
+
+    def __init__(self, matches_df):
+        team1 = matches_df['team1'].astype(object).to_numpy()
+        team2 = matches_df['team2'].astype(object).to_numpy()
+        toss_winner = matches_df['toss_winner'].astype(object).to_numpy()
+        winner = matches_df['winner'].astype(object).to_numpy()
+
+        def both_sides(column, fill='Unknown'):
+            return np.tile(matches_df[column].astype(object).fillna(fill).to_numpy(), 2)
+
+        ones = np.ones(len(matches_df), dtype=np.int64)
+        sides = pd.DataFrame({
+            'season': np.tile(matches_df['season'].to_numpy().astype(np.int64), 2),
+            'team': np.concatenate([team1, team2]),
+            'venue': both_sides('venue'),
+            'city': both_sides('city'),
+            'toss_decision': both_sides('toss_decision', 'unknown'),
+            'toss_won': np.concatenate([toss_winner == team1, toss_winner == team2]),
+            'match_won': np.concatenate([winner == team1, winner == team2]),
+            'win_type': np.tile(_win_types(matches_df), 2),
+            'matches': np.concatenate([ones, np.zeros_like(ones)]),
+            # A match recorded with the same team on both sides counts once for it
+            'team_matches': np.concatenate([ones, (team2 != team1).astype(np.int64)])
+        })
+        cells = sides.groupby(DIMENSIONS, sort=True).sum().reset_index()
+
+        self.levels = {}
+        self._level_positions = {}
+        codes = []
+        for dimension in DIMENSIONS:
+            level_codes, levels = pd.factorize(cells[dimension], sort=True)
+            self.levels[dimension] = levels
+            self._level_positions[dimension] = {level: i for i, level in enumerate(levels.tolist())}
+            codes.append(level_codes)
+        self.codes = np.column_stack(codes)
+        self.measures = {'matches': cells['matches'].to_numpy(), 'team_matches': cells['team_matches'].to_numpy()}
+        # Cells of the i-th season are rows season_bounds[i]:season_bounds[i + 1]
+        self._season_bounds = np.searchsorted(self.codes[:, 0], np.arange(len(self.levels['season']) + 1))
+
+    def __len__(self):
+        return len(self.codes)
+
+    def _level_codes(self, dimension, value):
+        positions = self._level_positions[dimension]
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        return np.array(sorted({positions[v] for v in values if v in positions}), dtype=np.intp)
+
+    def _select(self, filters):
+        # Row positions of the cells matching `filters`; seasons are slices
+        filters = dict(filters)
+        rows = np.arange(len(self.codes))
+        if 'season' in filters:
+            bounds = self._season_bounds
+            rows = np.concatenate([rows[bounds[i]:bounds[i + 1]]
+                                   for i in self._level_codes('season', filters.pop('season'))] or [rows[:0]])
+        for dimension, value in filters.items():
+            if dimension not in DIMENSIONS:
+                raise ValueError(f"Unknown cube dimension: {dimension}")
+            rows = rows[np.isin(self.codes[rows, DIMENSIONS.index(dimension)], self._level_codes(dimension, value))]
+        return rows
+
+    def rollup(self, by=(), **filters):
+        """Match counts grouped by the dimensions in `by`, over the cells
+        matching `filters` (dimension=value, or a list of values), as a
+        frame of `by` + ['matches'] sorted by `by`."""
+        by = list(by)
+        measure = self.measures['team_matches' if 'team' in by or 'team' in filters else 'matches']
+        rows = self._select(filters)
+        if not by:
+            return pd.DataFrame({'matches': [int(measure[rows].sum())]})
+
+        columns = [DIMENSIONS.index(dimension) for dimension in by]
+        shape = [len(self.levels[dimension]) for dimension in by]
+        groups, group_of_row = np.unique(
+            np.ravel_multi_index(self.codes[np.ix_(rows, columns)].T, shape), return_inverse=True)
+        counts = np.bincount(group_of_row.ravel(), weights=measure[rows], minlength=len(groups)).astype(np.int64)
+        keep = counts > 0
+        group_codes = np.unravel_index(groups[keep], shape)
+        rolled = {dimension: self.levels[dimension].take(codes) for dimension, codes in zip(by, group_codes)}
+        rolled['matches'] = counts[keep]
+        return pd.DataFrame(rolled)
+
+    def count(self, **filters):
+        """Number of matches matching `filters`."""
+        return int(self.rollup(**filters)['matches'].iloc[0])
@@ -0,0 +1,378 @@
+"""Seeded, vectorized synthetic IPL data.
+
+Used when the real CSVs are not available and for load testing at larger
+scales. Every season is generated with whole-array operations on a
+numpy Generator, so the output depends only on the seed and the scale knobs
+and is identical across processes and replicas.
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from .aggregates import player_season_stats, team_season_results
+from .teams import MOCK_TEAMS, TEAM_CODES, TEAM_COLORS, BANNED_TEAMS, WINNERS_BY_YEAR
+
+MOCK_SEED = 2008
+FIRST_SEASON = 2008
+NUM_SEASONS = 17  # 2008-2024
+MATCHES_PER_SEASON = 60  # Approximate number of matches per season
+PLAYERS_PER_TEAM = 20
+
+# Franchises that joined after the first season
+TEAM_FIRST_SEASON = {
+    'Sunrisers Hyderabad': 2013,
+    'Gujarat Titans': 2022,
+    'Lucknow Super Giants': 2022
+}
+
+CITIES = ['Mumbai', 'Chennai', 'Bangalore', 'Kolkata', 'Delhi', 'Hyderabad']
+VENUES = ['Wankhede Stadium', 'Eden Gardens', 'Chinnaswamy Stadium', 'Chepauk']
+
+# Colors for the extra franchises created when scaling past the real line-up
+EXTRA_TEAM_COLORS = ['#1F77B4', '#FF7F0E', '#2CA02C', '#D62728', '#9467BD',
+                     '#8C564B', '#E377C2', '#7F7F7F', '#BCBD22', '#17BECF']
+
+# Ball outcomes: runs off the bat and their probabilities
+BALL_RUNS = np.array([0, 1, 2, 3, 4, 6], dtype='int8')
+BALL_RUNS_P = [0.35, 0.35, 0.08, 0.02, 0.12, 0.08]
+EXTRAS = np.array([None, 'wides', 'legbyes', 'byes', 'noballs'], dtype=object)
+EXTRAS_P = [0.93, 0.03, 0.02, 0.01, 0.01]
+WICKET_P = 0.045
+DISMISSALS = np.array(['caught', 'bowled', 'lbw', 'run out', 'stumped'], dtype=object)
+DISMISSALS_P = [0.6, 0.18, 0.1, 0.08, 0.04]
+
+
+def mock_teams(num_teams=len(MOCK_TEAMS)):
+    """Team names, codes and colors; extra franchises are numbered past the real ten."""
+    teams = MOCK_TEAMS[:num_teams] + [f"Franchise {i}" for i in range(len(MOCK_TEAMS) + 1, num_teams + 1)]
+    codes = [TEAM_CODES.get(team, f"F{i + 1}") for i, team in enumerate(teams)]
+    colors = [TEAM_COLORS.get(team, EXTRA_TEAM_COLORS[i % len(EXTRA_TEAM_COLORS)]) for i, team in enumerate(teams)]
+    return teams, codes, colors
+
+
+def _team_season_grid(teams, seasons):
+    # (team, season) masks of franchises that exist, and of those that are banned
+    first = np.array([TEAM_FIRST_SEASON.get(team, FIRST_SEASON) for team in teams])
+    exists = seasons[None, :] >= first[:, None]
+    banned = np.array([[team in BANNED_TEAMS.get(season, []) for season in seasons] for team in teams],
+                      dtype=bool).reshape(len(teams), len(seasons))
+    return exists, banned & exists
+
+
+def _mock_matches(rng, seasons, active, matches_per_season):
+    n_active = active.sum(axis=0)
+    # Active team indices first in every season column, so a season's teams
+    # are rows 0..n_active-1 of its column
+    order = np.argsort(~active, axis=0, kind='stable')
+
+    playable = np.flatnonzero(n_active >= 2)
+    season_idx = np.repeat(playable, matches_per_season)
+    n = len(season_idx)
+    k = n_active[season_idx]
+
+    # Opponent is a non-zero offset from team1, so the two never collide
+    local1 = rng.integers(0, k)
+    local2 = (local1 + rng.integers(1, k)) % k
+    team1 = order[local1, season_idx]
+    team2 = order[local2, season_idx]
+
+    # Random dates within IPL season months (April-May), in match id order
+    month = rng.choice([4, 5], size=n)
+    day = rng.integers(1, 28, size=n)
+    chronological = np.lexsort((day, month, season_idx))
+
+    toss_winner = np.where(rng.random(n) < 0.5, team1, team2)
+    toss_decision = np.where(rng.random(n) < 0.5, 'bat', 'field')
+
+    columns = {
+        'season_idx': season_idx, 'team1': team1, 'team2': team2,
+        'month': month, 'day': day, 'toss_winner': toss_winner, 'toss_decision': toss_decision,
+        'city': rng.integers(0, len(CITIES), size=n), 'venue': rng.integers(0, len(VENUES), size=n)
+    }
+    return {key: value[chronological] for key, value in columns.items()}
+
+
+def _random_results(rng, m):
+    # Random winner and a margin by runs or by wickets
+    n = len(m['team1'])
+    m['winner'] = np.where(rng.random(n) < 0.5, m['team1'], m['team2'])
+    by_runs = rng.random(n) < 0.5
+    m['win_by_runs'] = np.where(by_runs, rng.integers(1, 100, size=n), 0)
+    m['win_by_wickets'] = np.where(by_runs, 0, rng.integers(1, 10, size=n))
+    m['target_runs'] = np.full(n, np.nan)
+
+
+def _mock_deliveries(rng, m, teams, players_per_team):
+    # Two 20-over innings per match; the innings ends at ten wickets and the
+    # chase ends once the target is passed
+    n = len(m['team1'])
+    batting_first = np.where(m['toss_decision'] == 'bat', m['toss_winner'],
+                             np.where(m['toss_winner'] == m['team1'], m['team2'], m['team1']))
+    batting_second = np.where(batting_first == m['team1'], m['team2'], m['team1'])
+    batting = np.stack([batting_first, batting_second], axis=1)  # (n, 2)
+    bowling = batting[:, ::-1]
+
+    shape = (n, 2, 120)
+    extras = rng.choice(len(EXTRAS), size=shape, p=EXTRAS_P).astype('int8')
+    bat_runs = np.where((extras == 0) | (extras == 4), rng.choice(BALL_RUNS, size=shape, p=BALL_RUNS_P), 0).astype('int8')
+    extra_runs = (extras > 0).astype('int8')
+    total_runs = bat_runs + extra_runs
+    wicket = (rng.random(shape) < WICKET_P) & (extras != 1)
+
+    wickets_before = np.cumsum(wicket, axis=2) - wicket
+    valid = wickets_before < 10
+    first_total = (total_runs * valid)[:, 0].sum(axis=1)
+
+    chase_runs = total_runs[:, 1] * valid[:, 1]
+    runs_before = np.cumsum(chase_runs, axis=1) - chase_runs
+    valid[:, 1] &= runs_before <= first_total[:, None]
+    # The ball that wins the chase ends the match, so it takes no wicket
+    wicket[:, 1] &= ~(valid[:, 1] & (runs_before + chase_runs > first_total[:, None]))
+    totals = (total_runs * valid).sum(axis=2)
+    wickets_lost = (wicket & valid).sum(axis=2)
+
+    chased = totals[:, 1] > totals[:, 0]
+    tied = totals[:, 1] == totals[:, 0]
+    m['winner'] = np.where(chased, batting_second, batting_first)
+    m['win_by_runs'] = np.where(chased, 0, totals[:, 0] - totals[:, 1])
+    m['win_by_wickets'] = np.where(chased, 10 - wickets_lost[:, 1], 0)
+    m['target_runs'] = (totals[:, 0] + 1).astype(float)
+
+    # Each side picks a random XI from its squad; positions 0-10 bat in order
+    # and positions 6-10 share the bowling
+    xi = np.argsort(rng.random((n, 2, players_per_team)), axis=2)[:, :, :11]
+    squad = xi + (batting * players_per_team)[:, :, None]
+    over = np.broadcast_to(np.arange(120) // 6, shape)
+    batter = np.take_along_axis(squad, np.minimum(wickets_before, 10), axis=2)
+    bowler = np.take_along_axis(squad[:, ::-1], 6 + over % 5, axis=2)
+
+    match_idx, inning_idx, ball_idx = np.nonzero(valid)
+    num_players = len(teams) * players_per_team
+    player_names = pd.Index([f"Player_{i + 1}" for i in range(num_players)])
+    team_names = pd.Index(teams)
+
+    def players(codes):
+        return pd.Categorical.from_codes(codes, categories=player_names)
+
+    is_wicket = wicket[match_idx, inning_idx, ball_idx]
+    batter_codes = batter[match_idx, inning_idx, ball_idx]
+    dismissal = DISMISSALS[rng.choice(len(DISMISSALS), size=len(is_wicket), p=DISMISSALS_P)]
+    deliveries = pd.DataFrame({
+        'match_id': (match_idx + 1).astype('int32'),
+        'inning': (inning_idx + 1).astype('int8'),
+        'batting_team': pd.Categorical.from_codes(batting[match_idx, inning_idx], categories=team_names),
+        'bowling_team': pd.Categorical.from_codes(bowling[match_idx, inning_idx], categories=team_names),
+        'over': (ball_idx // 6).astype('int8'),
+        'ball': (ball_idx % 6 + 1).astype('int8'),
+        'batter': players(batter_codes),
+        'bowler': players(bowler[match_idx, inning_idx, ball_idx]),
+        'batsman_runs': bat_runs[match_idx, inning_idx, ball_idx],
+        'extra_runs': extra_runs[match_idx, inning_idx, ball_idx],
+        'total_runs': total_runs[match_idx, inning_idx, ball_idx],
+        'extras_type': pd.Categorical(EXTRAS[extras[match_idx, inning_idx, ball_idx]]),
+        'is_wicket': is_wicket.astype('int8'),
+        'player_dismissed': players(np.where(is_wicket, batter_codes, -1)),
+        'dismissal_kind': pd.Categorical(np.where(is_wicket, dismissal, None))
+    })
+
+    # A tie is settled by a super over, drawn here as a coin flip (drawn last,
+    # so the rest of the match is as before); it has no margin
+    super_over = rng.random(n) < 0.5
+    m['winner'] = np.where(tied, np.where(super_over, batting_first, batting_second), m['winner'])
+    return deliveries
+
+
+def _matches_frame(m, seasons, teams, codes):
+    n = len(m['team1'])
+    teams = np.asarray(teams, dtype=object)
+    codes = np.asarray(codes, dtype=object)
+    season = seasons[m['season_idx']]
+    dates = pd.to_datetime(pd.DataFrame({'year': season, 'month': m['month'], 'day': m['day']}))
+    # Kaggle's result values; a tie (no margin) went to a super over
+    result = np.select([m['win_by_runs'] > 0, m['win_by_wickets'] > 0], ['runs', 'wickets'], default='tie')
+    # Matches are in date order, so each season's last match is its final
+    final = np.append(season[1:] != season[:-1], n > 0)
+
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1),
+        'season': season,
+        'date': dates.dt.strftime('%Y-%m-%d'),
+        'team1': teams[m['team1']],
+        'team2': teams[m['team2']],
+        'team1_code': codes[m['team1']],
+        'team2_code': codes[m['team2']],
+        'winner': teams[m['winner']],
+        'winner_code': codes[m['winner']],
+        'win_by_runs': m['win_by_runs'],
+        'win_by_wickets': m['win_by_wickets'],
+        'city': np.asarray(CITIES, dtype=object)[m['city']],
+        'venue': np.asarray(VENUES, dtype=object)[m['venue']],
+        'toss_winner': teams[m['toss_winner']],
+        'toss_decision': m['toss_decision'],
+        'target_runs': m['target_runs'],
+        'target_overs': np.where(np.isnan(m['target_runs']), np.nan, 20.0),
+        'method': np.full(n, None, dtype=object),
+        'result': result,
+        'match_type': np.where(final, 'Final', 'League')
+    })
+
+
+def _random_players(rng, seasons, teams, codes, active, players_per_team):
+    # Each squad player plays a season with probability 0.7; every third
+    # player is a bowler
+    player_team = np.repeat(np.arange(len(teams)), players_per_team)
+    plays = active[player_team] & (rng.random((len(player_team), len(seasons))) > 0.3)
+    player_idx, season_idx = np.nonzero(plays)
+    n = len(player_idx)
+    player_id = player_idx + 1
+    bowler = player_id % 3 == 0
+    team_idx = player_team[player_idx]
+
+    def pick(batsman_values, bowler_values):
+        return np.where(bowler, bowler_values, batsman_values)
+
+    players = pd.DataFrame({
+        'player_id': player_id,
+        'player_name': np.char.add('Player_', player_id.astype(str)).astype(object),
+        'team': np.asarray(teams, dtype=object)[team_idx],
+        'team_code': np.asarray(codes, dtype=object)[team_idx],
+        'season': seasons[season_idx],
+        'matches': rng.integers(5, 15, size=n),
+        'runs': pick(rng.integers(100, 700, size=n), rng.integers(20, 150, size=n)),
+        'avg': pick(rng.uniform(20, 50, size=n), rng.uniform(10, 25, size=n)),
+        'strike_rate': pick(rng.uniform(120, 170, size=n), rng.uniform(100, 140, size=n)),
+        'fifties': pick(rng.integers(0, 5, size=n), 0),
+        'hundreds': pick(rng.integers(0, 2, size=n), 0),
+        'wickets': pick(rng.integers(0, 3, size=n), rng.integers(5, 25, size=n)),
+        'economy': pick(rng.uniform(7, 12, size=n), rng.uniform(6, 10, size=n)),
+        'player_type': np.where(bowler, 'Bowler', 'Batsman')
+    })
+
+    # Raw counts consistent with the drawn rates, as player_season_stats returns
+    players['balls_faced'] = (players['runs'] * 100 / players['strike_rate']).round().astype('int32')
+    players['dismissals'] = (players['runs'] / players['avg']).round().astype('int32')
+    players['balls_bowled'] = pick(players['matches'] * 6, players['matches'] * 24).astype('int32')
+    players['runs_conceded'] = (players['economy'] * players['balls_bowled'] / 6).round().astype('int32')
+    return players.sort_values(['player_id', 'season'], ignore_index=True)
+
+
+def _random_team_performance(rng, matches_df, deliveries, seasons, teams, codes, colors, exists, banned):
+    # Wins and losses come from the generated matches; NRR comes from the
+    # deliveries when they were played out and is random otherwise
+    perf = team_season_results(matches_df, deliveries)
+    team_idx, season_idx = np.nonzero(exists)
+    grid = pd.DataFrame({
+        'team': np.asarray(teams, dtype=object)[team_idx],
+        'team_color': np.asarray(colors, dtype=object)[team_idx],
+        'season': seasons[season_idx],
+        'banned': banned[team_idx, season_idx]
+    })
+    perf = grid.merge(perf.drop(columns=['team_color', 'banned', 'title_winner']), on=['team', 'season'], how='left')
+
+    perf['team_code'] = perf['team'].map(dict(zip(teams, codes)))
+    counts = ['matches_played', 'wins', 'losses', 'points']
+    perf[counts] = perf[counts].fillna(0).astype('int64')
+    if deliveries is None:
+        perf['nrr'] = rng.uniform(-2, 2, size=len(perf))
+    perf['nrr'] = np.where(perf['banned'], 0.0, perf['nrr'].fillna(0.0))
+    perf['title_winner'] = [WINNERS_BY_YEAR.get(season) == team for season, team in zip(perf['season'], perf['team'])]
+    return perf[['team', 'team_code', 'team_color', 'season', 'matches_played', 'wins',
+                 'losses', 'points', 'nrr', 'title_winner', 'banned']]
+
+
+def generate_mock_data(seed=MOCK_SEED, num_seasons=NUM_SEASONS, num_teams=len(MOCK_TEAMS),
+                       matches_per_season=MATCHES_PER_SEASON, players_per_team=PLAYERS_PER_TEAM,
+                       with_deliveries=False):
+    """Generate mock frames as a dict: 'matches', 'players', 'team_perf' and,
+    when `with_deliveries` is set, ball-by-ball 'deliveries' in the
+    deliveries.csv schema.
+
+    With deliveries the match results are played out ball by ball and the
+    player and team tables are aggregated from them; otherwise results and
+    player figures are drawn directly.
+    """
+    if with_deliveries and players_per_team < 11:
+        raise ValueError("players_per_team must be at least 11 to generate deliveries")
+
+    rng = np.random.default_rng(seed)
+    seasons = np.arange(FIRST_SEASON, FIRST_SEASON + num_seasons)
+    teams, codes, colors = mock_teams(num_teams)
+    exists, banned = _team_season_grid(teams, seasons)
+    active = exists & ~banned
+
+    m = _mock_matches(rng, seasons, active, matches_per_season)
+    deliveries = None
+    if with_deliveries:
+        deliveries = _mock_deliveries(rng, m, teams, players_per_team)
+    else:
+        _random_results(rng, m)
+    matches_df = _matches_frame(m, seasons, teams, codes)
+
+    if with_deliveries:
+        players_df = player_season_stats(deliveries, matches_df)
+    else:
+        players_df = _random_players(rng, seasons, teams, codes, active, players_per_team)
+    team_perf_df = _random_team_performance(rng, matches_df, deliveries, seasons, teams, codes, colors, exists, banned)
+
+    data = {'matches': matches_df, 'players': players_df, 'team_perf': team_perf_df}
+    if with_deliveries:
+        data['deliveries'] = deliveries
+    return data
+
+
+def generate_mock_frames(seed=MOCK_SEED, **scale):
+    """Build mock matches, players and team performance frames."""
+    data = generate_mock_data(seed=seed, **scale)
+    return data['matches'], data['players'], data['team_perf']
+
+
+def write_mock_csvs(data, out_dir):
+    """Write generated data as matches.csv / deliveries.csv in the Kaggle schema."""
+    os.makedirs(out_dir, exist_ok=True)
+    matches = data['matches']
+    # Ties have no margin (NaN, as in the Kaggle file)
+    margin = np.select([matches['result'] == 'runs', matches['result'] == 'wickets'],
+                       [matches['win_by_runs'], matches['win_by_wickets']], default=np.nan)
+    pd.DataFrame({
+        'id': matches['id'],
+        'season': matches['season'],
+        'city': matches['city'],
+        'date': matches['date'],
+        'match_type': matches['match_type'],
+        'venue': matches['venue'],
+        'team1': matches['team1'],
+        'team2': matches['team2'],
+        'toss_winner': matches['toss_winner'],
+        'toss_decision': matches['toss_decision'],
+        'winner': matches['winner'],
+        'result': matches['result'],
+        'result_margin': margin,
+        'target_runs': matches['target_runs'],
+        'target_overs': matches['target_overs'],
+        'method': matches['method']
+    }).to_csv(os.path.join(out_dir, 'matches.csv'), index=False)
+    data['deliveries'].to_csv(os.path.join(out_dir, 'deliveries.csv'), index=False)
+
+
+def main(argv=None):
+    # Write a scaled synthetic dataset for load testing the CSV ingestion path
+    parser = argparse.ArgumentParser(description="Generate synthetic matches.csv / deliveries.csv")
+    parser.add_argument('out_dir')
+    parser.add_argument('--seed', type=int, default=MOCK_SEED)
+    parser.add_argument('--seasons', type=int, default=NUM_SEASONS)
+    parser.add_argument('--teams', type=int, default=len(MOCK_TEAMS))
+    parser.add_argument('--matches-per-season', type=int, default=MATCHES_PER_SEASON)
+    parser.add_argument('--players-per-team', type=int, default=PLAYERS_PER_TEAM)
+    args = parser.parse_args(argv)
+
+    data = generate_mock_data(seed=args.seed, num_seasons=args.seasons, num_teams=args.teams,
+                              matches_per_season=args.matches_per_season,
+                              players_per_team=args.players_per_team, with_deliveries=True)
+    write_mock_csvs(data, args.out_dir)
+    print(f"{len(data['matches'])} matches, {len(data['deliveries'])} deliveries -> {args.out_dir}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""Season and (season, team) partitions of the dashboard frames.
+
+Each frame is stably sorted by season once at load time, so a season is a
+contiguous row range and the sidebar filters become slices instead of
+boolean-mask scans over the whole frame. (season, team) and team partitions
+are stored as precomputed row positions.
+"""
+import hashlib
+import threading
+
+import numpy as np
+import pandas as pd
+
+from .aggregates import player_career_stats
+from .analysis import sort_key, top_k
+from .head_to_head import HeadToHead
+from .match_cube import MatchCube
+
+_EMPTY = np.empty(0, dtype=np.intp)
+
+
+class FrameIndex:
+    """Row offsets of one frame, per season, per (season, team) and per team."""
+
+    def __init__(self, df, team_columns):
+        order = np.argsort(df['season'].to_numpy(), kind='stable')
+        # A frame already in season order is used as is rather than copied
+        # (e.g. memory-mapped frames, see shared_frames)
+        self.frame = df if (order == np.arange(len(order))).all() else df.iloc[order]
+
+        seasons = self.frame['season'].to_numpy()
+        values, starts = np.unique(seasons, return_index=True)
+        stops = np.append(starts[1:], len(seasons))
+        self.season_bounds = {int(season): (int(start), int(stop))
+                              for season, start, stop in zip(values, starts, stops)}
+
+        # A row belongs to every team named in any of `team_columns`
+        # (team1 and team2 for matches)
+        positions = np.tile(np.arange(len(self.frame)), len(team_columns))
+        keys = pd.DataFrame({
+            'season': np.tile(seasons, len(team_columns)),
+            'team': np.concatenate([self.frame[col].astype(object).to_numpy() for col in team_columns])
+        })
+        groups = keys.groupby(['season', 'team'], sort=False).indices
+        self.season_team_rows = {(int(season), team): np.unique(positions[idx])
+                                 for (season, team), idx in groups.items()}
+
+        team_groups = keys.groupby('team', sort=False).indices
+        self.team_rows = {team: np.unique(positions[idx]) for team, idx in team_groups.items()}
+
+        # (column, ascending) -> row positions of the whole frame in that order
+        self._orders = {}
+        self._orders_lock = threading.Lock()
+
+    @property
+    def seasons(self):
+        return list(self.season_bounds)
+
+    def season(self, season):
+        start, stop = self.season_bounds.get(season, (0, 0))
+        return self.frame.iloc[start:stop]
+
+    def season_team(self, season, team):
+        return self.frame.take(self.season_team_rows.get((season, team), _EMPTY))
+
+    def team(self, team):
+        return self.frame.take(self.team_rows.get(team, _EMPTY))
+
+    def select(self, season, team=None):
+        # The sidebar filter: one season, optionally narrowed to one team
+        if team is None:
+            return self.season(season)
+        return self.season_team(season, team)
+
+    def positions(self, season, team=None):
+        if team is None:
+            return np.arange(*self.season_bounds.get(season, (0, 0)))
+        return self.season_team_rows.get((season, team), _EMPTY)
+
+    def order(self, column, ascending=True):
+        """Row positions of the whole frame stably sorted by `column` (NaN
+        last). Computed once per column and direction, then shared."""
+        with self._orders_lock:
+            order = self._orders.get((column, ascending))
+        if order is None:
+            order = np.argsort(sort_key(self.frame[column].to_numpy(), ascending), kind='stable')
+            with self._orders_lock:
+                self._orders[(column, ascending)] = order
+        return order
+
+    def select_sorted(self, season, team, column, ascending=True):
+        """select(season, team) in the order of `column`, read off the cached
+        order of the whole frame instead of sorting the selection."""
+        member = np.zeros(len(self.frame), dtype=bool)
+        member[self.positions(season, team)] = True
+        order = self.order(column, ascending)
+        return self.frame.take(order[member[order]])
+
+
+class DashboardIndex:
+    """Partition indexes over matches, players and team performance, plus
+    per-season lookups the header metrics need, per-player career lookups,
+    the head-to-head records of every pair of teams and the match cube."""
+
+    def __init__(self, matches_df, players_df, team_perf_df, careers=None):
+        self.matches = FrameIndex(matches_df, ['team1', 'team2'])
+        self.players = FrameIndex(players_df, ['team'])
+        self.team_perf = FrameIndex(team_perf_df, ['team'])
+
+        perf = self.team_perf.frame
+        champions = perf[perf['title_winner'].astype(bool)]
+        self.champions = dict(zip(champions['season'].astype(int), champions['team_code'].astype(object)))
+        self.season_teams = {season: sorted(self.team_perf.season(season)['team'].astype(object).unique())
+                             for season in self.team_perf.seasons}
+
+        # Career totals (unless given, as derived from the same players
+        # frame), and each player's season rows (in season order)
+        self.careers = player_career_stats(self.players.frame) if careers is None else careers
+        self.career_rows = dict(zip(self.careers['player_name'], range(len(self.careers))))
+        names = self.players.frame['player_name'].astype(object)
+        self.player_rows = names.groupby(names, sort=False).indices
+        self.head_to_head = HeadToHead(self.matches.frame)
+        self.match_cube = MatchCube(self.matches.frame)
+
+    @property
+    def seasons(self):
+        return sorted(set(self.matches.seasons) | set(self.team_perf.seasons))
+
+    def teams_in_season(self, season):
+        return self.season_teams.get(season, [])
+
+    def career(self, player_name):
+        """The player's careers row, or None for an unknown player."""
+        row = self.career_rows.get(player_name)
+        return None if row is None else self.careers.iloc[row]
+
+    def career_names(self):
+        return self.careers['player_name'].tolist()
+
+    def career_leaders(self, column, k, ascending=False, qualifier=None):
+        """The first `k` careers by `column` (NaN last, ties in row order).
+        `qualifier` = (column, minimum) limits them to careers reaching it."""
+        careers = self.careers
+        if qualifier is not None:
+            qualifying_column, minimum = qualifier
+            careers = careers[careers[qualifying_column] >= minimum]
+        return top_k(careers, column, k, ascending=ascending)
+
+    def title_winners(self):
+        """team_perf rows of each season's champion, in season order."""
+        perf = self.team_perf.frame
+        return perf[perf['title_winner'].astype(bool)].sort_values('season', kind='stable')
+
+    def player_seasons(self, player_name):
+        return self.players.frame.take(self.player_rows.get(player_name, _EMPTY))
+
+    def fingerprint(self):
+        """Content hash of the indexed frames, for keying caches of what is
+        derived from them (see figure_cache.FigureStore)."""
+        digest = hashlib.blake2b(digest_size=8)
+        for index in (self.matches, self.players, self.team_perf):
+            digest.update(pd.util.hash_pandas_object(index.frame, index=False).to_numpy().tobytes())
+        return digest.hexdigest()
@@ -0,0 +1,63 @@
+"""Size of the Plotly figures sent to the browser, and an opt-in compact form.
+
+st.plotly_chart sends each figure as Plotly JSON. Under IPL_PROFILE every
+chart's serialized bytes are recorded with the rerun's timings (see
+profiling), so the payload of a page can be read next to its render time.
+
+IPL_PAYLOAD=compact shrinks each figure once, when it is built, so cached
+and stored figures are sent compact:
+
+- the template's per-trace-type defaults are cut down to the trace types
+  the figure draws; the defaults of the other ~40 types never apply, yet
+  they are the larger part of most figures here
+- float64 coordinates are sent as float32 (7 significant digits, beyond
+  what an axis or hover label shows) and integer coordinates in the
+  smallest integer type that holds them
+- numeric lists are turned into arrays, which Plotly sends base64-encoded
+  instead of as JSON text
+
+The layout part of the template is kept: Streamlit's frontend fills its
+placeholder colours in with the app theme. Note that Streamlit sends a
+chart it has already sent to a session as a short reference only when the
+chart is at least global.minCachedMessageSize (10 KB) serialized.
+"""
+import os
+
+import numpy as np
+
+PAYLOAD_MODE = os.environ.get('IPL_PAYLOAD', '')  # '' or 'compact'
+# Trace properties holding plotted coordinates (formatted by the axes, so
+# float32 values display as the float64 ones would)
+COORDINATES = ('x', 'y', 'z')
+
+
+def figure_bytes(figure):
+    """Bytes of `figure` as st.plotly_chart sends it."""
+    return len(figure.to_json().encode('utf-8'))
+
+
+def _compact_array(values):
+    array = np.asarray(values) if isinstance(values, (list, tuple)) else values
+    if not isinstance(array, np.ndarray) or array.size == 0:
+        return values
+    if array.dtype.kind == 'f':
+        return array.astype(np.float32) if array.dtype.itemsize > 4 else array
+    if array.dtype.kind in 'iu':
+        return array.astype(np.promote_types(np.min_scalar_type(array.min()), np.min_scalar_type(array.max())))
+    return values
+
+
+def compact(figure):
+    """Shrink `figure`'s serialized form in place without changing how it
+    is drawn (see the module docstring). Returns the figure."""
+    for trace in figure.data:
+        for prop in COORDINATES:
+            if prop in trace and trace[prop] is not None:
+                trace[prop] = _compact_array(trace[prop])
+
+    template = figure.layout.template
+    if template is not None and template.data is not None:
+        used = {trace.type for trace in figure.data}
+        template.data = {trace_type: template.data[trace_type] for trace_type in used
+                         if template.data[trace_type]}
+    return figure
@@ -0,0 +1,182 @@
+"""Opt-in timing and profiling of dashboard reruns.
+
+With IPL_PROFILE=timing each logical section of a rerun is timed: data
+load, sidebar, filters, the page, and each chart (figure lookup/build and
+render) and table, and the serialized bytes of every chart sent are
+recorded (see payload). IPL_PROFILE=cprofile also runs cProfile over the
+rerun, up to the end of the page. The breakdown is shown in a sidebar expander, and one JSON record per
+rerun is appended to IPL_PROFILE_LOG (default ipl_profile.jsonl). The log
+can be aggregated across sessions and processes:
+
+    IPL_PROFILE=timing streamlit run ipl-dashboard-streamlit.py
+    python -m ipl_dashboard.profiling ipl_profile.jsonl
+"""
+import argparse
+import contextlib
+import cProfile
+import json
+import os
+import pstats
+import threading
+import time
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+PROFILE_MODE = os.environ.get('IPL_PROFILE', '')  # '', 'timing' or 'cprofile'
+PROFILE_LOG = os.environ.get('IPL_PROFILE_LOG', 'ipl_profile.jsonl')
+# Functions kept from a cProfile run, by cumulative time
+PROFILE_TOP = 25
+
+_LOG_LOCK = threading.Lock()
+_DISABLED = contextlib.nullcontext()
+
+
+class RerunProfiler:
+    """Section timer for one script run; a no-op unless `mode` is set."""
+
+    def __init__(self, mode=PROFILE_MODE, log_path=PROFILE_LOG):
+        self.enabled = mode in ('timing', 'cprofile')
+        self.finished = False
+        self.log_path = log_path
+        self.sections = []
+        self.payloads = []
+        self._stack = []
+        self._start = time.perf_counter()
+        self._profile = None
+        if mode == 'cprofile':
+            self._profile = cProfile.Profile()
+            try:
+                self._profile.enable()
+            except ValueError:
+                # Another session's profiler is active (one per process on 3.12+)
+                self._profile = None
+
+    @contextlib.contextmanager
+    def _timed(self, name):
+        path = '/'.join(self._stack + [name])
+        self._stack.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            self.sections.append({'section': path, 'seconds': time.perf_counter() - start})
+
+    def section(self, name):
+        # Nested sections are recorded as "outer/inner"
+        return self._timed(name) if self.enabled else _DISABLED
+
+    def payload(self, name, nbytes):
+        # Bytes of chart `name` as sent to the browser
+        self.payloads.append({'chart': name, 'bytes': nbytes})
+
+    def stop(self):
+        """Stop cProfile (safe to call more than once). Called from a finally
+        block around the page, so a run interrupted by st.rerun, st.stop or an
+        exception does not leave the process's profiler enabled."""
+        if self._profile is not None:
+            self._profile.disable()
+
+    def _profile_top(self):
+        stats = pstats.Stats(self._profile).stats
+        ranked = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:PROFILE_TOP]
+        return [
+            {'function': f"{os.path.basename(filename)}:{line}({func})", 'calls': calls,
+             'tottime': tottime, 'cumtime': cumtime}
+            for (filename, line, func), (_, calls, tottime, cumtime, _) in ranked
+        ]
+
+    def finish(self, **context):
+        """Close the run: append its record to the log and return it (None
+        when disabled). `context` (page, season, ...) is stored with it."""
+        self.finished = True
+        self.stop()
+        if not self.enabled:
+            return None
+
+        record = dict(context, timestamp=time.time(), total_s=time.perf_counter() - self._start,
+                      sections=self.sections, payloads=self.payloads,
+                      payload_bytes=sum(payload['bytes'] for payload in self.payloads))
+        if self._profile is not None:
+            record['profile'] = self._profile_top()
+        with _LOG_LOCK, open(self.log_path, 'a') as f:
+            f.write(json.dumps(record, default=str) + '\n')
+        return record
+
+
+# Shared by contexts that are not given a profiler
+NULL_PROFILER = RerunProfiler(mode='')
+
+
+def render_profile(record, figure_cache_stats=None):
+    """Sidebar breakdown of a finished run's record."""
+    with st.sidebar.expander(f"⏱️ Rerun timing ({record['total_s'] * 1000:.0f} ms)"):
+        sections = pd.DataFrame(record['sections'])
+        sections['ms'] = (sections.pop('seconds') * 1000).round(2)
+        st.dataframe(sections.sort_values('ms', ascending=False), hide_index=True, use_container_width=True)
+        if record.get('payloads'):
+            st.caption(f"Plotly payload: {len(record['payloads'])} charts, {record['payload_bytes'] / 1024:.1f} KB")
+            payloads = pd.DataFrame(record['payloads'])
+            payloads['KB'] = (payloads.pop('bytes') / 1024).round(1)
+            st.dataframe(payloads.sort_values('KB', ascending=False), hide_index=True, use_container_width=True)
+        if figure_cache_stats:
+            st.caption("Figure cache: {size}/{maxsize} figures, hit rate {hit_rate:.0%}, {store_hits} read from the store".format(**figure_cache_stats))
+        if record.get('profile'):
+            st.dataframe(pd.DataFrame(record['profile']), hide_index=True, use_container_width=True)
+
+
+def summarize(path):
+    """Per-section count, mean, p50, p95 and max (ms) over a profile log."""
+    timings = defaultdict(list)
+    with open(path) as f:
+        for line in f:
+            record = json.loads(line)
+            timings['total'].append(record['total_s'])
+            for section in record['sections']:
+                timings[section['section']].append(section['seconds'])
+
+    rows = []
+    for name, values in timings.items():
+        values = np.array(values) * 1000
+        rows.append({'section': name, 'count': len(values), 'mean_ms': values.mean(),
+                     'p50_ms': np.percentile(values, 50), 'p95_ms': np.percentile(values, 95),
+                     'max_ms': values.max()})
+    return pd.DataFrame(rows).sort_values('p95_ms', ascending=False).reset_index(drop=True)
+
+
+def summarize_payload(path):
+    """Per-chart count, mean and max serialized KB over a profile log, with
+    the per-rerun total as 'total'."""
+    sizes = defaultdict(list)
+    with open(path) as f:
+        for line in f:
+            record = json.loads(line)
+            if record.get('payloads'):
+                sizes['total'].append(record['payload_bytes'])
+            for payload in record.get('payloads', []):
+                sizes[payload['chart']].append(payload['bytes'])
+
+    rows = []
+    for name, values in sizes.items():
+        values = np.array(values) / 1024
+        rows.append({'chart': name, 'count': len(values), 'mean_kb': values.mean(), 'max_kb': values.max()})
+    return pd.DataFrame(rows, columns=['chart', 'count', 'mean_kb', 'max_kb']).sort_values(
+        'mean_kb', ascending=False).reset_index(drop=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Aggregate a dashboard profile log")
+    parser.add_argument('log', nargs='?', default=PROFILE_LOG)
+    args = parser.parse_args(argv)
+    print(summarize(args.log).round(2).to_string(index=False))
+    payload = summarize_payload(args.log)
+    if not payload.empty:
+        print()
+        print(payload.round(1).to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
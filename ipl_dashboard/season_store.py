@@ -0,0 +1,209 @@
+"""Append-only store of season aggregates for incremental ingestion.
+
+During a live season matches arrive one at a time. Instead of re-parsing
+deliveries.csv and re-aggregating every season after each match, an ingest
+parses only the new matches and appends a part holding them together with
+their additive player and team counts (see player_season_counts and
+team_season_counts in aggregates). Reading the store sums the counts of its
+parts and derives the rates, which costs a few small Parquet reads no matter
+how many seasons are stored.
+
+Parts live in <data_dir>/.ipl_store as part-NNNNN directories, numbered in
+ingestion order. compact() folds them into a base-NNNNN directory that
+supersedes every part up to its number. Parts are never modified in place.
+
+    python -m ipl_dashboard.season_store init      # seed from matches.csv / deliveries.csv
+    python -m ipl_dashboard.season_store append new_matches.csv new_deliveries.csv
+    python -m ipl_dashboard.season_store compact
+    python -m ipl_dashboard.season_store status
+"""
+import argparse
+import os
+import shutil
+
+import pandas as pd
+
+from .aggregates import (PLAYER_COUNT_COLUMNS, RESULT_COLUMNS, player_season_counts,
+                         player_stats_from_counts, team_results_from_counts, team_season_counts)
+from .data_cache import HAS_PARQUET, write_frames
+from .data_loader import (DATA_DIR, DELIVERIES_FILE, MATCHES_FILE, MATCH_DTYPES, MATCH_TEAM_COLUMNS,
+                          _concat_chunks, _share_categories, build_matches_frame, read_deliveries,
+                          read_matches)
+
+STORE_DIRNAME = '.ipl_store'
+PART_FRAMES = ('matches', 'player_counts', 'team_counts')
+PLAYER_KEYS = ['season', 'team', 'player_name']
+TEAM_KEYS = ['season', 'team']
+
+# Fold the parts into a new base once this many have accumulated
+AUTO_COMPACT_PARTS = 32
+
+
+def _number(name):
+    return int(name.split('-')[1])
+
+
+class SeasonStore:
+    """Matches and additive season counts for the dataset in `data_dir`."""
+
+    def __init__(self, data_dir=DATA_DIR):
+        self.root = os.path.join(data_dir, STORE_DIRNAME)
+
+    def _entries(self):
+        if not os.path.isdir(self.root):
+            return []
+        names = [name for name in os.listdir(self.root) if name.startswith(('part-', 'base-'))]
+        # A base sorts after the part with the same number, which it includes
+        return sorted(names, key=lambda name: (_number(name), name.startswith('base-')))
+
+    def parts(self):
+        """Directories that make up the current data: the latest base and the
+        parts appended after it."""
+        entries = self._entries()
+        bases = [name for name in entries if name.startswith('base-')]
+        if not bases:
+            return entries
+        base = bases[-1]
+        return [base] + [name for name in entries if name.startswith('part-') and _number(name) > _number(base)]
+
+    def exists(self):
+        return HAS_PARQUET and bool(self.parts())
+
+    def version(self):
+        """Name of the newest part, which changes with every ingest."""
+        parts = self.parts()
+        return parts[-1] if parts else None
+
+    def _read(self, name, frame, columns=None):
+        return pd.read_parquet(os.path.join(self.root, name, f"{frame}.parquet"), columns=columns)
+
+    def ingested_ids(self):
+        ids = [self._read(name, 'matches', columns=['id'])['id'] for name in self.parts()]
+        return set(pd.concat(ids)) if ids else set()
+
+    def _read_matches(self, name):
+        matches = self._read(name, 'matches')
+        # An all-null categorical (e.g. method in a part without D/L games)
+        # is read back from Parquet as object
+        for col in matches.columns:
+            if MATCH_DTYPES.get(col) == 'category' and not isinstance(matches[col].dtype, pd.CategoricalDtype):
+                matches[col] = matches[col].astype('str').where(matches[col].notna()).astype('category')
+        if 'match_type' not in matches.columns:
+            # Parts ingested before match types were kept count as league matches
+            matches['match_type'] = pd.Categorical([None] * len(matches))
+        return matches
+
+    def _combined(self, parts):
+        matches = _concat_chunks([self._read_matches(name) for name in parts])
+        _share_categories(matches, MATCH_TEAM_COLUMNS)
+        matches = matches.sort_values(['date', 'id']).reset_index(drop=True)
+        player_counts = pd.concat([self._read(name, 'player_counts') for name in parts], ignore_index=True)
+        player_counts = player_counts.groupby(PLAYER_KEYS, as_index=False)[PLAYER_COUNT_COLUMNS].sum()
+        team_counts = pd.concat([self._read(name, 'team_counts') for name in parts], ignore_index=True)
+        team_counts = team_counts.groupby(TEAM_KEYS, as_index=False)[RESULT_COLUMNS].sum()
+        return {'matches': matches, 'player_counts': player_counts, 'team_counts': team_counts}
+
+    def frames(self):
+        """Return (matches_df, players_df, team_perf_df) for everything ingested."""
+        combined = self._combined(self.parts())
+        matches_df = combined['matches']
+        players_df = player_stats_from_counts(combined['player_counts'])
+        team_perf_df = team_results_from_counts(combined['team_counts'], matches_df)
+        return matches_df, players_df, team_perf_df
+
+    def _write(self, kind, number, frames):
+        if not HAS_PARQUET:
+            raise RuntimeError("the season store needs pyarrow for Parquet support")
+        return write_frames(os.path.join(self.root, f"{kind}-{number:05d}"), frames)
+
+    def _next_number(self):
+        entries = self._entries()
+        return _number(entries[-1]) + 1 if entries else 1
+
+    def append(self, matches_path, deliveries_path):
+        """Ingest the matches in `matches_path` that are not stored yet, with
+        their balls from `deliveries_path`. Returns the number of new matches."""
+        raw = read_matches(matches_path)
+        raw = raw[~raw['id'].isin(self.ingested_ids())]
+        if raw.empty:
+            return 0
+
+        deliveries = read_deliveries(deliveries_path)
+        deliveries = deliveries[deliveries['match_id'].isin(raw['id'])]
+        matches = build_matches_frame(raw.reset_index(drop=True))
+        frames = {
+            'matches': matches,
+            'player_counts': player_season_counts(deliveries, matches),
+            'team_counts': team_season_counts(matches, deliveries)
+        }
+        # Concurrent ingests can race for a number; the loser takes the next one
+        while not self._write('part', self._next_number(), frames):
+            pass
+
+        if len(self.parts()) > AUTO_COMPACT_PARTS:
+            self.compact()
+        return len(matches)
+
+    def compact(self):
+        """Fold the current parts into one base and delete what it supersedes."""
+        parts = self.parts()
+        if len(parts) > 1:
+            # Numbered after the last folded part, so parts appended meanwhile stay live
+            self._write('base', _number(parts[-1]), self._combined(parts))
+        self._prune()
+
+    def _prune(self):
+        live = set(self.parts())
+        newest = _number(self.version()) if live else 0
+        for name in self._entries():
+            if name not in live and _number(name) <= newest:
+                shutil.rmtree(os.path.join(self.root, name), ignore_errors=True)
+
+    def init(self, data_dir):
+        """Seed the store from the full matches.csv / deliveries.csv in
+        `data_dir`. The new base supersedes anything stored before."""
+        raw = read_matches(os.path.join(data_dir, MATCHES_FILE))
+        deliveries = read_deliveries(os.path.join(data_dir, DELIVERIES_FILE))
+        matches = build_matches_frame(raw)
+        frames = {
+            'matches': matches,
+            'player_counts': player_season_counts(deliveries, matches),
+            'team_counts': team_season_counts(matches, deliveries)
+        }
+        while not self._write('base', self._next_number(), frames):
+            pass
+        self._prune()
+        return len(matches)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Incrementally ingest IPL matches into the season store")
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('init', help="seed the store from matches.csv / deliveries.csv in --data-dir")
+    append = commands.add_parser('append', help="ingest new matches and their deliveries")
+    append.add_argument('matches_csv')
+    append.add_argument('deliveries_csv')
+    commands.add_parser('compact', help="fold the appended parts into one base")
+    commands.add_parser('status', help="show what the store holds")
+    args = parser.parse_args(argv)
+
+    store = SeasonStore(args.data_dir)
+    if args.command == 'init':
+        print(f"stored {store.init(args.data_dir)} matches")
+    elif args.command == 'append':
+        print(f"ingested {store.append(args.matches_csv, args.deliveries_csv)} new matches")
+    elif args.command == 'compact':
+        store.compact()
+        print(f"compacted into {store.version()}")
+    elif not store.exists():
+        print("no season store in", args.data_dir)
+    else:
+        matches_df, _, _ = store.frames()
+        print(f"parts: {len(store.parts())} ({store.version()})")
+        print(f"matches: {len(matches_df)}, seasons {matches_df['season'].min()}-{matches_df['season'].max()}, "
+              f"last match {matches_df['date'].iloc[-1]}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+"""Memory-mapped dashboard frames shared by every Streamlit process.
+
+By default each process loads the frames itself (Parquet cache, season
+store or CSV parse) and holds a private copy of them. With IPL_BACKEND=mmap
+the frames are read from uncompressed Arrow IPC files that are written once
+and memory-mapped read-only by every process. Numeric, date, string and
+categorical-code columns are used in place of the mapped bytes, so the
+processes share one copy through the OS page cache. A new process maps the
+files instead of loading and compacting the data.
+
+    python -m ipl_dashboard.shared_frames build          # writes <data dir>/.ipl_frames/
+    IPL_BACKEND=mmap streamlit run ipl-dashboard-streamlit.py
+
+Layout of the frames directory:
+
+    current.json                  the current build, its fingerprint and row counts
+    <build>/<frame>.arrow         one file per frame
+
+The files are written in season order with the players' career table, as
+partition_index.DashboardIndex would derive them, so building the index
+does not copy them. A rebuild writes a new build directory and then
+replaces current.json. Running dashboards pick it up on their next rerun.
+Processes still mapping the old files keep them until they do.
+"""
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import pandas as pd
+
+from .data_loader import DATA_DIR, load_frames
+from .partition_index import DashboardIndex
+
+FRAMES_DIRNAME = '.ipl_frames'
+CURRENT_FILE = 'current.json'
+# Frames of a build, by file name
+FRAMES = ('matches', 'players', 'team_perf', 'careers')
+
+
+def use_mapped_frames():
+    return os.environ.get('IPL_BACKEND', 'memory') == 'mmap'
+
+
+def frames_path(data_dir=DATA_DIR):
+    return os.environ.get('IPL_FRAMES_PATH', os.path.join(data_dir, FRAMES_DIRNAME))
+
+
+def read_current(path=None):
+    """The current build's record from current.json, or None before the first build."""
+    try:
+        with open(os.path.join(path or frames_path(), CURRENT_FILE), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def frames_version(path=None):
+    """Id of the current build, which changes on a rebuild; None without one."""
+    current = read_current(path)
+    return current['build'] if current else None
+
+
+def _arrow_table(df):
+    # pyarrow is imported on first use, like Parquet in data_cache
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # NaN stays a float value rather than becoming a null, so float columns
+    # map without being copied to fill the nulls back in
+    for i, col in enumerate(df.columns):
+        if pd.api.types.is_float_dtype(df[col].dtype):
+            table = table.set_column(i, table.field(i), pa.array(df[col].to_numpy(), from_pandas=False))
+    return table
+
+
+def build_frames(path=None, data_dir=DATA_DIR):
+    """Write the dashboard frames for `data_dir` as a new build under `path`
+    and make it current. Returns the build's record."""
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    path = path or frames_path(data_dir)
+    matches_df, players_df, team_perf_df, *_ = load_frames(data_dir)
+    index = DashboardIndex(matches_df, players_df, team_perf_df)
+    frames = {'matches': index.matches.frame, 'players': index.players.frame,
+              'team_perf': index.team_perf.frame, 'careers': index.careers}
+
+    os.makedirs(path, exist_ok=True)
+    build = f"{time.strftime('%Y%m%d%H%M%S')}-{os.getpid()}"
+    staging = tempfile.mkdtemp(dir=path, prefix='.tmp-')
+    os.chmod(staging, 0o755)
+    try:
+        for name, df in frames.items():
+            table = _arrow_table(df.reset_index(drop=True))
+            with pa.OSFile(os.path.join(staging, f"{name}.arrow"), 'wb') as sink:
+                with ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+        os.replace(staging, os.path.join(path, build))
+    except Exception:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    # Switch readers over with one rename, then drop the older builds
+    current = {'build': build, 'fingerprint': index.fingerprint(),
+               'rows': {name: len(df) for name, df in frames.items()}}
+    fd, pointer = tempfile.mkstemp(dir=path, prefix='.tmp-')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(current, f)
+    os.chmod(pointer, 0o644)
+    os.replace(pointer, os.path.join(path, CURRENT_FILE))
+    for name in os.listdir(path):
+        if name not in (build, CURRENT_FILE) and not name.startswith('.tmp-'):
+            shutil.rmtree(os.path.join(path, name), ignore_errors=True)
+    return current
+
+
+def map_frames(path, build):
+    """The frames of `build` under `path`, backed by read-only memory maps."""
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    frames = {}
+    for name in FRAMES:
+        source = pa.memory_map(os.path.join(path, build, f"{name}.arrow"))
+        # One block per column: consolidating same-typed columns would copy them
+        frames[name] = ipc.open_file(source).read_all().to_pandas(split_blocks=True)
+    return frames
+
+
+class MappedDashboardIndex(DashboardIndex):
+    """DashboardIndex over the current build of mapped frames at `path`."""
+
+    def __init__(self, path):
+        current = read_current(path)
+        if current is None:
+            raise FileNotFoundError(f"No mapped frames under {path}; run `python -m ipl_dashboard.shared_frames build`")
+        frames = map_frames(path, current['build'])
+        super().__init__(frames['matches'], frames['players'], frames['team_perf'], careers=frames['careers'])
+        self.path = path
+        self.build = current['build']
+        self._fingerprint = current['fingerprint']
+
+    def fingerprint(self):
+        # Hashed when the build was written, so figure stores are shared
+        # with the in-memory backend over the same data
+        return self._fingerprint
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write the memory-mapped frames for IPL_BACKEND=mmap")
+    parser.add_argument('command', choices=['build'])
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    parser.add_argument('--path', help=f"frames directory (default: $IPL_FRAMES_PATH or <data dir>/{FRAMES_DIRNAME})")
+    args = parser.parse_args(argv)
+
+    path = args.path or frames_path(args.data_dir)
+    start = time.perf_counter()
+    current = build_frames(path, args.data_dir)
+    for name, count in current['rows'].items():
+        print(f"{name:>12}: {count} rows")
+    build_dir = os.path.join(path, current['build'])
+    size = sum(os.path.getsize(os.path.join(build_dir, name)) for name in os.listdir(build_dir))
+    print(f"wrote build {current['build']} to {path} in {time.perf_counter() - start:.1f}s ({size / 1e6:.1f} MB)")
+
+    start = time.perf_counter()
+    MappedDashboardIndex(path)
+    print(f"a new process attaches in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,298 @@
+"""Optional SQLite backend for the dashboard slices.
+
+Instead of each Streamlit process holding the frames, the matches,
+deliveries and derived players / team performance / career tables live in
+one SQLite file. Its indexes cover season, team, player and match id. The dashboard
+pages get their rows from parameterized queries through SqlDashboardIndex,
+which has the same interface as partition_index.DashboardIndex. Resident
+memory then no longer grows with the ball-by-ball history, and any number of
+processes can read the same file.
+
+    python -m ipl_dashboard.sql_backend build           # writes <data dir>/ipl.sqlite
+    IPL_BACKEND=sqlite streamlit run ipl-dashboard-streamlit.py
+"""
+import argparse
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+
+from .aggregates import player_career_stats
+from .data_loader import DATA_DIR, DELIVERIES_FILE, has_real_data, load_frames, read_deliveries, uses_mock_data
+from .head_to_head import HeadToHead
+from .match_cube import MatchCube
+from .mock_data import generate_mock_data
+
+DB_FILE = 'ipl.sqlite'
+
+# Index name -> (table, columns)
+INDEXES = {
+    'matches_id': ('matches', 'id'),
+    'matches_season': ('matches', 'season'),
+    'matches_team1': ('matches', 'team1, season'),
+    'matches_team2': ('matches', 'team2, season'),
+    'players_season_team': ('players', 'season, team'),
+    'players_team': ('players', 'team'),
+    'players_name': ('players', 'player_name'),
+    'careers_name': ('careers', 'player_name'),
+    'team_perf_season_team': ('team_perf', 'season, team'),
+    'team_perf_team': ('team_perf', 'team'),
+    'deliveries_match': ('deliveries', 'match_id'),
+    'deliveries_season_batting': ('deliveries', 'season, batting_team'),
+    'deliveries_season_bowling': ('deliveries', 'season, bowling_team'),
+    'deliveries_batter': ('deliveries', 'batter'),
+    'deliveries_bowler': ('deliveries', 'bowler')
+}
+
+# SQLite stores booleans as integers
+BOOL_COLUMNS = {'team_perf': ['title_winner', 'banned']}
+
+
+def use_sql_backend():
+    return os.environ.get('IPL_BACKEND', 'memory') == 'sqlite'
+
+
+def database_path(data_dir=DATA_DIR):
+    return os.environ.get('IPL_DB_PATH', os.path.join(data_dir, DB_FILE))
+
+
+def database_version(path=None):
+    """Modification time of the database file, which changes on a rebuild."""
+    path = path or database_path()
+    return os.path.getmtime(path) if os.path.exists(path) else None
+
+
+def _connect(path, read_only=True):
+    if read_only:
+        return sqlite3.connect(f"file:{quote(os.path.abspath(path))}?mode=ro", uri=True)
+    return sqlite3.connect(path)
+
+
+def _sql_frame(df):
+    # Categoricals are written as their values
+    return df.astype({col: object for col in df.columns if isinstance(df[col].dtype, pd.CategoricalDtype)})
+
+
+def build_database(path=None, data_dir=DATA_DIR):
+    """Write the dashboard tables for `data_dir` to the SQLite file at `path`.
+
+    The tables come from load_frames() (season store, CSVs or mock data); the
+    deliveries from deliveries.csv, or from the mock generator when mock data
+    is used. The file is built next to `path` and renamed into place, so
+    running dashboards keep reading the old file until the new one is complete.
+    """
+    path = path or database_path(data_dir)
+    # Mock data is generated once, for the tables and the deliveries alike
+    mock_data = generate_mock_data(with_deliveries=True) if uses_mock_data(data_dir) else None
+    matches_df, players_df, team_perf_df, *_ = load_frames(data_dir, mock_data=mock_data)
+    if mock_data is not None:
+        deliveries = mock_data['deliveries']
+    elif has_real_data(data_dir):
+        deliveries = read_deliveries(os.path.join(data_dir, DELIVERIES_FILE))
+    else:
+        deliveries = None
+
+    tables = {'matches': matches_df, 'players': players_df, 'team_perf': team_perf_df,
+              'careers': player_career_stats(players_df)}
+    if deliveries is not None:
+        season_by_match = pd.Series(matches_df['season'].to_numpy(), index=matches_df['id'].to_numpy())
+        deliveries = deliveries.assign(season=season_by_match.reindex(deliveries['match_id'].to_numpy()).to_numpy())
+        tables['deliveries'] = deliveries
+
+    staging = f"{path}.tmp-{os.getpid()}"
+    if os.path.exists(staging):
+        os.remove(staging)
+    conn = _connect(staging, read_only=False)
+    try:
+        for name, df in tables.items():
+            # Rows are stored in season order (stable), so ORDER BY rowid
+            # returns them as partition_index.FrameIndex would
+            if 'season' in df.columns:
+                df = df.iloc[np.argsort(df['season'].to_numpy(), kind='stable')]
+            _sql_frame(df).to_sql(name, conn, index=False, chunksize=100_000)
+        for index, (table, columns) in INDEXES.items():
+            if table in tables:
+                conn.execute(f"CREATE INDEX {index} ON {table} ({columns})")
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(staging, path)
+    return {name: len(df) for name, df in tables.items()}
+
+
+class SqlFrameIndex:
+    """Query-backed counterpart of partition_index.FrameIndex for one table."""
+
+    def __init__(self, backend, table, team_columns):
+        self.backend = backend
+        self.table = table
+        self.team_columns = team_columns
+        self.seasons = [row[0] for row in backend.execute(f"SELECT DISTINCT season FROM {table} ORDER BY season")]
+
+    def _where(self, condition='', params=()):
+        where = f" WHERE {condition}" if condition else ''
+        return self.backend.query(f"SELECT * FROM {self.table}{where} ORDER BY rowid", params, self.table)
+
+    def _team_condition(self):
+        return '(' + ' OR '.join(f"{col} = ?" for col in self.team_columns) + ')'
+
+    @property
+    def frame(self):
+        # Every row; only pages showing all seasons need this
+        return self._where()
+
+    def season(self, season):
+        return self._where('season = ?', (season,))
+
+    def season_team(self, season, team):
+        return self._where(f"season = ? AND {self._team_condition()}", (season,) + (team,) * len(self.team_columns))
+
+    def team(self, team):
+        return self._where(self._team_condition(), (team,) * len(self.team_columns))
+
+    def select(self, season, team=None):
+        if team is None:
+            return self.season(season)
+        return self.season_team(season, team)
+
+    def select_sorted(self, season, team, column, ascending=True):
+        # Same order as FrameIndex.select_sorted: NaN last, ties in row order
+        if column not in self.backend.columns(self.table):
+            raise KeyError(column)
+        condition, params = 'season = ?', (season,)
+        if team is not None:
+            condition += f" AND {self._team_condition()}"
+            params += (team,) * len(self.team_columns)
+        direction = 'ASC' if ascending else 'DESC'
+        return self.backend.query(
+            f"SELECT * FROM {self.table} WHERE {condition} ORDER BY {column} {direction} NULLS LAST, rowid",
+            params, self.table
+        )
+
+
+class SqlDashboardIndex:
+    """Same interface as partition_index.DashboardIndex, answered from the
+    SQLite file at `path`. Connections are read-only, one per thread."""
+
+    def __init__(self, path):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No SQLite database at {path}; run `python -m ipl_dashboard.sql_backend build`")
+        self.path = path
+        self._local = threading.local()
+        self._derived = {}
+        self._derived_lock = threading.Lock()
+        self.matches = SqlFrameIndex(self, 'matches', ['team1', 'team2'])
+        self.players = SqlFrameIndex(self, 'players', ['team'])
+        self.team_perf = SqlFrameIndex(self, 'team_perf', ['team'])
+
+        self.champions = dict(self.execute(
+            "SELECT season, team_code FROM team_perf WHERE title_winner ORDER BY season"))
+        self.season_teams = {}
+        for season, team in self.execute("SELECT DISTINCT season, team FROM team_perf ORDER BY season, team"):
+            self.season_teams.setdefault(season, []).append(team)
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = _connect(self.path)
+        return conn
+
+    def columns(self, table):
+        return [row[1] for row in self.execute(f"PRAGMA table_info({table})")]
+
+    def execute(self, sql, params=()):
+        return self._connection().execute(sql, params).fetchall()
+
+    def query(self, sql, params=(), table=None):
+        df = pd.read_sql_query(sql, self._connection(), params=params)
+        for col in BOOL_COLUMNS.get(table, []):
+            df[col] = df[col].astype(bool)
+        return df
+
+    def _has_table(self, name):
+        return bool(self.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)))
+
+    def career(self, player_name):
+        careers = self.query("SELECT * FROM careers WHERE player_name = ?", (player_name,))
+        return None if careers.empty else careers.iloc[0]
+
+    def career_names(self):
+        return [row[0] for row in self.execute("SELECT player_name FROM careers ORDER BY rowid")]
+
+    def career_leaders(self, column, k, ascending=False, qualifier=None):
+        # Same rows and order as DashboardIndex.career_leaders
+        columns = self.columns('careers')
+        if column not in columns or (qualifier is not None and qualifier[0] not in columns):
+            raise KeyError(column)
+        condition, params = '', ()
+        if qualifier is not None:
+            condition, params = f" WHERE {qualifier[0]} >= ?", (qualifier[1],)
+        direction = 'ASC' if ascending else 'DESC'
+        return self.query(
+            f"SELECT * FROM careers{condition} ORDER BY {column} {direction} NULLS LAST, rowid LIMIT ?",
+            params + (k,)
+        )
+
+    def title_winners(self):
+        return self.query("SELECT * FROM team_perf WHERE title_winner ORDER BY season, rowid", table='team_perf')
+
+    def _from_matches(self, build):
+        # Built from one read of the matches table, the first time a page needs it
+        with self._derived_lock:
+            if build not in self._derived:
+                self._derived[build] = build(self.matches.frame)
+            return self._derived[build]
+
+    @property
+    def head_to_head(self):
+        return self._from_matches(HeadToHead)
+
+    @property
+    def match_cube(self):
+        return self._from_matches(MatchCube)
+
+    def player_seasons(self, player_name):
+        return self.query("SELECT * FROM players WHERE player_name = ? ORDER BY rowid", (player_name,), 'players')
+
+    def deliveries(self, match_id):
+        """Ball-by-ball rows of one match (empty if the database has none)."""
+        if not self._has_table('deliveries'):
+            return pd.DataFrame()
+        return self.query("SELECT * FROM deliveries WHERE match_id = ? ORDER BY rowid", (match_id,))
+
+    @property
+    def seasons(self):
+        return sorted(set(self.matches.seasons) | set(self.team_perf.seasons))
+
+    def teams_in_season(self, season):
+        return self.season_teams.get(season, [])
+
+    def fingerprint(self):
+        # The file is only ever replaced whole, so path, size and mtime identify its contents
+        stat = os.stat(self.path)
+        identity = f"{os.path.abspath(self.path)}:{stat.st_size}:{stat.st_mtime_ns}"
+        return hashlib.blake2b(identity.encode(), digest_size=8).hexdigest()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the SQLite backend for the dashboard")
+    parser.add_argument('command', choices=['build'])
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    parser.add_argument('--db', help=f"database file (default: $IPL_DB_PATH or <data dir>/{DB_FILE})")
+    args = parser.parse_args(argv)
+
+    path = args.db or database_path(args.data_dir)
+    start = time.perf_counter()
+    rows = build_database(path, args.data_dir)
+    for name, count in rows.items():
+        print(f"{name:>12}: {count} rows")
+    print(f"wrote {path} in {time.perf_counter() - start:.1f}s ({os.path.getsize(path) / 1e6:.1f} MB)")
+
+
+if __name__ == '__main__':
+    main()
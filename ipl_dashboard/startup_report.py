@@ -0,0 +1,147 @@
+"""Cold-start time report for the dashboard.
+
+Imports the dashboard's modules in a fresh interpreter under
+``python -X importtime``, timing each import statement and listing the
+heaviest packages it pulled in, then times the data load. Page modules are
+imported last, so their cost shows what the first visit to each page adds.
+
+    python -m ipl_dashboard.startup_report
+    python -m ipl_dashboard.startup_report --import-budget-ms 1500 --json
+"""
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from .views import PAGES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, 'ipl-dashboard-streamlit.py')
+
+
+def startup_modules(script=SCRIPT):
+    """Third-party and ipl_dashboard modules the main script imports at
+    the top level, in order (standard library modules are left out)."""
+    with open(script, encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names = [node.module]
+        else:
+            continue
+        modules += [name for name in names
+                    if name.split('.')[0] not in sys.stdlib_module_names and name not in modules]
+    return modules
+
+
+# Imported by the main script on every cold start, in order
+STARTUP_MODULES = startup_modules()
+PAGE_MODULES = [f"ipl_dashboard.views.{module}" for module in PAGES.values()]
+
+MARKER = '#startup-report '
+
+# Runs in the child interpreter: time each import, then the data load
+_CHILD = """
+import importlib, json, sys, time
+timings = []
+for name in sys.argv[1:]:
+    sys.stderr.write('%s' + name + '\\n'); sys.stderr.flush()
+    start = time.perf_counter()
+    importlib.import_module(name)
+    timings.append((name, (time.perf_counter() - start) * 1000))
+sys.stderr.write('%s<end>\\n'); sys.stderr.flush()
+from ipl_dashboard.data_loader import LAST_LOAD_STATS, load_frames
+start = time.perf_counter()
+load_frames()
+load_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({'imports': timings, 'load_ms': load_ms, 'load_source': LAST_LOAD_STATS.get('source')}))
+""" % (MARKER, MARKER)
+
+
+def _heaviest_packages(importtime_lines, top):
+    # Sum "self" time per top-level package for the lines of one statement
+    per_package = defaultdict(int)
+    for line in importtime_lines:
+        parts = line.split('|')
+        if len(parts) != 3 or not parts[0].startswith('import time:'):
+            continue
+        try:
+            self_us = int(parts[0].split(':')[1])
+        except ValueError:
+            continue  # the header line
+        package = parts[2].strip().split('.')[0]
+        per_package[package] += self_us
+    ranked = sorted(per_package.items(), key=lambda item: item[1], reverse=True)[:top]
+    return [(package, us / 1000) for package, us in ranked]
+
+
+def run_report(modules, top=5):
+    """Import `modules` in a fresh interpreter and return the timing report."""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _CHILD] + list(modules),
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+    groups = defaultdict(list)
+    current = None
+    for line in proc.stderr.splitlines():
+        if line.startswith(MARKER):
+            current = line[len(MARKER):]
+        elif current is not None:
+            groups[current].append(line)
+
+    child = json.loads(proc.stdout.strip().splitlines()[-1])
+    imports = [
+        {'module': name, 'ms': ms, 'heaviest': _heaviest_packages(groups[name], top)}
+        for name, ms in child['imports']
+    ]
+    return {
+        'imports': imports,
+        'startup_import_ms': sum(item['ms'] for item in imports if item['module'] not in PAGE_MODULES),
+        'page_import_ms': {item['module']: item['ms'] for item in imports if item['module'] in PAGE_MODULES},
+        'load_ms': child['load_ms'],
+        'load_source': child['load_source']
+    }
+
+
+def print_report(report):
+    print(f"{'import':<42}{'ms':>9}  heaviest packages (self ms)")
+    for item in report['imports']:
+        heaviest = ', '.join(f"{package} {ms:.0f}" for package, ms in item['heaviest'])
+        print(f"{item['module']:<42}{item['ms']:>9.1f}  {heaviest}")
+    print(f"{'startup imports total':<42}{report['startup_import_ms']:>9.1f}")
+    print(f"{'data load (' + str(report['load_source']) + ')':<42}{report['load_ms']:>9.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report dashboard cold-start time per import")
+    parser.add_argument('--top', type=int, default=5, help="heaviest packages listed per import")
+    parser.add_argument('--json', action='store_true', help="print the report as JSON")
+    parser.add_argument('--import-budget-ms', type=float, help="fail if startup imports exceed this")
+    parser.add_argument('--load-budget-ms', type=float, help="fail if the data load exceeds this")
+    args = parser.parse_args(argv)
+
+    report = run_report(STARTUP_MODULES + PAGE_MODULES, top=args.top)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+    over_budget = []
+    if args.import_budget_ms is not None and report['startup_import_ms'] > args.import_budget_ms:
+        over_budget.append(f"startup imports {report['startup_import_ms']:.0f} ms > {args.import_budget_ms:.0f} ms")
+    if args.load_budget_ms is not None and report['load_ms'] > args.load_budget_ms:
+        over_budget.append(f"data load {report['load_ms']:.0f} ms > {args.load_budget_ms:.0f} ms")
+    for message in over_budget:
+        print(f"over budget: {message}", file=sys.stderr)
+    return 1 if over_budget else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
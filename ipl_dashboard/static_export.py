@@ -0,0 +1,318 @@
+"""Headless export of every (season, team, analysis type) view as a static site.
+
+Each page module is rendered outside a Streamlit server with an
+ExportContext, which collects what a page draws (its HTML blocks such as
+metric cards, Plotly figures and tables) in order instead of sending it to a
+browser. The result can be served from GitHub
+Pages or any CDN, leaving the Streamlit server for interactive use:
+
+    python -m ipl_dashboard.static_export --output site
+
+Layout of the output directory:
+
+    index.html, nav.js, style.css, plotly.min.js, manifest.json
+    template.json                        the Plotly template every figure uses
+    figures/<hash>.json                  one file per distinct figure
+    <season>/<team>/<page>.html          the page as the dashboard draws it
+    <season>/<team>/<page>.json          its metrics, figures and tables as data
+
+Figures are content-addressed, so a chart shared by many views (e.g. the
+all-seasons Historical Trends charts) is written and downloaded once. They
+are built with Plotly's own template (the app's 'streamlit' template uses
+placeholder colours only its frontend fills in), which is written once as
+template.json instead of into every figure file. IPL_PAYLOAD=compact
+applies to the figure files as it does to the app (see payload).
+In-page options (trend type, player type, sort order) are exported at their
+defaults.
+"""
+import argparse
+import contextlib
+import hashlib
+import html
+import json
+import logging
+import os
+import re
+import shutil
+import time
+
+import plotly.io as pio
+import streamlit as st
+from plotly.offline import get_plotlyjs
+
+from .analysis import season_trends
+from .data_loader import DATA_DIR, load_frames
+from .figure_cache import FigureCache
+from .partition_index import DashboardIndex
+from .views import PAGES, ViewContext, filter_state, render_page
+
+ALL_TEAMS = "All Teams"
+# Large enough to keep every figure of an export, so shared charts are built once
+EXPORT_FIGURE_CACHE_SIZE = 100_000
+# Plotly template of the exported figures, shared through template.json
+EXPORT_TEMPLATE = 'plotly'
+
+STYLE = """
+body { font-family: sans-serif; margin: 0 auto; max-width: 1200px; padding: 1rem; color: #262730; }
+h1 { color: #0066cc; text-align: center; border-bottom: 2px solid #f0f2f6; padding-bottom: 1rem; }
+.sub-header, h2 { color: #0066cc; }
+nav { display: flex; gap: 1rem; justify-content: center; margin-bottom: 1.5rem; }
+.metric-card { display: inline-block; vertical-align: top; min-width: 18%; margin: 0.5rem;
+               background: #f8f9fa; border-radius: 8px; padding: 1rem; text-align: center; }
+.info { background: #e8f0fe; border-radius: 5px; padding: 1rem; }
+.caption { font-size: 0.85rem; color: #6c757d; }
+.metric-value { font-size: 2rem; font-weight: 700; color: #0066cc; }
+.metric-label { font-size: 0.9rem; color: #6c757d; }
+.banned-notice { background: #ffe0e0; border-left: 5px solid #ff0000; padding: 15px; margin: 20px 0;
+                 font-weight: bold; color: #d32f2f; text-align: center; }
+.chart { min-height: 400px; margin: 1rem 0; }
+table.dataframe { border-collapse: collapse; font-size: 0.9rem; width: 100%; }
+table.dataframe th, table.dataframe td { border-bottom: 1px solid #f0f2f6; padding: 4px 8px; text-align: right; }
+"""
+
+# Builds the season / team / page selectors from manifest.json and draws
+# every .chart element from its figure file and the shared template
+NAV_JS = """
+const body = document.body.dataset;
+fetch(body.root + 'manifest.json').then(r => r.json()).then(manifest => {
+  const nav = document.querySelector('nav');
+  const view = {season: body.season || String(manifest.seasons.at(-1).season),
+                team: body.team || 'all-teams', page: body.page || manifest.pages[0].slug};
+  const select = (name, options) => {
+    const el = document.createElement('select');
+    for (const [value, label] of options) el.add(new Option(label, value, false, value === view[name]));
+    el.onchange = () => {
+      view[name] = el.value;
+      const season = manifest.seasons.find(s => String(s.season) === view.season);
+      if (!season.teams.some(t => t.slug === view.team)) view.team = 'all-teams';
+      location.href = `${body.root}${view.season}/${view.team}/${view.page}.html`;
+    };
+    nav.append(el);
+  };
+  const season = manifest.seasons.find(s => String(s.season) === view.season);
+  select('season', manifest.seasons.map(s => [String(s.season), String(s.season)]));
+  select('team', season.teams.map(t => [t.slug, t.name]));
+  select('page', manifest.pages.map(p => [p.slug, p.name]));
+});
+const template = fetch(body.root + 'template.json').then(r => r.json());
+document.querySelectorAll('.chart').forEach(el =>
+  Promise.all([template, fetch(el.dataset.figure).then(r => r.json())]).then(([template, fig]) =>
+    Plotly.newPlot(el, fig.data, {...fig.layout, template}, {responsive: true})));
+"""
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<link rel="stylesheet" href="{root}style.css">
+<script src="{root}plotly.min.js"></script>
+</head>
+<body data-root="{root}" data-season="{season}" data-team="{team}" data-page="{page}">
+<h1>🏏 IPL Dashboard (2008-2024)</h1>
+<nav></nav>
+{content}
+<script src="{root}nav.js"></script>
+</body>
+</html>
+"""
+
+
+def slug(name):
+    return re.sub(r'[^a-z0-9]+', '-', str(name).lower()).strip('-')
+
+
+class ExportContext(ViewContext):
+    """ViewContext that collects what a page draws, in order, as
+    (kind, name, value) elements instead of rendering it."""
+
+    def __init__(self, figure_cache, **state):
+        super().__init__(figure_cache, **state)
+        self.elements = []
+
+    def plot(self, name, build, *options, key=None):
+        self.elements.append(('figure', name, self.figure(name, build, *options, key=key)))
+
+    def dataframe(self, name, data, **kwargs):
+        self.elements.append(('table', name, data))
+
+    def fragment(self, name, render_section):
+        # Fragments need a script run; outside one st.fragment skips the call
+        render_section(self)
+
+    def elements_of(self, kind):
+        return [(name, value) for element_kind, name, value in self.elements if element_kind == kind]
+
+
+def quiet_bare_mode():
+    # Pages rendered outside `streamlit run` have no session: widgets return
+    # their defaults and every call logs "missing ScriptRunContext". (A
+    # filter, because Streamlit resets its loggers' levels when it reads its
+    # config)
+    logging.getLogger('streamlit.runtime.scriptrunner_utils.script_run_context').addFilter(
+        lambda record: 'missing ScriptRunContext' not in record.getMessage())
+
+
+@contextlib.contextmanager
+def plotly_template(name):
+    # Figures built inside use template `name` by default
+    original = pio.templates.default
+    pio.templates.default = name
+    try:
+        yield
+    finally:
+        pio.templates.default = original
+
+
+@contextlib.contextmanager
+def capture_streamlit(ctx):
+    # Pages write their HTML blocks (headers, metric cards), notices and
+    # captions with st.markdown / st.info / st.caption; record them on `ctx`
+    # for the duration of a render
+    originals = st.markdown, st.info, st.caption
+    st.markdown = lambda body, *args, **kwargs: ctx.elements.append(('html', None, body))
+    st.info = lambda body, *args, **kwargs: ctx.elements.append(('info', None, body))
+    st.caption = lambda body, *args, **kwargs: ctx.elements.append(('caption', None, body))
+    try:
+        yield ctx
+    finally:
+        st.markdown, st.info, st.caption = originals
+
+
+class SiteWriter:
+    """Writes views and their figures under `output`."""
+
+    def __init__(self, output):
+        self.output = output
+        self.figure_files = {}
+        self.bytes_written = 0
+
+    def write(self, path, text):
+        full_path = os.path.join(self.output, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        self.bytes_written += len(text.encode('utf-8'))
+
+    def figure_path(self, figure):
+        # Serialized once per figure object, without its template (every
+        # figure is built with the one in template.json); identical figures
+        # share a file
+        cached = self.figure_files.get(id(figure))
+        if cached is not None:
+            return cached[1]
+        spec = figure.to_plotly_json()
+        spec['layout'].pop('template', None)
+        text = pio.to_json(spec, validate=False)
+        path = f"figures/{hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]}.json"
+        if not os.path.exists(os.path.join(self.output, path)):
+            self.write(path, text)
+        self.figure_files[id(figure)] = (figure, path)
+        return path
+
+    def write_view(self, ctx, page_slug):
+        root = '../../'
+        view_dir = f"{ctx.selected_year}/{slug(ctx.selected_team)}"
+        figure_paths = {id(figure): self.figure_path(figure) for _, figure in ctx.elements_of('figure')}
+
+        view = {
+            'season': ctx.selected_year,
+            'team': ctx.selected_team,
+            'analysis_type': ctx.analysis_type,
+            'is_team_banned': ctx.is_team_banned,
+            'metrics': {
+                'matches': len(ctx.filtered_matches),
+                'teams': len(ctx.active_teams_in_year),
+                'champion': ctx.champion,
+                'most_wins': ctx.most_wins
+            },
+            'figures': [{'name': name, 'path': figure_paths[id(figure)]} for name, figure in ctx.elements_of('figure')],
+            'tables': {name: json.loads(data.to_json(orient='records', date_format='iso'))
+                       for name, data in ctx.elements_of('table')}
+        }
+        self.write(f"{view_dir}/{page_slug}.json", json.dumps(view, default=str))
+
+        content = []
+        # The dashboard shows the notice above every page; Team Analysis
+        # draws its own
+        if ctx.is_team_banned and not any('banned-notice' in value for _, value in ctx.elements_of('html')):
+            content.append(f'<div class="banned-notice">{html.escape(ctx.selected_team)} was banned from IPL '
+                           f'in {ctx.selected_year}</div>')
+        for kind, name, value in ctx.elements:
+            if kind == 'html':
+                content.append(value)
+            elif kind == 'info':
+                content.append(f'<div class="info">{html.escape(value)}</div>')
+            elif kind == 'caption':
+                content.append(f'<p class="caption">{html.escape(value)}</p>')
+            elif kind == 'figure':
+                content.append(f'<div class="chart" data-figure="{root}{figure_paths[id(value)]}"></div>')
+            else:
+                content.append(value.to_html(index=False, border=0, classes='dataframe', na_rep='',
+                                             float_format='{:.2f}'.format))
+
+        self.write(f"{view_dir}/{page_slug}.html", PAGE_TEMPLATE.format(
+            title=html.escape(f"IPL {ctx.selected_year} · {ctx.selected_team} · {ctx.analysis_type}"),
+            root=root, season=ctx.selected_year, team=slug(ctx.selected_team), page=page_slug,
+            content='\n'.join(content)
+        ))
+
+
+def export_site(output, data_dir=DATA_DIR, seasons=None):
+    """Render every (season, team, analysis type) view into `output`.
+    Returns (views, figures, bytes written)."""
+    quiet_bare_mode()
+    matches_df, players_df, team_perf_df, _, _, banned_teams = load_frames(data_dir)
+    data_index = DashboardIndex(matches_df, players_df, team_perf_df)
+    trends = season_trends(data_index.match_cube)
+    figure_cache = FigureCache(EXPORT_FIGURE_CACHE_SIZE)
+
+    if os.path.isdir(output):
+        shutil.rmtree(output)
+    site = SiteWriter(output)
+    site.write('style.css', STYLE)
+    site.write('nav.js', NAV_JS)
+    site.write('plotly.min.js', get_plotlyjs())
+    site.write('template.json', json.dumps(pio.templates[EXPORT_TEMPLATE].to_plotly_json()))
+
+    manifest = {'pages': [{'slug': slug(name), 'name': name} for name in PAGES], 'seasons': []}
+    views = 0
+    for season in seasons or data_index.matches.seasons:
+        teams = [ALL_TEAMS] + list(data_index.teams_in_season(season))
+        manifest['seasons'].append({'season': season, 'teams': [{'slug': slug(team), 'name': team} for team in teams]})
+        for team in teams:
+            state = filter_state(data_index, season, team, banned_teams)
+            for analysis_type in PAGES:
+                ctx = ExportContext(figure_cache, analysis_type=analysis_type, selected_year=season,
+                                    selected_team=team, data_index=data_index,
+                                    season_trends=lambda: trends, **state)
+                with capture_streamlit(ctx), plotly_template(EXPORT_TEMPLATE):
+                    render_page(analysis_type, ctx)
+                site.write_view(ctx, slug(analysis_type))
+                views += 1
+
+    site.write('manifest.json', json.dumps(manifest, default=str))
+    latest = manifest['seasons'][-1]['season']
+    site.write('index.html', PAGE_TEMPLATE.format(
+        title="IPL Dashboard", root='', season='', team='', page='',
+        content=f'<p style="text-align: center"><a href="{latest}/all-teams/{slug(next(iter(PAGES)))}.html">'
+                f'Open the {latest} season</a></p>'
+    ))
+    return views, len(site.figure_files), site.bytes_written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export every dashboard view as a static site")
+    parser.add_argument('--output', default='site')
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    parser.add_argument('--seasons', nargs='+', type=int, help="only these seasons (default: all)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    views, figures, written = export_site(args.output, args.data_dir, args.seasons)
+    print(f"wrote {views} views and {figures} figures to {args.output} "
+          f"({written / 1e6:.1f} MB) in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
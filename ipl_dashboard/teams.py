@@ -0,0 +1,79 @@
+"""Franchise reference data shared by the loaders and the dashboard pages."""
+
+# Franchises used by the mock data generator (and the current IPL line-up)
+MOCK_TEAMS = ['Chennai Super Kings', 'Mumbai Indians', 'Royal Challengers Bangalore',
+              'Kolkata Knight Riders', 'Rajasthan Royals', 'Delhi Capitals',
+              'Kings XI Punjab', 'Sunrisers Hyderabad', 'Gujarat Titans',
+              'Lucknow Super Giants']
+
+TEAM_CODES = {
+    'Chennai Super Kings': 'CSK',
+    'Mumbai Indians': 'MI',
+    'Royal Challengers Bangalore': 'RCB',
+    'Kolkata Knight Riders': 'KKR',
+    'Rajasthan Royals': 'RR',
+    'Delhi Capitals': 'DC',
+    'Kings XI Punjab': 'PBKS',
+    'Sunrisers Hyderabad': 'SRH',
+    'Gujarat Titans': 'GT',
+    'Lucknow Super Giants': 'LSG',
+    # Defunct franchises that only appear in the real match data
+    'Deccan Chargers': 'DCG',
+    'Gujarat Lions': 'GL',
+    'Pune Warriors': 'PWI',
+    'Kochi Tuskers Kerala': 'KTK',
+    'Rising Pune Supergiant': 'RPS'
+}
+
+TEAM_COLORS = {
+    'Chennai Super Kings': '#FDB913',
+    'Mumbai Indians': '#004BA0',
+    'Royal Challengers Bangalore': '#EC1C24',
+    'Kolkata Knight Riders': '#3A225D',
+    'Rajasthan Royals': '#FF1493',
+    'Delhi Capitals': '#0078BC',
+    'Kings XI Punjab': '#ED1C24',
+    'Sunrisers Hyderabad': '#F7A721',
+    'Gujarat Titans': '#1D3160',
+    'Lucknow Super Giants': '#A72056',
+    'Deccan Chargers': '#D9E3EF',
+    'Gujarat Lions': '#E04F16',
+    'Pune Warriors': '#2F9BE3',
+    'Kochi Tuskers Kerala': '#F15A22',
+    'Rising Pune Supergiant': '#6F61AC'
+}
+
+# Renamed franchises in the raw CSVs, mapped onto the names the dashboard uses
+TEAM_ALIASES = {
+    'Delhi Daredevils': 'Delhi Capitals',
+    'Punjab Kings': 'Kings XI Punjab',
+    'Royal Challengers Bengaluru': 'Royal Challengers Bangalore',
+    'Rising Pune Supergiants': 'Rising Pune Supergiant'
+}
+
+# Define banned teams by year
+BANNED_TEAMS = {
+    2016: ['Chennai Super Kings', 'Rajasthan Royals'],
+    2017: ['Chennai Super Kings', 'Rajasthan Royals']
+}
+
+# Actual IPL winners by year
+WINNERS_BY_YEAR = {
+    2008: 'Rajasthan Royals',
+    2009: 'Deccan Chargers',  # Now Sunrisers Hyderabad
+    2010: 'Chennai Super Kings',
+    2011: 'Chennai Super Kings',
+    2012: 'Kolkata Knight Riders',
+    2013: 'Mumbai Indians',
+    2014: 'Kolkata Knight Riders',
+    2015: 'Mumbai Indians',
+    2016: 'Sunrisers Hyderabad',
+    2017: 'Mumbai Indians',
+    2018: 'Chennai Super Kings',
+    2019: 'Mumbai Indians',
+    2020: 'Mumbai Indians',
+    2021: 'Chennai Super Kings',
+    2022: 'Gujarat Titans',
+    2023: 'Chennai Super Kings',
+    2024: 'Kolkata Knight Riders'  # Latest winner
+}
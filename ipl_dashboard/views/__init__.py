@@ -0,0 +1,140 @@
+"""Dashboard pages, one module per analysis type.
+
+Page modules are imported the first time their page is selected, so a
+session that never opens a page never pays for that page's imports.
+"""
+import importlib
+
+import streamlit as st
+
+from ..payload import PAYLOAD_MODE, compact
+from ..profiling import NULL_PROFILER, RerunProfiler
+
+# Analysis type -> module under ipl_dashboard.views exposing render(ctx)
+PAGES = {
+    "Season Overview": 'season_overview',
+    "Team Analysis": 'team_analysis',
+    "Player Stats": 'player_stats',
+    "Historical Trends": 'historical_trends'
+}
+
+
+class ViewContext:
+    """Sidebar state, filtered frames and shared caches handed to a page.
+
+    Attributes are passed as keywords by the main script: analysis_type,
+    selected_year, selected_team, data_index and season_trends (a cached
+    loader), plus the filter_state() keywords: team_filter (None for all
+    teams), filtered_matches, filtered_players, filtered_team_perf,
+    all_teams_in_year, active_teams_in_year, banned_teams, is_team_banned,
+    champion and most_wins. `profiler` times the charts and
+    tables a page draws and records each chart's payload (see profiling and
+    payload). The whole frames (matches_df,
+    players_df, team_perf_df) are read from data_index when a page asks for
+    them.
+    """
+
+    def __init__(self, figure_cache, profiler=NULL_PROFILER, **state):
+        self.figure_cache = figure_cache
+        self.profiler = profiler
+        self.__dict__.update(state)
+
+    @property
+    def matches_df(self):
+        return self.data_index.matches.frame
+
+    @property
+    def players_df(self):
+        return self.data_index.players.frame
+
+    @property
+    def team_perf_df(self):
+        return self.data_index.team_perf.frame
+
+    def _figure_key(self, name, options, key):
+        if key is None:
+            key = (self.analysis_type, self.selected_year, self.selected_team)
+        return key + (name,) + options
+
+    def figure(self, name, build, *options, key=None):
+        # The chart's figure, built only the first time this view state is
+        # seen. `build` returns the figure; `key` overrides the default view
+        # state for charts that don't depend on the selected year or team.
+        # Under IPL_PAYLOAD=compact the figure is compacted once, as built
+        key = self._figure_key(name, options, key)
+        if PAYLOAD_MODE == 'compact':
+            return self.figure_cache.get_or_build(key, lambda: compact(build()))
+        return self.figure_cache.get_or_build(key, build)
+
+    def plot(self, name, build, *options, key=None):
+        with self.profiler.section(f"chart:{name}"):
+            with self.profiler.section('figure'):
+                figure = self.figure(name, build, *options, key=key)
+            if self.profiler.enabled:
+                self.profiler.payload(name, self.figure_cache.payload_bytes(self._figure_key(name, options, key), figure))
+            with self.profiler.section('render'):
+                st.plotly_chart(figure, use_container_width=True)
+
+    def dataframe(self, name, data, **kwargs):
+        # st.dataframe, timed as section "table:<name>" when profiling
+        with self.profiler.section(f"table:{name}"):
+            st.dataframe(data, **kwargs)
+
+    def fragment(self, name, render_section):
+        # Render `render_section(self)` as a Streamlit fragment: a change to
+        # a widget inside it reruns only that section, with this context,
+        # instead of the whole script
+        _fragment(self, name, render_section)
+
+
+@st.fragment
+def _fragment(ctx, name, render_section):
+    if not ctx.profiler.finished:
+        with ctx.profiler.section(f"fragment:{name}"):
+            render_section(ctx)
+        return
+
+    # A rerun of this fragment alone: the script's profiler has already
+    # finished, so the fragment is timed and logged as a run of its own
+    ctx.profiler = RerunProfiler()
+    try:
+        with ctx.profiler.section(f"fragment:{name}"):
+            render_section(ctx)
+    finally:
+        ctx.profiler.stop()
+    ctx.profiler.finish(session=st.session_state.get('profile_session'), analysis_type=ctx.analysis_type,
+                        season=ctx.selected_year, team=ctx.selected_team, fragment=name)
+
+
+def filter_state(data_index, selected_year, selected_team, banned_teams):
+    """The sidebar-derived ViewContext keywords for one (season, team)
+    selection; selected_team is a team name or "All Teams"."""
+    all_teams_in_year = data_index.teams_in_season(selected_year)
+    team_filter = None if selected_team == "All Teams" else selected_team
+    filtered_team_perf = data_index.team_perf.select(selected_year, team_filter)
+
+    # Most wins and the team count only consider teams not banned that year
+    active_teams_in_year = [team for team in all_teams_in_year if team not in banned_teams.get(selected_year, [])]
+    active_team_perf = filtered_team_perf[~filtered_team_perf['banned']]
+    most_wins_team = active_team_perf.loc[active_team_perf['wins'].idxmax()] if not active_team_perf.empty else None
+
+    return {
+        'team_filter': team_filter,
+        'filtered_matches': data_index.matches.select(selected_year, team_filter),
+        'filtered_players': data_index.players.select(selected_year, team_filter),
+        'filtered_team_perf': filtered_team_perf,
+        'all_teams_in_year': all_teams_in_year,
+        'active_teams_in_year': active_teams_in_year,
+        'banned_teams': banned_teams,
+        'is_team_banned': selected_team in banned_teams.get(selected_year, []),
+        'champion': data_index.champions.get(selected_year, "N/A"),
+        'most_wins': f"{most_wins_team['team_code']} ({most_wins_team['wins']})" if most_wins_team is not None else "N/A"
+    }
+
+
+def page_module(analysis_type):
+    return importlib.import_module(f"{__name__}.{PAGES[analysis_type]}")
+
+
+def render_page(analysis_type, ctx):
+    page_module(analysis_type).render(ctx)
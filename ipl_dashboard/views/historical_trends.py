@@ -0,0 +1,461 @@
+"""Historical Trends page: team performance, champions, win type and toss trends."""
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+
+def render(ctx):
+    st.markdown("<h2 class='sub-header'>Historical Trends</h2>", unsafe_allow_html=True)
+    
+    # Switching the trend analysis only reruns the trend charts
+    ctx.fragment('trends', render_trends)
+
+
+def render_trends(ctx):
+    analysis_type = ctx.analysis_type
+    selected_team = ctx.selected_team
+    data_index = ctx.data_index
+    plot = ctx.plot
+    
+    # Select type of historical analysis
+    trend_type = st.radio(
+        "Select Trend Analysis",
+        ["Team Performance Over Years", "Champions Timeline", "Win Type Trends", "Toss Impact Trends"],
+        horizontal=True
+    )
+    
+    if trend_type == "Team Performance Over Years":
+        if selected_team != "All Teams":
+            # Get team performance over years
+            team_history = data_index.team_perf.team(selected_team)
+            
+            if not team_history.empty:
+                st.markdown(f"<h3>Performance of {selected_team} Over the Years</h3>", unsafe_allow_html=True)
+                
+                # Wins per year
+                def build_wins_history():
+                    fig_wins_history = px.line(
+                        team_history,
+                        x='season',
+                        y='wins',
+                        markers=True,
+                        title=f"{selected_team} - Wins Over the Years",
+                        labels={'season': 'Year', 'wins': 'Number of Wins'}
+                    )
+                    fig_wins_history.update_traces(line_color=team_history.iloc[0]['team_color'])
+                    return fig_wins_history
+                
+                plot('wins_history', build_wins_history, key=(analysis_type, trend_type, selected_team))
+                
+                # Points per year
+                def build_points_history():
+                    fig_points_history = px.line(
+                        team_history,
+                        x='season',
+                        y='points',
+                        markers=True,
+                        title=f"{selected_team} - Points Over the Years",
+                        labels={'season': 'Year', 'points': 'Points'}
+                    )
+                    fig_points_history.update_traces(line_color=team_history.iloc[0]['team_color'])
+                    return fig_points_history
+                
+                plot('points_history', build_points_history, key=(analysis_type, trend_type, selected_team))
+                
+                # Win percentage
+                def build_win_pct_history():
+                    team_history['win_percentage'] = (team_history['wins'] / team_history['matches_played'] * 100).round(2)
+                
+                    fig_win_pct = px.bar(
+                        team_history,
+                        x='season',
+                        y='win_percentage',
+                        title=f"{selected_team} - Win Percentage Over the Years",
+                        labels={'season': 'Year', 'win_percentage': 'Win Percentage (%)'}
+                    )
+                    fig_win_pct.update_traces(marker_color=team_history.iloc[0]['team_color'])
+                    return fig_win_pct
+                
+                plot('win_pct_history', build_win_pct_history, key=(analysis_type, trend_type, selected_team))
+                
+                # Display years when they were champions
+                champion_years = team_history[team_history['title_winner'] == True]['season'].tolist()
+                
+                if champion_years:
+                    champions_text = ", ".join([str(year) for year in champion_years])
+                    st.markdown(f"""
+                    <div style="background-color: gold; padding: 15px; border-radius: 10px; text-align: center; margin-top: 20px;">
+                        <h3 style="margin: 0; color: #333;">{selected_team} were Champions in: {champions_text}</h3>
+                    </div>
+                    """, unsafe_allow_html=True)
+                else:
+                    st.markdown(f"""
+                    <div style="background-color: #f8f9fa; padding: 15px; border-radius: 10px; text-align: center; margin-top: 20px;">
+                        <h3 style="margin: 0; color: #666;">{selected_team} have not won any IPL title yet</h3>
+                    </div>
+                    """, unsafe_allow_html=True)
+            else:
+                st.info(f"No historical data available for {selected_team}")
+        else:
+            # Compare all teams
+            # Aggregate team performance by year
+            def build_avg_wins():
+                team_yearly_performance = ctx.team_perf_df.groupby(['team', 'team_code', 'team_color'], observed=True)['wins'].mean().reset_index()
+                team_yearly_performance['avg_wins'] = team_yearly_performance['wins'].round(2)
+            
+                # Sort by average wins
+                team_yearly_performance = team_yearly_performance.sort_values(by='avg_wins', ascending=False)
+            
+                # Bar chart of average wins
+                fig_avg_wins = px.bar(
+                    team_yearly_performance,
+                    x='team_code',
+                    y='avg_wins',
+                    color='team',
+                    color_discrete_map={team: color for team, color in zip(team_yearly_performance['team'], team_yearly_performance['team_color'])},
+                    title="Average Wins per Season (All Teams)",
+                    labels={'team_code': 'Team', 'avg_wins': 'Average Wins per Season'}
+                )
+                fig_avg_wins.update_layout(showlegend=False)
+                return fig_avg_wins
+            
+            plot('avg_wins', build_avg_wins, key=(analysis_type, trend_type, selected_team))
+            
+            # Count total championships by team
+            def build_titles():
+                team_perf_df = ctx.team_perf_df
+                champions = team_perf_df[team_perf_df['title_winner'] == True]
+                champions_count = champions.groupby(['team', 'team_code', 'team_color'], observed=True).size().reset_index(name='titles')
+                champions_count = champions_count.sort_values(by='titles', ascending=False)
+            
+                # Bar chart of total championships
+                fig_titles = px.bar(
+                    champions_count,
+                    x='team_code',
+                    y='titles',
+                    color='team',
+                    color_discrete_map={team: color for team, color in zip(champions_count['team'], champions_count['team_color'])},
+                    title="Total IPL Titles Won (2008-2024)",
+                    labels={'team_code': 'Team', 'titles': 'Number of Titles'}
+                )
+                fig_titles.update_layout(showlegend=False)
+                return fig_titles
+            
+            plot('titles', build_titles, key=(analysis_type, trend_type, selected_team))
+            
+            # Win percentage heatmap across years
+            def build_win_pct_heatmap():
+                team_win_pct = ctx.team_perf_df.copy()
+                team_win_pct['win_percentage'] = (team_win_pct['wins'] / team_win_pct['matches_played'] * 100).round(2)
+            
+                # Pivot for heatmap
+                win_pct_pivot = team_win_pct.pivot_table(
+                    index='team_code',
+                    columns='season',
+                    values='win_percentage',
+                    aggfunc='mean',
+                    observed=True
+                ).fillna(0)
+            
+                # Filter years for better visualization
+                selected_years = list(range(2008, 2025, 2))  # Show every other year to avoid crowding
+                win_pct_pivot = win_pct_pivot[win_pct_pivot.columns.intersection(selected_years)]
+            
+                fig_heatmap = px.imshow(
+                    win_pct_pivot,
+                    labels=dict(x="Season", y="Team", color="Win %"),
+                    x=win_pct_pivot.columns,
+                    y=win_pct_pivot.index,
+                    color_continuous_scale='RdYlGn',
+                    title="Team Win Percentage by Season"
+                )
+                fig_heatmap.update_layout(height=500)
+                return fig_heatmap
+            
+            plot('win_pct_heatmap', build_win_pct_heatmap, key=(analysis_type, trend_type, selected_team))
+    
+    elif trend_type == "Champions Timeline":
+        # Champions through the years
+        champions = data_index.title_winners()
+        
+        def build_champions_timeline():
+            fig_timeline = px.line(
+                champions,
+                x='season',
+                y=[1] * len(champions),  # Constant value to create a straight line
+                markers=True,
+                hover_name='team',
+                title="IPL Champions Timeline (2008-2024)",
+                labels={'season': 'Year'}
+            )
+        
+            # Remove y-axis and its grid lines
+            fig_timeline.update_layout(
+                yaxis={'visible': False, 'showgrid': False},
+                height=400
+            )
+        
+            # Add team names as annotations
+            for i, row in champions.iterrows():
+                fig_timeline.add_annotation(
+                    x=row['season'],
+                    y=1,
+                    text=row['team_code'],
+                    showarrow=True,
+                    arrowhead=0,
+                    yshift=20,
+                    font={'color': row['team_color'], 'size': 14, 'weight': 'bold'}
+                )
+            return fig_timeline
+        
+        plot('champions_timeline', build_champions_timeline, key=(analysis_type, trend_type))
+        
+        # Count championships by team
+        def build_champions_donut():
+            champions_count = champions.groupby(['team', 'team_code', 'team_color'], observed=True).size().reset_index(name='titles')
+            champions_count = champions_count.sort_values(by='titles', ascending=False)
+        
+            # Create donut chart
+            fig_donut = px.pie(
+                champions_count,
+                values='titles',
+                names='team',
+                color='team',
+                hole=0.4,
+                color_discrete_map={team: color for team, color in zip(champions_count['team'], champions_count['team_color'])},
+                title="Distribution of IPL Championships by Team"
+            )
+            fig_donut.update_traces(textinfo='percent+label')
+            return fig_donut
+        
+        plot('champions_donut', build_champions_donut, key=(analysis_type, trend_type))
+        
+        # Champions stats table
+        st.markdown("<h3>IPL Champions Details</h3>", unsafe_allow_html=True)
+        
+        # Calculate win percentage
+        champions_detailed = champions.copy()
+        champions_detailed['win_percentage'] = (champions_detailed['wins'] / champions_detailed['matches_played'] * 100).round(2)
+        
+        # Format the table for display
+        champions_display = champions_detailed[['season', 'team', 'wins', 'losses', 'win_percentage', 'nrr']]
+        champions_display = champions_display.rename(columns={
+            'season': 'Year',
+            'team': 'Champion',
+            'wins': 'Wins',
+            'losses': 'Losses',
+            'win_percentage': 'Win %',
+            'nrr': 'NRR'
+        })
+        
+        champions_display['NRR'] = champions_display['NRR'].round(2)
+        
+        ctx.dataframe(
+            'champions',
+            champions_display,
+            use_container_width=True,
+            hide_index=True
+        )
+    
+    elif trend_type == "Win Type Trends":
+        # Analyze win type trends over the years
+        
+        # Per-season win type counts and percentages (shared, single pass)
+        win_types_df = ctx.season_trends()
+        
+        # Area chart showing win type distribution over years
+        def build_win_types():
+            fig_win_types = go.Figure()
+        
+            fig_win_types.add_trace(go.Scatter(
+                x=win_types_df['season'],
+                y=win_types_df['pct_win_by_runs'],
+                mode='lines',
+                stackgroup='one',
+                name='Win by Runs (Batting 1st)',
+                line=dict(color='rgba(75, 192, 192, 0.8)')
+            ))
+        
+            fig_win_types.add_trace(go.Scatter(
+                x=win_types_df['season'],
+                y=win_types_df['pct_win_by_wickets'],
+                mode='lines',
+                stackgroup='one',
+                name='Win by Wickets (Batting 2nd)',
+                line=dict(color='rgba(153, 102, 255, 0.8)')
+            ))
+        
+            fig_win_types.update_layout(
+                title="Win Type Distribution Over Years",
+                xaxis_title="Season",
+                yaxis_title="Percentage of Matches (%)",
+                yaxis_range=[0, 100],
+                hovermode="x unified",
+                height=500
+            )
+            return fig_win_types
+        
+        plot('win_types', build_win_types, key=(analysis_type, trend_type))
+        
+        # Analyze margin of victory trends
+        
+        # For wins by runs (the matches are only read to build the chart)
+        if win_types_df['win_by_runs'].sum() > 0:
+            def build_runs_margin():
+                matches_df = ctx.matches_df
+                runs_victories = matches_df[matches_df['win_by_runs'] > 0]
+                runs_by_year = runs_victories.groupby('season')['win_by_runs'].agg(['mean', 'median', 'max']).reset_index()
+                runs_by_year['mean'] = runs_by_year['mean'].round(2)
+            
+                fig_runs_margin = px.line(
+                    runs_by_year,
+                    x='season',
+                    y=['mean', 'median', 'max'],
+                    markers=True,
+                    title="Margin of Victory (Runs) Trends",
+                    labels={
+                        'season': 'Year',
+                        'value': 'Runs',
+                        'variable': 'Statistic'
+                    }
+                )
+                return fig_runs_margin
+            
+            plot('runs_margin', build_runs_margin, key=(analysis_type, trend_type))
+        
+        # For wins by wickets
+        if win_types_df['win_by_wickets'].sum() > 0:
+            def build_wickets_margin():
+                matches_df = ctx.matches_df
+                wickets_victories = matches_df[matches_df['win_by_wickets'] > 0]
+                wickets_by_year = wickets_victories.groupby('season')['win_by_wickets'].agg(['mean', 'median', 'max']).reset_index()
+                wickets_by_year['mean'] = wickets_by_year['mean'].round(2)
+            
+                fig_wickets_margin = px.line(
+                    wickets_by_year,
+                    x='season',
+                    y=['mean', 'median', 'max'],
+                    markers=True,
+                    title="Margin of Victory (Wickets) Trends",
+                    labels={
+                        'season': 'Year',
+                        'value': 'Wickets',
+                        'variable': 'Statistic'
+                    }
+                )
+                return fig_wickets_margin
+            
+            plot('wickets_margin', build_wickets_margin, key=(analysis_type, trend_type))
+    
+    elif trend_type == "Toss Impact Trends":
+        # Analyze toss impact over the years
+        
+        # Per-season toss aggregates (shared, single pass)
+        toss_impact_df = ctx.season_trends()
+        
+        # Line chart for toss impact over years
+        def build_toss_impact():
+            fig_toss_impact = go.Figure()
+        
+            fig_toss_impact.add_trace(go.Scatter(
+                x=toss_impact_df['season'],
+                y=toss_impact_df['toss_win_match_win_pct'],
+                mode='lines+markers',
+                name='Toss Winners Won Match (%)',
+                line=dict(color='rgba(54, 162, 235, 0.8)', width=3)
+            ))
+        
+            # Add a 50% reference line
+            fig_toss_impact.add_shape(
+                type="line",
+                x0=min(toss_impact_df['season']),
+                y0=50,
+                x1=max(toss_impact_df['season']),
+                y1=50,
+                line=dict(color="gray", width=1, dash="dash")
+            )
+        
+            fig_toss_impact.update_layout(
+                title="Toss Impact on Match Outcome Over the Years",
+                xaxis_title="Season",
+                yaxis_title="Percentage of Matches (%)",
+                yaxis_range=[0, 100],
+                height=500,
+                hovermode="x"
+            )
+            return fig_toss_impact
+        
+        plot('toss_impact', build_toss_impact, key=(analysis_type, trend_type))
+        
+        # Analyze toss decision trends (bat or field)
+        toss_decisions_pivot = toss_impact_df
+        
+        if toss_decisions_pivot['bat'].sum() > 0 and toss_decisions_pivot['field'].sum() > 0:
+            # Stacked area chart for toss decisions
+            def build_toss_decisions():
+                fig_toss_decisions = go.Figure()
+            
+                fig_toss_decisions.add_trace(go.Scatter(
+                    x=toss_decisions_pivot['season'],
+                    y=toss_decisions_pivot['bat_pct'],
+                    mode='lines',
+                    stackgroup='one',
+                    name='Chose to Bat',
+                    line=dict(color='rgba(255, 99, 132, 0.8)')
+                ))
+            
+                fig_toss_decisions.add_trace(go.Scatter(
+                    x=toss_decisions_pivot['season'],
+                    y=toss_decisions_pivot['field_pct'],
+                    mode='lines',
+                    stackgroup='one',
+                    name='Chose to Field',
+                    line=dict(color='rgba(54, 162, 235, 0.8)')
+                ))
+            
+                fig_toss_decisions.update_layout(
+                    title="Toss Decision Trends Over the Years",
+                    xaxis_title="Season",
+                    yaxis_title="Percentage of Decisions (%)",
+                    yaxis_range=[0, 100],
+                    hovermode="x unified",
+                    height=500
+                )
+                return fig_toss_decisions
+            
+            plot('toss_decisions', build_toss_decisions, key=(analysis_type, trend_type))
+            
+            # Analyze which toss decision led to more wins
+            toss_outcome_df = toss_impact_df
+            
+            # Line chart comparing success rates of toss decisions
+            def build_toss_success():
+                fig_toss_success = go.Figure()
+            
+                fig_toss_success.add_trace(go.Scatter(
+                    x=toss_outcome_df['season'],
+                    y=toss_outcome_df['bat_win_pct'],
+                    mode='lines+markers',
+                    name='Success Rate - Chose to Bat',
+                    line=dict(color='rgba(255, 99, 132, 0.8)', width=2)
+                ))
+            
+                fig_toss_success.add_trace(go.Scatter(
+                    x=toss_outcome_df['season'],
+                    y=toss_outcome_df['field_win_pct'],
+                    mode='lines+markers',
+                    name='Success Rate - Chose to Field',
+                    line=dict(color='rgba(54, 162, 235, 0.8)', width=2)
+                ))
+            
+                fig_toss_success.update_layout(
+                    title="Success Rate of Toss Decisions Over the Years",
+                    xaxis_title="Season",
+                    yaxis_title="Win Percentage (%)",
+                    yaxis_range=[0, 100],
+                    height=500,
+                    hovermode="x"
+                )
+                return fig_toss_success
+            
+            plot('toss_success', build_toss_success, key=(analysis_type, trend_type))
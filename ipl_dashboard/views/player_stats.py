@@ -0,0 +1,272 @@
+"""Player Stats page: sortable batting and bowling tables and charts, career
+leaderboards and per-player timelines."""
+import plotly.express as px
+import streamlit as st
+
+from .. import charts
+from ..analysis import top_k
+
+# Rows per page of the player table; only the visible page is sent
+PAGE_SIZE = 25
+# Players in the top-N charts
+TOP_N = 10
+ROUNDED = {'avg': 2, 'strike_rate': 2, 'economy': 2}
+# Career leaderboard sort keys -> ascending
+CAREER_SORTS = {"runs": False, "wickets": False, "avg": False, "strike_rate": False, "economy": True}
+# Balls faced (avg, strike rate) or bowled (economy) to qualify for a rate leaderboard
+CAREER_MIN_BALLS = 120
+CAREER_LEADERS = 25
+
+
+def _rounded(players):
+    # Widened first: float32 values rounded to 2 places still print long digits
+    return players.astype({col: 'float64' for col in ROUNDED if col in players.columns}).round(ROUNDED)
+
+
+def render(ctx):
+    st.markdown("<h2 class='sub-header'>Player Statistics</h2>", unsafe_allow_html=True)
+    
+    # The player type, sort and order widgets only rerun the table and charts
+    ctx.fragment('players', render_players)
+    
+    st.markdown("<h2 class='sub-header'>Careers (All Seasons)</h2>", unsafe_allow_html=True)
+    
+    ctx.fragment('careers', render_careers)
+
+
+def render_players(ctx):
+    filtered_players = ctx.filtered_players
+    plot = ctx.plot
+    
+    # Filter options
+    player_type = st.radio("Player Type", ["All", "Batsman", "Bowler"], horizontal=True)
+    
+    # Apply filter
+    if player_type != "All":
+        filtered_players = filtered_players[filtered_players['player_type'] == player_type]
+    
+    # Sort options
+    if player_type == "Bowler":
+        sort_by = st.selectbox("Sort By", ["wickets", "economy"])
+    else:
+        sort_by = st.selectbox("Sort By", ["runs", "avg", "strike_rate"])
+    ascending = st.checkbox("Ascending Order", False)
+    
+    # Display top players table
+    if not filtered_players.empty:
+        if player_type == "Bowler":
+            display_cols = ['player_name', 'team_code', 'matches', 'wickets', 'economy']
+            renamed_cols = {
+                'player_name': 'Player',
+                'team_code': 'Team',
+                'matches': 'Matches',
+                'wickets': 'Wickets',
+                'economy': 'Economy'
+            }
+        else:
+            display_cols = ['player_name', 'team_code', 'matches', 'runs', 'avg', 'strike_rate', 'fifties', 'hundreds']
+            renamed_cols = {
+                'player_name': 'Player',
+                'team_code': 'Team',
+                'matches': 'Matches',
+                'runs': 'Runs',
+                'avg': 'Average',
+                'strike_rate': 'Strike Rate',
+                'fifties': '50s',
+                'hundreds': '100s'
+            }
+        
+        # Read off the index's cached order for this sort key instead of
+        # sorting, and send only the visible page to the browser
+        sorted_players = ctx.data_index.players.select_sorted(ctx.selected_year, ctx.team_filter, sort_by, ascending)
+        if player_type != "All":
+            sorted_players = sorted_players[sorted_players['player_type'] == player_type]
+        pages = -(-len(sorted_players) // PAGE_SIZE)
+        page = st.number_input("Page", min_value=1, max_value=pages, value=1) if pages > 1 else 1
+        start = (page - 1) * PAGE_SIZE
+        page_players = sorted_players.iloc[start:start + PAGE_SIZE]
+        st.caption(f"Players {start + 1}-{start + len(page_players)} of {len(sorted_players)}")
+        
+        # Format floating point numbers
+        display_df = _rounded(page_players[display_cols]).rename(columns=renamed_cols)
+        
+        ctx.dataframe(
+            'players',
+            display_df,
+            use_container_width=True,
+            hide_index=True
+        )
+        
+        # Visualize top players, selected without sorting the rest
+        top_players = _rounded(top_k(filtered_players, sort_by, TOP_N, ascending))
+        top_n = len(top_players)
+        
+        # The scatter charts plot every player of the selection, or every
+        # player-season of the team's (or the league's) history. Read only
+        # when a chart is built, not when it is served from the figure cache
+        all_seasons = st.checkbox("Plot all seasons", False)
+        
+        def scatter_players():
+            if not all_seasons:
+                return _rounded(filtered_players)
+            players = ctx.data_index.players.team(ctx.team_filter) if ctx.team_filter else ctx.players_df
+            if player_type != "All":
+                players = players[players['player_type'] == player_type]
+            return _rounded(players)
+        
+        scope = "All Seasons" if all_seasons else ctx.selected_year
+        
+        if player_type == "Bowler":
+            def build_top_bowlers():
+                fig = px.bar(
+                    top_players,
+                    x='player_name',
+                    y='wickets',
+                    color='team_code',
+                    title=f"Top {top_n} Bowlers by Wickets",
+                    labels={'player_name': 'Player', 'wickets': 'Wickets', 'team_code': 'Team'}
+                )
+                return fig
+            
+            plot('top_bowlers', build_top_bowlers, player_type, sort_by, ascending)
+            
+            # Economy rate comparison
+            def build_wickets_vs_economy():
+                fig_economy = charts.scatter(
+                    scatter_players(),
+                    x='wickets',
+                    y='economy',
+                    color='team_code',
+                    size='matches',
+                    hover_name='player_name',
+                    hover_data=['season'],
+                    title=f"Wickets vs Economy Rate ({scope})",
+                    labels={'wickets': 'Wickets', 'economy': 'Economy Rate', 'matches': 'Matches Played'}
+                )
+                return fig_economy
+            
+            plot('wickets_vs_economy', build_wickets_vs_economy, player_type, all_seasons)
+        else:
+            def build_top_batsmen():
+                fig = px.bar(
+                    top_players,
+                    x='player_name',
+                    y='runs',
+                    color='team_code',
+                    title=f"Top {top_n} Batsmen by Runs",
+                    labels={'player_name': 'Player', 'runs': 'Runs', 'team_code': 'Team'}
+                )
+                return fig
+            
+            plot('top_batsmen', build_top_batsmen, player_type, sort_by, ascending)
+            
+            # Strike rate vs Average scatter plot
+            def build_avg_vs_strike_rate():
+                fig_sr_avg = charts.scatter(
+                    scatter_players(),
+                    x='avg',
+                    y='strike_rate',
+                    color='team_code',
+                    size='runs',
+                    hover_name='player_name',
+                    hover_data=['season'],
+                    title=f"Average vs Strike Rate ({scope})",
+                    labels={'avg': 'Batting Average', 'strike_rate': 'Strike Rate', 'runs': 'Total Runs'}
+                )
+                return fig_sr_avg
+            
+            plot('avg_vs_strike_rate', build_avg_vs_strike_rate, player_type, all_seasons)
+    else:
+        st.info("No player data available for the selected filters")
+
+
+def render_careers(ctx):
+    data_index = ctx.data_index
+    plot = ctx.plot
+    
+    # Career leaderboard, read from the precomputed career totals (only its
+    # rows are fetched from a database backend)
+    rank_by = st.selectbox("Rank Careers By", list(CAREER_SORTS))
+    if rank_by in ("avg", "strike_rate"):
+        qualifier = ('balls_faced', CAREER_MIN_BALLS)
+    elif rank_by == "economy":
+        qualifier = ('balls_bowled', CAREER_MIN_BALLS)
+    else:
+        qualifier = None
+    leaders = data_index.career_leaders(rank_by, CAREER_LEADERS, ascending=CAREER_SORTS[rank_by], qualifier=qualifier)
+    
+    if leaders.empty:
+        st.info("No career data available")
+        return
+    
+    ctx.dataframe(
+        'careers',
+        _rounded(leaders[['player_name', 'teams', 'seasons', 'matches', 'runs', 'avg', 'strike_rate',
+                          'wickets', 'economy']]).rename(columns={
+            'player_name': 'Player',
+            'teams': 'Teams',
+            'seasons': 'Seasons',
+            'matches': 'Matches',
+            'runs': 'Runs',
+            'avg': 'Average',
+            'strike_rate': 'Strike Rate',
+            'wickets': 'Wickets',
+            'economy': 'Economy'
+        }),
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    # Player timeline, defaulting to the leaderboard's first player
+    st.markdown("<h3>Player Timeline</h3>", unsafe_allow_html=True)
+    names = data_index.career_names()
+    player_name = st.selectbox("Player", names, index=names.index(leaders['player_name'].iloc[0]))
+    career = data_index.career(player_name)
+    player_seasons = data_index.player_seasons(player_name)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    for col, value, label in [
+        (col1, f"{career['first_season']}-{career['last_season']}", f"{career['seasons']} Seasons"),
+        (col2, career['runs'], "Career Runs"),
+        (col3, career['wickets'], "Career Wickets"),
+        (col4, career['teams'], "Teams")
+    ]:
+        with col:
+            st.markdown(f"""
+            <div class="metric-card">
+                <div class="metric-value">{value}</div>
+                <div class="metric-label">{label}</div>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    def build_player_timeline():
+        # A player who changed teams mid-season has one row per team
+        by_season = player_seasons.groupby('season', as_index=False)[['runs', 'wickets']].sum()
+        fig = charts.line(
+            by_season,
+            x='season',
+            y=['runs', 'wickets'],
+            markers=True,
+            title=f"{player_name} - Runs and Wickets by Season",
+            labels={'season': 'Year', 'value': 'Total', 'variable': 'Stat'}
+        )
+        return fig
+    
+    plot('player_timeline', build_player_timeline, key=(ctx.analysis_type, 'career', player_name))
+    
+    ctx.dataframe(
+        'player_seasons',
+        _rounded(player_seasons[['season', 'team_code', 'matches', 'runs', 'avg', 'strike_rate', 'wickets',
+                                 'economy']]).rename(columns={
+            'season': 'Season',
+            'team_code': 'Team',
+            'matches': 'Matches',
+            'runs': 'Runs',
+            'avg': 'Average',
+            'strike_rate': 'Strike Rate',
+            'wickets': 'Wickets',
+            'economy': 'Economy'
+        }),
+        use_container_width=True,
+        hide_index=True
+    )
@@ -0,0 +1,221 @@
+"""Season Overview page: key metrics, team charts, match analysis, venues and
+points table."""
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from ..analysis import match_outcomes
+
+
+def render(ctx):
+    selected_year = ctx.selected_year
+    all_teams_in_year = ctx.all_teams_in_year
+    active_teams_in_year = ctx.active_teams_in_year
+    banned_teams = ctx.banned_teams
+    champion = ctx.champion
+    most_wins = ctx.most_wins
+    filtered_matches = ctx.filtered_matches
+    filtered_team_perf = ctx.filtered_team_perf
+    plot = ctx.plot
+    
+    # Match-level counts are rollups of the match cube over the sidebar selection
+    match_cube = ctx.data_index.match_cube
+    cube_filters = {'season': selected_year}
+    if ctx.team_filter is not None:
+        cube_filters['team'] = ctx.team_filter
+    
+    # Key metrics in a row
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="metric-value">{len(filtered_matches)}</div>
+            <div class="metric-label">Matches</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="metric-value">{len(active_teams_in_year)}</div>
+            <div class="metric-label">Teams</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="metric-value">{champion}</div>
+            <div class="metric-label">Champion</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="metric-value">{most_wins}</div>
+            <div class="metric-label">Most Wins</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Team Performance Charts
+    st.markdown(f"<h2 class='sub-header'>Team Performance in {selected_year}</h2>", unsafe_allow_html=True)
+    
+    # Only show active teams in charts
+    active_team_perf = filtered_team_perf[~filtered_team_perf['banned']]
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Team Wins Chart
+        def build_team_wins():
+            fig_wins = px.bar(
+                active_team_perf,
+                x='team_code',
+                y='wins',
+                color='team',
+                color_discrete_map={team: color for team, color in zip(active_team_perf['team'], active_team_perf['team_color'])},
+                title=f"Team Wins in {selected_year}",
+                labels={'team_code': 'Team', 'wins': 'Number of Wins'}
+            )
+            fig_wins.update_layout(showlegend=False, height=400)
+            return fig_wins
+        
+        plot('team_wins', build_team_wins)
+    
+    with col2:
+        # Net Run Rate Chart
+        def build_nrr():
+            fig_nrr = px.bar(
+                active_team_perf,
+                x='team_code',
+                y='nrr',
+                color='nrr',
+                color_continuous_scale=['red', 'yellow', 'green'],
+                title=f"Net Run Rate in {selected_year}",
+                labels={'team_code': 'Team', 'nrr': 'Net Run Rate'}
+            )
+            fig_nrr.update_layout(showlegend=False, height=400)
+            return fig_nrr
+        
+        plot('nrr', build_nrr)
+    
+    # Match Analysis Charts - only if there are matches
+    if not filtered_matches.empty:
+        st.markdown(f"<h2 class='sub-header'>Match Analysis</h2>", unsafe_allow_html=True)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Toss Impact Chart
+            def build_toss_impact():
+                outcomes = match_outcomes(match_cube, **cube_filters)
+            
+                toss_data = pd.DataFrame({
+                    'Result': ['Won Toss & Match', 'Won Toss, Lost Match'],
+                    'Count': [outcomes['toss_win_match_win'], outcomes['toss_win_match_lose']]
+                })
+            
+                fig_toss = px.pie(
+                    toss_data,
+                    values='Count',
+                    names='Result',
+                    title='Toss Impact on Match Outcome',
+                    color_discrete_sequence=['#36a2eb', '#ffce56']
+                )
+                fig_toss.update_traces(textposition='inside', textinfo='percent+label')
+                return fig_toss
+            
+            plot('toss_impact', build_toss_impact)
+        
+        with col2:
+            # Win Type Chart
+            def build_win_type():
+                outcomes = match_outcomes(match_cube, **cube_filters)
+            
+                win_type_data = pd.DataFrame({
+                    'Win Type': ['Win by Runs (Batting 1st)', 'Win by Wickets (Batting 2nd)'],
+                    'Count': [outcomes['win_by_runs'], outcomes['win_by_wickets']]
+                })
+            
+                fig_win_type = px.pie(
+                    win_type_data,
+                    values='Count',
+                    names='Win Type',
+                    title='Win Type Distribution',
+                    color_discrete_sequence=['#4bc0c0', '#9966ff']
+                )
+                fig_win_type.update_traces(textposition='inside', textinfo='percent+label')
+                return fig_win_type
+            
+            plot('win_type', build_win_type)
+        
+        # Venues: matches at each ground, by how they were won
+        def build_venues():
+            venues = match_cube.rollup(['venue', 'win_type'], **cube_filters)
+            venues['win_type'] = venues['win_type'].map({
+                'runs': 'Batting 1st', 'wickets': 'Batting 2nd', 'no result': 'No Result'
+            }).fillna('Other')
+            venue_order = venues.groupby('venue')['matches'].sum().sort_values(ascending=False, kind='stable').index
+            
+            fig_venues = px.bar(
+                venues,
+                x='venue',
+                y='matches',
+                color='win_type',
+                category_orders={'venue': list(venue_order)},
+                title=f"Matches by Venue in {selected_year}",
+                labels={'venue': 'Venue', 'matches': 'Matches', 'win_type': 'Won'},
+                color_discrete_map={'Batting 1st': '#4bc0c0', 'Batting 2nd': '#9966ff'}
+            )
+            fig_venues.update_layout(height=400)
+            return fig_venues
+        
+        plot('venues', build_venues)
+    
+    # Points Table
+    st.markdown(f"<h2 class='sub-header'>Points Table - {selected_year}</h2>", unsafe_allow_html=True)
+    
+    # Sort teams by points then NRR (for active teams)
+    active_points_table = active_team_perf.sort_values(by=['points', 'nrr'], ascending=[False, False])
+    
+    # Format the table
+    points_table_display = active_points_table[['team', 'matches_played', 'wins', 'losses', 'points', 'nrr']]
+    points_table_display = points_table_display.rename(columns={
+        'team': 'Team',
+        'matches_played': 'P',
+        'wins': 'W',
+        'losses': 'L',
+        'points': 'Points',
+        'nrr': 'NRR'
+    })
+    
+    # Format NRR to 2 decimal places
+    points_table_display['NRR'] = points_table_display['NRR'].round(2)
+    
+    # Display the table with styling
+    ctx.dataframe(
+        'points_table',
+        points_table_display,
+        column_config={
+            "Team": st.column_config.TextColumn("Team", width="medium"),
+            "P": st.column_config.NumberColumn("P", width="small"),
+            "W": st.column_config.NumberColumn("W", width="small"),
+            "L": st.column_config.NumberColumn("L", width="small"),
+            "Points": st.column_config.NumberColumn("Points", width="small", format="%d"),
+            "NRR": st.column_config.NumberColumn("NRR", width="small", format="%0.2f")
+        },
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    # Display banned teams if any
+    banned_teams_in_year = [team for team in all_teams_in_year if team in banned_teams.get(selected_year, [])]
+    if banned_teams_in_year:
+        banned_teams_str = ", ".join(banned_teams_in_year)
+        st.markdown(f"""
+        <div class="banned-notice" style="margin-top: 20px;">
+            Teams banned in {selected_year}: {banned_teams_str}
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,320 @@
+"""Team Analysis page: one team's season, match results and top players, and
+head-to-head records between teams."""
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from ..analysis import match_results, top_k
+
+
+def render(ctx):
+    analysis_type = ctx.analysis_type
+    selected_year = ctx.selected_year
+    selected_team = ctx.selected_team
+    banned_teams = ctx.banned_teams
+    is_team_banned = ctx.is_team_banned
+    data_index = ctx.data_index
+    filtered_players = ctx.filtered_players
+    filtered_team_perf = ctx.filtered_team_perf
+    plot = ctx.plot
+    
+    if selected_team == "All Teams":
+        st.markdown("<h2 class='sub-header'>Please select a specific team for detailed analysis</h2>", unsafe_allow_html=True)
+    elif is_team_banned:
+        st.markdown(f"<h2 class='sub-header'>{selected_team} Analysis ({selected_year})</h2>", unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div class="banned-notice">
+            {selected_team} was banned from IPL in {selected_year} due to spot-fixing scandal.
+            No matches or player statistics are available for this period.
+        </div>
+        
+        <div style="padding: 20px; background-color: #f8f9fa; border-radius: 10px; margin-top: 20px;">
+            <h3 style="color: #0066cb;">Ban Details:</h3>
+            <p> Chennai Super Kings (CSK) and Rajasthan Royals (RR) were suspended from the IPL for two years (2016-2017) 
+            following the IPL betting scandal. The suspension was imposed by the Supreme Court-appointed Justice Lodha Committee. </p>
+            
+            <p> During this period, some of the players from these teams were drafted to other franchises through a special player draft, 
+            while two new teams, Rising Pune Supergiant and Gujarat Lions, were introduced as temporary replacements for the duration of the ban. </p>
+            
+            <p> CSK returned to IPL in 2018 and went on to win the tournament that year, demonstrating their resilience and strength as a franchise. </p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Display a historical overview
+        st.markdown("<h3 style='margin-top: 30px;'>Historical Performance Overview</h3>", unsafe_allow_html=True)
+        
+        # Get team performance across all years except banned years
+        team_history = data_index.team_perf.team(selected_team)
+        team_history = team_history[~team_history['banned']]
+        
+        if not team_history.empty:
+            # Wins per year
+            def build_wins_history():
+                fig_wins_history = px.line(
+                    team_history,
+                    x='season',
+                    y='wins',
+                    markers=True,
+                    title=f"{selected_team} - Wins Over the Years",
+                    labels={'season': 'Year', 'wins': 'Number of Wins'}
+                )
+                fig_wins_history.update_traces(line_color=team_history.iloc[0]['team_color'])
+            
+                # Add vertical lines for banned years
+                for year in banned_teams:
+                    if selected_team in banned_teams[year]:
+                        fig_wins_history.add_vline(x=year, line_width=2, line_dash="dash", line_color="red")
+                return fig_wins_history
+            
+            plot('wins_history', build_wins_history, key=(analysis_type, selected_team))
+            
+    else:
+        st.markdown(f"<h2 class='sub-header'>{selected_team} Analysis ({selected_year})</h2>", unsafe_allow_html=True)
+        
+        # Team performance metrics
+        team_perf = filtered_team_perf.iloc[0] if not filtered_team_perf.empty else None
+        
+        if team_perf is not None:
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div class="metric-value">{team_perf['matches_played']}</div>
+                    <div class="metric-label">Matches Played</div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col2:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div class="metric-value">{team_perf['wins']}</div>
+                    <div class="metric-label">Wins</div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col3:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div class="metric-value">{team_perf['losses']}</div>
+                    <div class="metric-label">Losses</div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col4:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div class="metric-value">{team_perf['nrr']:.2f}</div>
+                    <div class="metric-label">Net Run Rate</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Team matches
+        st.markdown(f"<h3 class='sub-header'>Matches</h3>", unsafe_allow_html=True)
+        
+        # The "Show all seasons" checkbox only reruns the matches table
+        ctx.fragment('matches', render_matches)
+        
+        # Top Players
+        st.markdown(f"<h3 class='sub-header'>Top Players</h3>", unsafe_allow_html=True)
+        
+        # Top batsmen
+        team_batsmen = top_k(filtered_players[filtered_players['player_type'] == 'Batsman'], 'runs', 5)
+        
+        if not team_batsmen.empty:
+            st.markdown("<h4>Top Batsmen</h4>", unsafe_allow_html=True)
+            
+            batsmen_cols = st.columns(len(team_batsmen))
+            
+            for i, (_, batsman) in enumerate(team_batsmen.iterrows()):
+                with batsmen_cols[i]:
+                    st.markdown(f"""
+                    <div class="metric-card">
+                        <div style="font-weight: 600; margin-bottom: 10px;">{batsman['player_name']}</div>
+                        <div class="metric-value">{batsman['runs']}</div>
+                        <div class="metric-label">Runs</div>
+                        <div style="margin-top: 10px; font-size: 0.9rem;">
+                            <span style="display: block;">Avg: {batsman['avg']:.2f}</span>
+                            <span style="display: block;">SR: {batsman['strike_rate']:.2f}</span>
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+        
+        # Top bowlers
+        team_bowlers = top_k(filtered_players[filtered_players['player_type'] == 'Bowler'], 'wickets', 5)
+        
+        if not team_bowlers.empty:
+            st.markdown("<h4>Top Bowlers</h4>", unsafe_allow_html=True)
+            
+            bowlers_cols = st.columns(len(team_bowlers))
+            
+            for i, (_, bowler) in enumerate(team_bowlers.iterrows()):
+                with bowlers_cols[i]:
+                    st.markdown(f"""
+                    <div class="metric-card">
+                        <div style="font-weight: 600; margin-bottom: 10px;">{bowler['player_name']}</div>
+                        <div class="metric-value">{bowler['wickets']}</div>
+                        <div class="metric-label">Wickets</div>
+                        <div style="margin-top: 10px; font-size: 0.9rem;">
+                            <span style="display: block;">Economy: {bowler['economy']:.2f}</span>
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+    
+    st.markdown("<h3 class='sub-header'>Head to Head</h3>", unsafe_allow_html=True)
+    
+    # The season range and opponent only rerun the head-to-head section
+    ctx.fragment('head_to_head', render_head_to_head)
+
+
+def render_matches(ctx):
+    selected_team = ctx.selected_team
+    
+    # Either the selected season or the team's whole history
+    all_seasons = st.checkbox("Show all seasons", False)
+    if all_seasons:
+        team_matches = ctx.data_index.matches.team(selected_team)
+    else:
+        team_matches = ctx.filtered_matches
+    
+    match_results_df = match_results(team_matches, selected_team)
+    
+    if not match_results_df.empty:
+        ctx.dataframe(
+            'match_results',
+            match_results_df,
+            use_container_width=True,
+            hide_index=True
+        )
+    else:
+        st.info(f"No matches found for {selected_team}" + ("" if all_seasons else f" in {ctx.selected_year}"))
+
+
+def _record_card(value, label):
+    return f"""
+    <div class="metric-card">
+        <div class="metric-value">{value}</div>
+        <div class="metric-label">{label}</div>
+    </div>
+    """
+
+
+def render_head_to_head(ctx):
+    analysis_type = ctx.analysis_type
+    head_to_head = ctx.data_index.head_to_head
+    plot = ctx.plot
+    seasons = head_to_head.seasons
+    
+    if not seasons:
+        st.info("No matches available")
+        return
+    
+    # Any season range is answered from the precomputed running totals
+    if len(seasons) > 1:
+        first, last = st.select_slider("Seasons", options=seasons, value=(seasons[0], seasons[-1]))
+    else:
+        first = last = seasons[0]
+    
+    wins = head_to_head.matrix('wins', first, last)
+    losses = head_to_head.matrix('losses', first, last)
+    codes = [head_to_head.codes[team] for team in wins.index]
+    
+    # Win % of each row team against each column team
+    def build_matrix():
+        decided = (wins + losses).to_numpy()
+        win_pct = pd.DataFrame(100 * wins.to_numpy() / decided.clip(min=1), index=codes, columns=codes)
+        win_pct = win_pct.mask(decided == 0)
+        fig_matrix = px.imshow(
+            win_pct,
+            color_continuous_scale='RdYlGn',
+            zmin=0,
+            zmax=100,
+            title=f"Head-to-Head Win % ({first}-{last})",
+            labels={'x': 'Opponent', 'y': 'Team', 'color': 'Win %'}
+        )
+        fig_matrix.update_traces(
+            text=(wins.astype(str) + '-' + losses.astype(str)).to_numpy(),
+            texttemplate='%{text}',
+            hovertemplate='%{y} vs %{x}: %{text} (%{z:.0f}%)<extra></extra>'
+        )
+        return fig_matrix
+    
+    plot('head_to_head_matrix', build_matrix, key=(analysis_type, 'head_to_head', first, last))
+    
+    # Pair drill-down: the selected team, or any team on the All Teams view
+    teams = list(wins.index)
+    if ctx.selected_team in teams:
+        team = ctx.selected_team
+    else:
+        team = st.selectbox("Team", teams)
+    opponents = head_to_head.opponents(team, first, last)
+    if not opponents:
+        st.info(f"{team} played no matches in {first}-{last}")
+        return
+    opponent = st.selectbox("Opponent", opponents)
+    
+    record = head_to_head.record(team, opponent, first, last)
+    opponent_record = head_to_head.record(opponent, team, first, last)
+    team_code, opponent_code = head_to_head.codes[team], head_to_head.codes[opponent]
+    
+    cards = [
+        (record['matches'], "Matches"),
+        (record['wins'], f"{team_code} Wins"),
+        (record['losses'], f"{opponent_code} Wins"),
+        (record['no_results'], "No Result")
+    ]
+    for col, (value, label) in zip(st.columns(len(cards)), cards):
+        with col:
+            st.markdown(_record_card(value, label), unsafe_allow_html=True)
+    
+    pair_key = (analysis_type, 'head_to_head', team, opponent, first, last)
+    
+    # How each side won: defending a total or chasing one
+    def build_win_types():
+        win_types = pd.DataFrame([
+            {'team': code, 'win_type': win_type, 'wins': side[metric]}
+            for code, side in [(team_code, record), (opponent_code, opponent_record)]
+            for win_type, metric in [('Batting first', 'wins_batting_first'), ('Chasing', 'wins_chasing')]
+        ])
+        return px.bar(
+            win_types,
+            x='team',
+            y='wins',
+            color='win_type',
+            barmode='group',
+            title=f"{team_code} vs {opponent_code} - Wins by Type",
+            labels={'team': 'Team', 'wins': 'Wins', 'win_type': 'Won'}
+        )
+    
+    # Each side's wins per season of the range
+    def build_pair_seasons():
+        pair_seasons = head_to_head.by_season(team, opponent, first, last)
+        pair_seasons = pair_seasons.rename(columns={'wins': team_code, 'losses': opponent_code})
+        fig_pair_seasons = px.bar(
+            pair_seasons,
+            x='season',
+            y=[team_code, opponent_code],
+            barmode='group',
+            title=f"{team_code} vs {opponent_code} - Wins per Season",
+            labels={'season': 'Season', 'value': 'Wins', 'variable': 'Team'},
+            color_discrete_map={team_code: head_to_head.colors[team], opponent_code: head_to_head.colors[opponent]}
+        )
+        return fig_pair_seasons
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        plot('head_to_head_win_types', build_win_types, key=pair_key)
+    
+    with col2:
+        plot('head_to_head_seasons', build_pair_seasons, key=pair_key)
+    
+    venues = head_to_head.by_venue(team, opponent, first, last)
+    ctx.dataframe(
+        'head_to_head_venues',
+        venues.rename(columns={'venue': 'Venue', 'matches': 'Matches', 'wins': f"{team_code} Wins",
+                               'opponent_wins': f"{opponent_code} Wins"}),
+        use_container_width=True,
+        hide_index=True
+    )
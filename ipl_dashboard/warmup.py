@@ -0,0 +1,113 @@
+"""Precompute every view's figures before the first user asks for them.
+
+The dashboard builds a figure the first time its (season, team, analysis
+type) view is opened, so after a deploy the first visitor of each view pays
+the full build. This command renders every view across a process pool, one
+season per task, and writes the figures to the shared on-disk FigureStore
+(see figure_cache). Loading the frames on the way also fills the Parquet
+frame cache. Server processes then read figures from the store instead of
+building them:
+
+    python -m ipl_dashboard.warmup && streamlit run ipl-dashboard-streamlit.py
+
+In-page options (trend type, player type, sort order) are warmed at their
+defaults; other options are built on first use and added to the store.
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .analysis import season_trends
+from .data_loader import DATA_DIR, load_frames
+from .figure_cache import FigureCache, FigureStore
+from .partition_index import DashboardIndex
+from .shared_frames import MappedDashboardIndex, frames_path, use_mapped_frames
+from .sql_backend import SqlDashboardIndex, database_path, use_sql_backend
+from .static_export import ALL_TEAMS, ExportContext, capture_streamlit, quiet_bare_mode
+from .teams import BANNED_TEAMS
+from .views import PAGES, filter_state, render_page
+
+# One worker's view of the data, set up once per process by _init_worker
+_WORKER = {}
+
+
+def load_index(data_dir):
+    # The index the dashboard reads; IPL_BACKEND decides which
+    if use_sql_backend():
+        return SqlDashboardIndex(database_path(data_dir))
+    if use_mapped_frames():
+        return MappedDashboardIndex(frames_path(data_dir))
+    matches_df, players_df, team_perf_df, *_ = load_frames(data_dir)
+    return DashboardIndex(matches_df, players_df, team_perf_df)
+
+
+def _init_worker(data_dir, store_root):
+    quiet_bare_mode()
+    data_index = load_index(data_dir)
+    _WORKER.update(
+        data_index=data_index,
+        trends=season_trends(data_index.match_cube),
+        store=FigureStore(store_root)
+    )
+
+
+def warm_season(season):
+    """Render every team and page of `season` in this worker. Returns
+    (season, views, figures built, figures already stored, seconds)."""
+    start = time.perf_counter()
+    data_index = _WORKER['data_index']
+    # Unbounded in practice: every figure of the season stays until the task ends
+    figure_cache = FigureCache(maxsize=100_000, store=_WORKER['store'])
+    views = 0
+    for team in [ALL_TEAMS] + list(data_index.teams_in_season(season)):
+        state = filter_state(data_index, season, team, BANNED_TEAMS)
+        for analysis_type in PAGES:
+            ctx = ExportContext(figure_cache, analysis_type=analysis_type, selected_year=season,
+                                selected_team=team, data_index=data_index,
+                                season_trends=lambda: _WORKER['trends'], **state)
+            with capture_streamlit(ctx):
+                render_page(analysis_type, ctx)
+            views += 1
+    stats = figure_cache.stats()
+    built = stats['misses'] - stats['store_hits']
+    return season, views, built, stats['store_hits'], time.perf_counter() - start
+
+
+def warm_up(data_dir=DATA_DIR, workers=None, seasons=None):
+    """Fill the figure store for the data in `data_dir`. Returns the store."""
+    start = time.perf_counter()
+    # Loaded once here first, so the workers read the frames from the cache
+    data_index = load_index(data_dir)
+    store = FigureStore.for_index(data_dir, data_index)
+    store.prune()
+    seasons = seasons or data_index.seasons
+    print(f"data ready in {time.perf_counter() - start:.1f}s; warming {len(seasons)} seasons into {store.root}",
+          file=sys.stderr)
+
+    workers = workers or getattr(os, 'process_cpu_count', os.cpu_count)() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(data_dir, store.root)) as pool:
+        futures = [pool.submit(warm_season, season) for season in seasons]
+        for done, future in enumerate(as_completed(futures), 1):
+            season, views, built, stored, seconds = future.result()
+            print(f"[{done}/{len(futures)}] {season}: {views} views, {built} figures built, "
+                  f"{stored} already stored ({seconds:.1f}s)", file=sys.stderr)
+    return store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute every dashboard view's figures")
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    parser.add_argument('--workers', type=int, help="worker processes (default: one per core)")
+    parser.add_argument('--seasons', nargs='+', type=int, help="only these seasons (default: all)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    store = warm_up(args.data_dir, args.workers, args.seasons)
+    print(f"warmed {len(store)} figures in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
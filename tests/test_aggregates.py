@@ -0,0 +1,64 @@
+import pandas as pd
+
+from ipl_dashboard.aggregates import (nrr_progression, player_season_counts, standings_as_of, team_labels,
+                                      team_match_rates, team_results_from_counts, team_season_counts)
+from ipl_dashboard.head_to_head import HeadToHead
+from ipl_dashboard.mock_data import generate_mock_data
+
+
+def _mock(**scale):
+    return generate_mock_data(with_deliveries=True, num_seasons=1, **scale)
+
+
+def test_super_overs_are_left_out_of_player_counts():
+    data = _mock(matches_per_season=4)
+    deliveries, matches = data['deliveries'], data['matches']
+    # A super over for the first match: six balls of the first innings again
+    super_over = deliveries[(deliveries['match_id'] == 1) & (deliveries['inning'] == 1)].head(6)
+    with_super_over = pd.concat([deliveries, super_over.assign(inning=3)], ignore_index=True)
+
+    expected = player_season_counts(deliveries, matches)
+    pd.testing.assert_frame_equal(player_season_counts(with_super_over, matches), expected)
+    pd.testing.assert_frame_equal(team_season_counts(matches, with_super_over), team_season_counts(matches, deliveries))
+
+
+def test_playoffs_are_left_out_of_the_points_table():
+    data = _mock(matches_per_season=6)
+    deliveries, matches = data['deliveries'], data['matches']
+    playoffs = matches.assign(match_type=['League'] * 4 + ['Qualifier 1', 'Final'])
+
+    counts = team_season_counts(playoffs, deliveries).set_index('team')
+    expected = team_season_counts(matches.head(4), deliveries).set_index('team')
+    pd.testing.assert_frame_equal(counts.loc[expected.index], expected)
+    assert counts['matches_played'].sum() == 8
+
+
+def test_team_labels_are_unique():
+    teams = pd.Series(['Mumbai Indians', 'Franchise 1', 'Franchise 2', 'Mumbai Indians', 'MI'])
+    codes, colors = team_labels(teams)
+    assert codes.tolist() == ['Mumbai Indians', 'Franchise 1', 'Franchise 2', 'Mumbai Indians', 'MI']
+    assert colors.tolist()[:3] == ['#004BA0', '#808080', '#808080']
+    assert team_labels(pd.Series(['Mumbai Indians', 'Gujarat Titans']))[0].tolist() == ['MI', 'GT']
+
+    # Franchises without a code keep their names in the head-to-head matrix
+    matches = _mock(matches_per_season=6)['matches']
+    first = matches.iloc[0]
+    renamed = {first['team1']: 'Franchise 1', first['team2']: 'Franchise 2'}
+    matches = matches.assign(**{col: matches[col].replace(renamed) for col in ['team1', 'team2', 'winner']})
+    codes = HeadToHead(matches).codes
+    assert len(set(codes.values())) == len(codes)
+    assert codes['Franchise 1'] == 'Franchise 1' and codes['Franchise 2'] == 'Franchise 2'
+
+
+def test_standings_as_of_match_n_match_a_fresh_table():
+    data = _mock(matches_per_season=12)
+    deliveries, matches = data['deliveries'], data['matches']
+    progression = nrr_progression(team_match_rates(matches, deliveries))
+    league = matches[matches['match_type'] == 'League'].sort_values(['date', 'id'])
+
+    for n in (1, 5, len(league)):
+        first_n = league.head(n)
+        fresh = team_results_from_counts(team_season_counts(first_n, deliveries), first_n)
+        fresh = fresh.set_index('team')[['matches_played', 'wins', 'losses', 'points', 'nrr']].sort_index()
+        table = standings_as_of(progression, 2008, n).set_index('team')[fresh.columns].sort_index()
+        pd.testing.assert_frame_equal(table, fresh, check_dtype=False)
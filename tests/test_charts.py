@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+
+from ipl_dashboard import charts
+
+
+def _series(n):
+    x = np.tile(np.arange(n), 2)
+    return pd.DataFrame({'x': x, 'a': np.sin(x / 7), 'b': np.cos(x / 5), 'team': np.repeat(['p', 'q'], n)})
+
+
+def test_line_keeps_the_colour_grouping_of_several_columns():
+    data = _series(500)
+    for max_points in (1000, 50):
+        fig = charts.line(data, x='x', y=['a', 'b'], color='team', max_points=max_points)
+        assert sorted(trace.name for trace in fig.data) == ['p, a', 'p, b', 'q, a', 'q, b'], max_points
+        assert all(len(trace.x) <= max_points for trace in fig.data)
+        p_a = next(trace for trace in fig.data if trace.name == 'p, a')
+        assert np.allclose(p_a.y, np.sin(np.asarray(p_a.x) / 7))
+
+
+def test_line_thins_each_column():
+    fig = charts.line(_series(500).query("team == 'p'"), x='x', y=['a', 'b'], max_points=50)
+    assert sorted(trace.name for trace in fig.data) == ['a', 'b']
+    assert all(len(trace.x) == 50 for trace in fig.data)
@@ -0,0 +1,26 @@
+import os
+
+import pandas as pd
+
+from ipl_dashboard import data_cache
+from ipl_dashboard.data_cache import read_cached_frames, write_cached_frames, write_frames
+
+FRAMES = {'matches': pd.DataFrame({'id': [1, 2], 'season': [2008, 2008]})}
+
+
+def test_writing_the_same_key_twice(tmp_path):
+    assert write_cached_frames(tmp_path, 'key', FRAMES)
+    assert write_cached_frames(tmp_path, 'key', FRAMES)
+    assert read_cached_frames(tmp_path, 'key', ['matches'])['matches'].equals(FRAMES['matches'])
+    assert [name for name in os.listdir(data_cache.cache_root(tmp_path)) if name.startswith('.tmp-')] == []
+
+
+def test_entry_written_by_another_process_first(tmp_path, monkeypatch):
+    # Both processes see no entry, then the first one renames its copy in
+    entry = os.path.join(tmp_path, 'entry')
+    assert write_frames(entry, FRAMES)
+    exists = os.path.exists
+    monkeypatch.setattr(data_cache.os.path, 'exists', lambda path: path != entry and exists(path))
+
+    assert not write_frames(entry, FRAMES)
+    assert os.listdir(tmp_path) == ['entry']
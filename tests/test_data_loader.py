@@ -0,0 +1,18 @@
+import pandas as pd
+
+from ipl_dashboard.data_loader import DELIVERY_DTYPES, read_typed_csv
+from ipl_dashboard.mock_data import generate_mock_data, write_mock_csvs
+
+
+def test_small_chunks_match_a_single_read(tmp_path):
+    # With 50-row chunks some chunks have no extras or wickets at all, so
+    # extras_type / dismissal_kind are all-NaN categoricals in them
+    write_mock_csvs(generate_mock_data(with_deliveries=True, num_seasons=1, matches_per_season=2), tmp_path)
+    path = tmp_path / 'deliveries.csv'
+
+    chunked = read_typed_csv(path, DELIVERY_DTYPES, chunksize=50)
+    whole = read_typed_csv(path, DELIVERY_DTYPES)
+
+    assert isinstance(chunked['dismissal_kind'].dtype, pd.CategoricalDtype)
+    for col in DELIVERY_DTYPES:
+        assert chunked[col].astype(object).equals(whole[col].astype(object)), col
@@ -0,0 +1,27 @@
+import pandas as pd
+
+from ipl_dashboard.mock_data import generate_mock_data, write_mock_csvs
+
+
+def test_results_match_the_played_innings(tmp_path):
+    data = generate_mock_data(with_deliveries=True, num_seasons=2)
+    matches, deliveries = data['matches'].set_index('id'), data['deliveries']
+    totals = deliveries.groupby(['match_id', 'inning'])['total_runs'].sum().unstack()
+    assert (matches['result'] == 'tie').any()
+
+    runs, wickets = matches['win_by_runs'], matches['win_by_wickets']
+    by_result = matches.groupby('result')
+    assert set(by_result.groups) == {'runs', 'wickets', 'tie'}
+    assert ((runs > 0) == (matches['result'] == 'runs')).all()
+    assert (wickets[matches['result'] == 'wickets'].between(1, 10)).all()
+    ties = matches.index[matches['result'] == 'tie']
+    assert (runs[ties] == 0).all() and (wickets[ties] == 0).all()
+    assert (totals.loc[ties, 1] == totals.loc[ties, 2]).all()
+    # A super over decides the tie
+    tied = matches.loc[ties]
+    assert ((tied['winner'] == tied['team1']) | (tied['winner'] == tied['team2'])).all()
+
+    write_mock_csvs(data, tmp_path)
+    csv = pd.read_csv(tmp_path / 'matches.csv')
+    assert csv.loc[csv['result'] == 'tie', 'result_margin'].isna().all()
+    assert csv.loc[csv['result'] != 'tie', 'result_margin'].gt(0).all()
@@ -0,0 +1,53 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from ipl_dashboard.profiling import RerunProfiler
+
+
+def test_interrupted_run_stops_cprofile(tmp_path):
+    profiler = RerunProfiler(mode='cprofile', log_path=tmp_path / 'profile.jsonl')
+    assert sys.getprofile() is profiler._profile
+
+    # As around the page in the script: st.rerun raises out of render_page
+    with pytest.raises(RuntimeError):
+        try:
+            with profiler.section('page'):
+                raise RuntimeError('rerun')
+        finally:
+            profiler.stop()
+    assert sys.getprofile() is None
+    assert not profiler.finished
+
+
+def test_finish_after_stop_keeps_the_profile(tmp_path):
+    profiler = RerunProfiler(mode='cprofile', log_path=tmp_path / 'profile.jsonl')
+    sorted(range(1000))
+    profiler.stop()
+    record = profiler.finish(page='test')
+    assert sys.getprofile() is None
+    assert record['profile']
+
+
+def test_failed_load_stops_cprofile(tmp_path, monkeypatch):
+    # The dashboard under IPL_PROFILE=cprofile, failing in its load section
+    # (before the page) on a missing database
+    from streamlit.testing.v1 import AppTest
+
+    monkeypatch.setenv('IPL_BACKEND', 'sqlite')
+    monkeypatch.setenv('IPL_DB_PATH', str(tmp_path / 'missing.sqlite'))
+    monkeypatch.setattr(RerunProfiler.__init__, '__defaults__', ('cprofile', str(tmp_path / 'profile.jsonl')))
+    stopped = []
+    stop = RerunProfiler.stop
+
+    def recording_stop(self):
+        # Called on the script's thread, whose profile function cProfile set
+        enabled = sys.getprofile() is self._profile
+        stop(self)
+        stopped.append((enabled, sys.getprofile()))
+    monkeypatch.setattr(RerunProfiler, 'stop', recording_stop)
+
+    at = AppTest.from_file(str(Path(__file__).parents[1] / 'ipl-dashboard-streamlit.py'), default_timeout=60).run()
+    assert 'No SQLite database' in at.exception[0].message
+    assert stopped == [(True, None)]
@@ -0,0 +1,26 @@
+import pandas as pd
+
+from ipl_dashboard.mock_data import generate_mock_data, write_mock_csvs
+from ipl_dashboard.partition_index import DashboardIndex
+from ipl_dashboard.season_store import SeasonStore
+
+
+def test_partial_season_has_no_champion(tmp_path):
+    # 2008 is stored whole; 2009 is ingested up to its third match
+    data = generate_mock_data(with_deliveries=True, num_seasons=2, matches_per_season=6)
+    write_mock_csvs(data, tmp_path / 'full')
+    matches = pd.read_csv(tmp_path / 'full' / 'matches.csv')
+    season = pd.to_datetime(matches['date']).dt.year
+    matches[season == 2008].to_csv(tmp_path / 'matches.csv', index=False)
+    (tmp_path / 'deliveries.csv').write_bytes((tmp_path / 'full' / 'deliveries.csv').read_bytes())
+    matches[season == 2009].head(3).to_csv(tmp_path / 'new_matches.csv', index=False)
+
+    store = SeasonStore(tmp_path)
+    store.init(tmp_path)
+    assert store.append(tmp_path / 'new_matches.csv', tmp_path / 'deliveries.csv') == 3
+
+    matches_df, players_df, team_perf_df = store.frames()
+    final = data['matches'][(data['matches']['season'] == 2008) & (data['matches']['match_type'] == 'Final')]
+    champions = DashboardIndex(matches_df, players_df, team_perf_df).champions
+    assert champions == {2008: final['winner_code'].item()}
+    assert not team_perf_df.loc[team_perf_df['season'] == 2009, 'title_winner'].any()
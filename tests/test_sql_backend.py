@@ -0,0 +1,83 @@
+import pytest
+
+import streamlit as st
+
+from ipl_dashboard import data_loader, mock_data, sql_backend
+
+from ipl_dashboard.data_loader import load_frames
+from ipl_dashboard.figure_cache import FigureCache
+from ipl_dashboard.partition_index import DashboardIndex
+from ipl_dashboard.sql_backend import SqlDashboardIndex, SqlFrameIndex, build_database
+from ipl_dashboard.static_export import ExportContext, capture_streamlit, quiet_bare_mode
+from ipl_dashboard.teams import BANNED_TEAMS
+from ipl_dashboard.views import filter_state, render_page
+
+
+def test_career_leaders_match_the_memory_index(tmp_path):
+    # No CSVs under tmp_path, so both indexes are built from the mock data
+    path = tmp_path / 'ipl.sqlite'
+    build_database(str(path), str(tmp_path))
+    sql = SqlDashboardIndex(str(path))
+    memory = DashboardIndex(*load_frames(str(tmp_path))[:3])
+
+    for column, ascending, qualifier in [('runs', False, None), ('avg', False, ('balls_faced', 120)),
+                                         ('economy', True, ('balls_bowled', 120))]:
+        expected = memory.career_leaders(column, 25, ascending=ascending, qualifier=qualifier)
+        leaders = sql.career_leaders(column, 25, ascending=ascending, qualifier=qualifier)
+        assert leaders['player_name'].tolist() == expected['player_name'].tolist(), column
+    assert sql.career_names() == memory.career_names()
+    assert sql.title_winners()[['season', 'team']].values.tolist() == \
+        memory.title_winners()[['season', 'team']].values.tolist()
+
+
+def test_missing_database(tmp_path):
+    with pytest.raises(FileNotFoundError, match='sql_backend build'):
+        SqlDashboardIndex(str(tmp_path / 'ipl.sqlite'))
+
+
+def test_cached_all_seasons_scatter_reads_no_history(tmp_path, monkeypatch):
+    path = tmp_path / 'ipl.sqlite'
+    build_database(str(path), str(tmp_path))
+    data_index = SqlDashboardIndex(str(path))
+    figure_cache = FigureCache(100)
+    quiet_bare_mode()
+    # "Plot all seasons" ticked
+    monkeypatch.setattr(st, 'checkbox', lambda *args, **kwargs: True)
+    reads = []
+    where = SqlFrameIndex._where
+    monkeypatch.setattr(SqlFrameIndex, '_where', lambda self, condition='', params=():
+                        reads.append((self.table, condition)) or where(self, condition, params))
+
+    def rerun():
+        reads.clear()
+        state = filter_state(data_index, 2008, "All Teams", BANNED_TEAMS)
+        ctx = ExportContext(figure_cache, analysis_type="Player Stats", selected_year=2008,
+                            selected_team="All Teams", data_index=data_index, **state)
+        with capture_streamlit(ctx):
+            render_page("Player Stats", ctx)
+        return [condition for table, condition in reads if table == 'players' and 'season' not in condition]
+
+    assert rerun() == ['']
+    assert rerun() == []
+
+
+def test_mock_data_is_generated_once(tmp_path, monkeypatch):
+    calls = []
+    generate = mock_data.generate_mock_data
+
+    def counting_generate(*args, **kwargs):
+        calls.append(kwargs)
+        return generate(*args, **kwargs)
+    monkeypatch.setattr(sql_backend, 'generate_mock_data', counting_generate)
+    monkeypatch.setattr(data_loader, 'generate_mock_frames', lambda *args, **kwargs: calls.append(kwargs))
+
+    path = tmp_path / 'ipl.sqlite'
+    build_database(str(path), str(tmp_path))
+    assert len(calls) == 1
+
+    # The deliveries are those of the matches in the database
+    sql = SqlDashboardIndex(str(path))
+    matches = sql.matches.frame.set_index('id')
+    for match_id in matches.index[:5]:
+        first_innings = sql.deliveries(match_id).query('inning == 1')['total_runs'].sum()
+        assert first_innings + 1 == matches.loc[match_id, 'target_runs']
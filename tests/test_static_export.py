@@ -0,0 +1,12 @@
+from ipl_dashboard.static_export import export_site
+
+
+def test_banned_notice_and_captions(tmp_path):
+    # No CSVs under the data dir, so the mock data is exported
+    export_site(str(tmp_path / 'site'), data_dir=str(tmp_path), seasons=[2016])
+    view = tmp_path / 'site' / '2016' / 'chennai-super-kings'
+
+    assert (view / 'team-analysis.html').read_text().count('class="banned-notice"') == 1
+    assert (view / 'season-overview.html').read_text().count('class="banned-notice"') == 1
+    players = (tmp_path / 'site' / '2016' / 'all-teams' / 'player-stats.html').read_text()
+    assert '<p class="caption">Players 1-' in players